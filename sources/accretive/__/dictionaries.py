@@ -50,8 +50,16 @@ class AccretiveDictionary(
         *iterables: _nomina.DictionaryPositionalArgument[ _H, _V ],
         **entries: _nomina.DictionaryNominativeArgument[ _V ],
     ):
-        super( ).__init__( )
-        self.update( *iterables, **entries )
+        # Keys of single mapping or of nominative entries are unique.
+        # Reinitialization must not overwrite entries, so it is checked.
+        if self: self.update( *iterables, **entries )
+        elif not iterables: super( ).__init__( **entries )
+        elif not entries and len( iterables ) == 1 and isinstance(
+            iterables[ 0 ], __.cabc.Mapping
+        ): super( ).__init__( iterables[ 0 ] )
+        else:
+            super( ).__init__( )
+            self.update( *iterables, **entries )
 
     def __delitem__( self, key: _H ) -> None:
         from .exceptions import EntryImmutability
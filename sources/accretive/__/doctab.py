@@ -84,9 +84,32 @@ fragments: __.cabc.Mapping[ str, str ] = __.types.MappingProxyType( {
 
     'dictionary entries accrete': ''' Accretes dictionary entries. ''',
 
+    'dictionary entries buffer':
+    ''' Deserializes entries from buffer on lookup, without copying buffer.
+    ''',
+
+    'dictionary entries journal':
+    ''' Records accreted entries in journal. ''',
+
     'dictionary entries produce':
     ''' Produces default entries on attempt to access absent ones. ''',
 
+    'dictionary entries segment':
+    ''' Spreads entries over segments, which split one at a time on growth.
+    ''',
+
+    'dictionary entries share':
+    ''' Shares accreted entries with other processes via shared memory. ''',
+
+    'dictionary entries sort':
+    ''' Orders dictionary entries by key. ''',
+
+    'dictionary entries tier':
+    ''' Demotes cold entries to disk and promotes them again on access. ''',
+
+    'dictionary entries trie':
+    ''' Stores keys as trie of segments, for enumeration by prefix. ''',
+
     'dictionary entries validate':
     ''' Validates dictionary entries on initialization. ''',
 
@@ -24,10 +24,19 @@
 
 
 import                          abc
+import                          bisect
 import collections.abc as       cabc
 import dataclasses as           dcls
 import functools as             funct
+import                          hashlib
+import                          os
+import                          pathlib
+import                          pickle
+import                          struct
+import                          sys
+import                          threading
 import                          types
+import                          zlib
 
 import classcore.exceptions as  ccexc
 import classcore.standard as    ccstd
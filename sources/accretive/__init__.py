@@ -29,6 +29,13 @@
 
 from . import __
 from . import exceptions
+from . import forks
+from . import journals
+from . import replicas
+from . import services
+from . import shared
+from . import tiers
+from . import validators
 # --- BEGIN: Injected by Copier ---
 # --- END: Injected by Copier ---
 
@@ -40,11 +40,61 @@
 
     * :py:class:`ValidatorDictionary`:
       Validates entries before addition using a supplied predicate function.
+      :py:meth:`ValidatorDictionary.for_types` validates types of keys and
+      values against type annotations.
 
     * :py:class:`ProducerValidatorDictionary`:
       Combines producer and validator behaviors. Generated values must pass
       validation before being added.
 
+    * :py:class:`SortedDictionary`:
+      Keeps entries in order of keys and supports range queries, such as
+      :py:meth:`SortedDictionary.floor` and :py:meth:`SortedDictionary.irange`.
+
+    * :py:class:`TrieDictionary`:
+      Stores hierarchical string keys, such as dotted paths, as trie of
+      segments. Enumerates entries under prefixes and provides read-only
+      views of subtrees.
+
+    * :py:class:`SegmentedDictionary`:
+      Grows by splitting bounded segments one at a time, rather than by
+      rehashing all entries at once. Suitable where latency of accretions
+      matters.
+
+    * :py:class:`LightDictionary`:
+      Accretive subclass of :py:class:`dict` with minimal overhead, for
+      programs which create many small dictionaries.
+
+    * :py:class:`OverlayDictionary`:
+      Layers accretive dictionaries, with earlier layers taking precedence,
+      like :py:class:`collections.ChainMap`. Lookups cost same regardless of
+      number of layers.
+
+    * :py:class:`DictionaryItemsRange`:
+      Read-only view of dictionary entries in range of positions. Provided
+      by :py:meth:`Dictionary.items_range` and
+      :py:meth:`Dictionary.partition`.
+
+    * :py:class:`DictionaryFilteredView` and
+      :py:class:`DictionaryMappedView`:
+      Lazy read-only views, which memoize per-entry results and consider
+      only new entries as dictionaries grow. Provided by
+      :py:meth:`Dictionary.filtered` and :py:meth:`Dictionary.mapped`.
+
+    * :py:class:`DictionaryRestrictedView`:
+      Lazy read-only view of dictionary entries for collection of keys,
+      which costs size of collection rather than of dictionary. Provided by
+      :py:meth:`Dictionary.restricted`.
+
+    * :py:class:`DictionaryIndex`:
+      Secondary index from attributes of values to keys of entries. Added to
+      dictionaries with :py:meth:`Dictionary.add_index` and maintained on
+      each accretion.
+
+    Built-in folds for :py:meth:`Dictionary.add_aggregate` include
+    :py:func:`fold_count`, :py:func:`fold_sum`, :py:func:`fold_minimum`,
+    :py:func:`fold_maximum`, and :py:func:`fold_groups`.
+
     >>> from accretive import Dictionary
     >>> d = Dictionary( apples = 12, bananas = 6 )
     >>> d[ 'cherries' ] = 42  # Add new entry
@@ -74,6 +124,17 @@
     Traceback (most recent call last):
         ...
     accretive.exceptions.EntryInvalidity: Could not add invalid entry with key, 'invalid', and value, 'str', to dictionary.
+
+    Dictionaries can be sealed against further accretion. Sealed dictionaries
+    are hashable and can serve as cache keys.
+
+    >>> d = Dictionary( apples = 12 ).seal( )
+    >>> d[ 'bananas' ] = 6
+    Traceback (most recent call last):
+        ...
+    accretive.exceptions.OperationInvalidity: Could not perform operation 'accrete'. Reason: Dictionary is sealed.
+    >>> hash( d ) == hash( Dictionary( apples = 12 ).seal( ) )
+    True
 ''' # noqa: E501
 
 
@@ -81,6 +142,45 @@ from . import __
 from . import classes as _classes
 
 
+ColumnArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.cabc.Sequence[ __.typx.Any ],
+    __.ddoc.Doc(
+        ''' Column of keys or values for bulk accretion.
+
+            Lists, tuples, and NumPy arrays are accepted. Elements of NumPy
+            arrays are converted to equivalent Python objects.
+        ''' ),
+]
+FoldArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.cabc.Callable[ [ __.typx.Any, __.H, __.V ], __.typx.Any ],
+    __.ddoc.Doc(
+        ''' Fold of entry into aggregate.
+
+            Takes aggregate, key, and value. Returns new aggregate.
+        ''' ),
+]
+
+
+KeysArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.cabc.Iterable[ __.H ],
+    __.ddoc.Doc(
+        ''' Keys for batch lookup.
+
+            Lists, tuples, and NumPy arrays are accepted without copying
+            into intermediate sequences.
+        ''' ),
+]
+ObserverArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.cabc.Callable[ [ __.cabc.Mapping[ __.H, __.V ] ], None ],
+    __.ddoc.Doc( ''' Observer of batches of accreted entries. ''' ),
+]
+
+
+_digest_mask = ( 1 << 64 ) - 1
+_stable_header = __.struct.Struct( '<cQ' )
+_segment_load = 512
+
+
 class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
     ''' Abstract base class for dictionaries that can grow but not shrink.
 
@@ -92,6 +192,9 @@ class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
         - __getitem__, __iter__, __len__
         - _pre_setitem_ for entry validation/preparation
         - _store_item_ for storage implementation
+
+        Implementations may also provide:
+        - _store_items_ for batch storage implementation
     '''
 
     @__.abc.abstractmethod
@@ -120,6 +223,15 @@ class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
         ''' Stores entry in underlying storage. '''
         raise NotImplementedError # pragma: no coverage
 
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        ''' Stores batch of new entries in underlying storage.
+
+            Entries have already been prepared and checked against existing
+            entries. Implementations may store them more efficiently than
+            one at a time.
+        '''
+        for key, value in items.items( ): self._store_item_( key, value )
+
     def __setitem__( self, key: __.H, value: __.V ) -> None:
         key, value = self._pre_setitem_( key, value )
         if key in self:
@@ -145,7 +257,7 @@ class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
     ) -> __.typx.Self:
         ''' Adds new entries as a batch. Returns self. '''
         from itertools import chain
-        updates: list[ tuple[ __.H, __.V ] ] = [ ]
+        updates: dict[ __.H, __.V ] = { }
         for indicator, value in chain.from_iterable( map( # pyright: ignore
             lambda element: ( # pyright: ignore
                 element.items( )
@@ -156,11 +268,11 @@ class AbstractDictionary( __.cabc.Mapping[ __.H, __.V ] ):
         ) ):
             indicator_, value_ = (
                 self._pre_setitem_( indicator, value ) ) # pyright: ignore
-            if indicator_ in self:
+            if indicator_ in self or indicator_ in updates:
                 from .exceptions import EntryImmutability
                 raise EntryImmutability( indicator_ )
-            updates.append( ( indicator_, value_ ) )
-        for indicator, value in updates: self._store_item_( indicator, value )
+            updates[ indicator_ ] = value_
+        if updates: self._store_items_( updates )
         return self
 
 
@@ -174,35 +286,45 @@ class _DictionaryOperations( AbstractDictionary[ __.H, __.V ] ):
 
     def __or__( self, other: __.cabc.Mapping[ __.H, __.V ] ) -> __.typx.Self:
         if not isinstance( other, __.cabc.Mapping ): return NotImplemented
-        conflicts = set( self.keys( ) ) & set( other.keys( ) )
-        if conflicts:
-            from .exceptions import EntryImmutability
-            raise EntryImmutability( next( iter( conflicts ) ) )
-        data = dict( self )
-        data.update( other )
-        return self.with_data( data )
+        _raise_on_conflict( self, other )
+        return self.copy( ).update( other )
 
     def __ror__( self, other: __.cabc.Mapping[ __.H, __.V ] ) -> __.typx.Self:
         if not isinstance( other, __.cabc.Mapping ): return NotImplemented
-        conflicts = set( other.keys( ) ) & set( self.keys( ) )
-        if conflicts:
-            from .exceptions import EntryImmutability
-            raise EntryImmutability( next( iter( conflicts ) ) )
-        data = dict( other )
-        data.update( self )
-        return self.with_data( data )
+        _raise_on_conflict( other, self )
+        return self.with_data( other ).update( self )
+
+    def __ior__( # pyright: ignore
+        self, other: __.cabc.Mapping[ __.H, __.V ]
+    ) -> __.typx.Self:
+        if not isinstance( other, __.cabc.Mapping ): return NotImplemented
+        _raise_on_conflict( self, other )
+        return self.update( other )
 
     def __and__(
         self,
         other: __.cabc.Set[ __.H ] | __.cabc.Mapping[ __.H, __.V ]
     ) -> __.typx.Self:
+        ''' Intersects entries, in order of dictionary.
+
+            Matches are found through smaller operand. Restoring order of
+            dictionary scans its keys up to last match, unless dictionary
+            is sorted. So, intersection with few entries still costs up to
+            size of dictionary, though much less than comparison of every
+            entry.
+        '''
         if isinstance( other, __.cabc.Mapping ):
+            if len( other ) < len( self ):
+                # Match through smaller operand. Then restore order of self.
+                return self.with_data( _order_like( self, { # pyright: ignore
+                    key: value for key, value in other.items( )
+                    if key in self and self[ key ] == value } ) )
             return self.with_data( # pyright: ignore
                 ( key, value ) for key, value in self.items( )
                 if key in other and other[ key ] == value )
         if isinstance( other, ( __.cabc.Set, __.cabc.KeysView ) ):
-            return self.with_data( # pyright: ignore
-                ( key, self[ key ] ) for key in self.keys( ) & other )
+            return self.with_data( _order_like( self, { # pyright: ignore
+                key: self[ key ] for key in self.keys( ) & other } ) )
         return NotImplemented
 
     def __rand__(
@@ -229,17 +351,305 @@ class _DictionaryOperations( AbstractDictionary[ __.H, __.V ] ):
         raise NotImplementedError # pragma: no coverage
 
 
+class DictionaryIndex(
+    __.cabc.Mapping[ __.H, tuple[ __.V, ... ] ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Secondary index from attributes of values to keys of entries.
+
+        Keys are listed in order of accretion. Lists of keys are cached
+        as tuples until attributes accrete more keys.
+    '''
+
+    __slots__ = ( '_attributor_', '_postings_', '_snapshots_' )
+
+    _attributor_: __.cabc.Callable[ [ __.typx.Any ], __.H ]
+    _postings_: dict[ __.H, list[ __.V ] ]
+    _snapshots_: dict[ __.H, tuple[ __.V, ... ] ]
+
+    def __init__(
+        self, attributor: __.cabc.Callable[ [ __.typx.Any ], __.H ]
+    ) -> None:
+        self._attributor_ = attributor
+        self._postings_ = { }
+        self._snapshots_ = { }
+        super( ).__init__( )
+
+    def __getitem__( self, attribute: __.H ) -> tuple[ __.V, ... ]:
+        snapshots = self._snapshots_
+        try: return snapshots[ attribute ]
+        except KeyError: pass
+        snapshot = tuple( self._postings_[ attribute ] )
+        snapshots[ attribute ] = snapshot
+        return snapshot
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._postings_ )
+
+    def __len__( self ) -> int:
+        return len( self._postings_ )
+
+    def _calculate_postings_(
+        self, items: __.cabc.Mapping[ __.V, __.typx.Any ]
+    ) -> dict[ __.H, list[ __.V ] ]:
+        ''' Groups keys of entries by attribute. '''
+        attributor = self._attributor_
+        postings: dict[ __.H, list[ __.V ] ] = { }
+        for key, value in items.items( ):
+            attribute = attributor( value )
+            if attribute in postings: postings[ attribute ].append( key )
+            else: postings[ attribute ] = [ key ]
+        return postings
+
+    def _record_postings_(
+        self, postings: dict[ __.H, list[ __.V ] ]
+    ) -> None:
+        entries = self._postings_
+        snapshots = self._snapshots_
+        for attribute, keys in postings.items( ):
+            snapshots.pop( attribute, None )
+            if attribute in entries: entries[ attribute ].extend( keys )
+            else: entries[ attribute ] = keys
+
+
+class DictionaryItemsRange(
+    __.cabc.Sequence[ tuple[ __.H, __.V ] ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Read-only view of dictionary entries in range of positions. '''
+
+    __slots__ = ( '_dictionary_', '_range_' )
+
+    _dictionary_: 'Dictionary[ __.H, __.V ]'
+    _range_: range
+
+    def __init__(
+        self, dictionary: 'Dictionary[ __.H, __.V ]', range_: range
+    ) -> None:
+        self._dictionary_ = dictionary
+        self._range_ = range_
+        super( ).__init__( )
+
+    def __getitem__(
+        self, position: int | slice
+    ) -> tuple[ __.H, __.V ] | __.typx.Self:
+        if isinstance( position, slice ):
+            return type( self )( self._dictionary_, self._range_[ position ] )
+        return self._dictionary_.item_at( self._range_[ position ] )
+
+    def __iter__( self ) -> __.cabc.Iterator[ tuple[ __.H, __.V ] ]:
+        item_at = self._dictionary_.item_at
+        for position in self._range_: yield item_at( position )
+
+    def __len__( self ) -> int:
+        return len( self._range_ )
+
+    def __reduce__( self ) -> tuple[ __.typx.Any, ... ]:
+        # Pickle only entries in range rather than whole dictionary.
+        return tuple, ( tuple( self ), )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {start}, {stop}, {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            start = self._range_.start,
+            stop = self._range_.stop,
+            contents = list( self ) )
+
+    @property
+    def range( self ) -> range:
+        ''' Range of positions covered by view. '''
+        return self._range_
+
+
+class DictionaryFilteredView(
+    __.cabc.Mapping[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+    instances_mutables = ( '_surveyed_', ),
+):
+    ''' Lazy read-only view of dictionary entries which satisfy predicate.
+
+        Verdicts of predicate are memoized per entry. Iteration and
+        measurement consider only entries accreted since last survey.
+        Entries are iterated in order of accretion.
+    '''
+
+    __slots__ = (
+        '_dictionary_', '_keys_', '_predicate_', '_surveyed_', '_verdicts_' )
+
+    _dictionary_: 'Dictionary[ __.H, __.V ]'
+    _keys_: list[ __.H ]
+    _predicate_: __.cabc.Callable[ [ __.H, __.V ], bool ]
+    _surveyed_: int
+    _verdicts_: dict[ __.H, bool ]
+
+    def __init__(
+        self,
+        dictionary: 'Dictionary[ __.H, __.V ]',
+        predicate: __.cabc.Callable[ [ __.H, __.V ], bool ],
+    ) -> None:
+        self._dictionary_ = dictionary
+        self._keys_ = [ ]
+        self._predicate_ = predicate
+        self._surveyed_ = 0
+        self._verdicts_ = { }
+        super( ).__init__( )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        data = self._dictionary_._data_
+        return key in data and self._judge_( key, data[ key ] )
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        value = self._dictionary_._data_[ key ]
+        if not self._judge_( key, value ): raise KeyError( key )
+        return value
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._survey_( ) )
+
+    def __len__( self ) -> int:
+        return len( self._survey_( ) )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( dict( self.items( ) ) ) )
+
+    def _judge_( self, key: __.H, value: __.V ) -> bool:
+        verdicts = self._verdicts_
+        try: return verdicts[ key ]
+        except KeyError: pass
+        verdict = verdicts[ key ] = bool( self._predicate_( key, value ) )
+        return verdict
+
+    def _survey_( self ) -> list[ __.H ]:
+        ''' Judges entries accreted since last survey. Returns keys. '''
+        keys = self._keys_
+        dictionary = self._dictionary_
+        surveyed = self._surveyed_
+        if surveyed == len( dictionary ): return keys
+        judge = self._judge_
+        for key, value in dictionary._survey_accretions_( surveyed ):
+            if judge( key, value ): keys.append( key )
+            surveyed += 1
+        self._surveyed_ = surveyed
+        return keys
+
+
+class DictionaryRestrictedView(
+    __.cabc.Mapping[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Lazy read-only view of dictionary entries with keys in collection.
+
+        Only keys of collection are examined, never other entries of
+        dictionary. Entries are iterated in order of keys in collection.
+    '''
+
+    __slots__ = ( '_dictionary_', '_keys_' )
+
+    _dictionary_: 'Dictionary[ __.H, __.V ]'
+    _keys_: dict[ __.H, None ]
+
+    def __init__(
+        self,
+        dictionary: 'Dictionary[ __.H, __.V ]',
+        keys: __.cabc.Iterable[ __.H ],
+    ) -> None:
+        self._dictionary_ = dictionary
+        self._keys_ = dict.fromkeys( keys )
+        super( ).__init__( )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        return key in self._keys_ and key in self._dictionary_._data_
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        if key not in self._keys_: raise KeyError( key )
+        return self._dictionary_._data_[ key ]
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return filter( self._dictionary_._data_.__contains__, self._keys_ )
+
+    def __len__( self ) -> int:
+        return sum( map( self._dictionary_._data_.__contains__, self._keys_ ) )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( dict( self.items( ) ) ) )
+
+
+class DictionaryMappedView(
+    __.cabc.Mapping[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Lazy read-only view of dictionary entries with mapped values.
+
+        Mapped values are computed on first access and memoized per entry.
+    '''
+
+    __slots__ = ( '_dictionary_', '_function_', '_values_' )
+
+    _dictionary_: 'Dictionary[ __.H, __.typx.Any ]'
+    _function_: __.cabc.Callable[ [ __.typx.Any ], __.V ]
+    _values_: dict[ __.H, __.V ]
+
+    def __init__(
+        self,
+        dictionary: 'Dictionary[ __.H, __.typx.Any ]',
+        function: __.cabc.Callable[ [ __.typx.Any ], __.V ],
+    ) -> None:
+        self._dictionary_ = dictionary
+        self._function_ = function
+        self._values_ = { }
+        super( ).__init__( )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        return key in self._dictionary_._data_
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        values = self._values_
+        try: return values[ key ]
+        except KeyError: pass
+        value = self._function_( self._dictionary_._data_[ key ] )
+        values[ key ] = value
+        return value
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._dictionary_ )
+
+    def __len__( self ) -> int:
+        return len( self._dictionary_ )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( dict( self.items( ) ) ) )
+
+
 class Dictionary(
     _DictionaryOperations[ __.H, __.V ],
     metaclass = _classes.AbstractBaseClass,
     class_mutables = _classes.abc_class_mutables,
+    instances_mutables = ( '_derivations_', '_hash_', '_sealed_' ),
 ):
-    ''' Accretive dictionary. '''
+    ''' Accretive dictionary.
+
+        Can be sealed against further accretion. Sealed dictionaries are
+        hashable.
+    '''
 
-    __slots__ = ( '_data_', )
+    __slots__ = ( '_data_', '_derivations_', '_hash_', '_sealed_' )
 
     _data_: __.AccretiveDictionary[ __.H, __.V ]
+    _derivations_: '_DictionaryDerivations | None'
     _dynadoc_fragments_ = ( 'dictionary entries accrete', )
+    _hash_: int | None
+    _sealed_: bool
 
     def __init__(
         self,
@@ -247,9 +657,67 @@ class Dictionary(
         **entries: __.DictionaryNominativeArgument[ __.V ],
     ) -> None:
         self._data_ = __.AccretiveDictionary( *iterables, **entries )
+        self._derivations_ = None
+        self._hash_ = None
+        self._sealed_ = False
         super( ).__init__( )
 
-    __hash__ = None
+    @classmethod
+    def merge_all(
+        cls,
+        mappings: __.cabc.Iterable[ __.cabc.Mapping[ __.H, __.V ] ],
+        /,
+        *arguments: __.typx.Any,
+        allow_equal_duplicates: bool = False,
+    ) -> __.typx.Self:
+        ''' Merges many mappings into new dictionary, in single pass.
+
+            Raises exception for any key which occurs in more than one
+            mapping, unless duplicates are allowed to have equal values.
+            Cost is linear in total number of entries, unlike chained
+            unions, which each copy entries of preceding unions. Other
+            positional arguments, such as producers or validators, are
+            passed to constructor of dictionary.
+        '''
+        merger: dict[ __.H, __.V ] = { }
+        for mapping in mappings:
+            keys = mapping.keys( )
+            # Views of dicts intersect without intermediate sets.
+            if merger.keys( ).isdisjoint( keys ):
+                merger.update( mapping )
+                continue
+            for key, value in mapping.items( ):
+                if key in merger:
+                    if allow_equal_duplicates and merger[ key ] == value:
+                        continue
+                    from .exceptions import EntryImmutability
+                    raise EntryImmutability( key )
+                merger[ key ] = value
+        return cls( *arguments, merger )
+
+    @classmethod
+    def from_columns(
+        cls,
+        keys: ColumnArgument,
+        values: ColumnArgument,
+        /,
+        *arguments: __.typx.Any,
+        **nomargs: __.typx.Any,
+    ) -> __.typx.Self:
+        ''' Creates dictionary from parallel columns of keys and values.
+
+            Other arguments, such as producers or validators, are passed
+            to constructor of dictionary.
+        '''
+        return cls( *arguments, **nomargs ).update_columns( keys, values )
+
+    def __hash__( self ) -> int:
+        if self._hash_ is not None: return self._hash_
+        if not self._sealed_:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity( 'hash', 'Dictionary is not sealed.' )
+        self._hash_ = hash( frozenset( self._data_.items( ) ) )
+        return self._hash_
 
     def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
         return iter( self._data_ )
@@ -272,19 +740,55 @@ class Dictionary(
         return self._data_[ key ]
 
     def __eq__( self, other: __.typx.Any ) -> __.ComparisonResult:
+        if isinstance( other, Dictionary ):
+            if len( self._data_ ) != len( other._data_ ): return False
+            digests = _peek_digest( self ), _peek_digest( other )
+            if None not in digests and digests[ 0 ] != digests[ 1 ]:
+                return False
+            return self._data_ == other._data_
         if isinstance( other, __.cabc.Mapping ):
             return self._data_ == other
         return NotImplemented
 
     def __ne__( self, other: __.typx.Any ) -> __.ComparisonResult:
-        if isinstance( other, __.cabc.Mapping ):
-            return self._data_ != other
-        return NotImplemented
+        result = self.__eq__( other )
+        if result is NotImplemented: return result
+        return not result
+
+    def contains_many( self, keys: KeysArgument[ __.H ] ) -> __.typx.Any:
+        ''' Tests presence of each key, in single pass over storage.
+
+            Returns list of booleans or, for NumPy array of keys, NumPy
+            array of booleans.
+        '''
+        keys_, numpy = _normalize_keys( keys )
+        results = list( map( self._data_.__contains__, keys_ ) )
+        if numpy is None: return results
+        return numpy.array( results, dtype = bool )
 
     def copy( self ) -> __.typx.Self:
         ''' Provides fresh copy of dictionary. '''
         return type( self )( self )
 
+    def get_many(
+        self, keys: KeysArgument[ __.H ], default: __.typx.Any = None
+    ) -> __.typx.Any:
+        ''' Retrieves values for keys, in single pass over storage.
+
+            Absent entries are produced in one batch, if dictionary has
+            producer and is not sealed. Else, default is substituted for
+            them. Returns list
+            or, for NumPy array of keys, NumPy array of objects.
+        '''
+        from itertools import repeat
+        keys_, numpy = _normalize_keys( keys )
+        self._produce_many_( keys_ )
+        values = list( map( self._data_.get, keys_, repeat( default ) ) )
+        if numpy is None: return values
+        array = numpy.empty( len( values ), dtype = object )
+        array[ : ] = values
+        return array
+
     def get( # pyright: ignore
         self, key: __.H, default: __.Absential[ __.V ] = __.absent
     ) -> __.typx.Annotated[
@@ -310,6 +814,219 @@ class Dictionary(
         ''' Provides iterable view over dictionary values. '''
         return self._data_.values( )
 
+    @property
+    def digest( self ) -> int:
+        ''' Order-independent digest of entries.
+
+            Computed on first access and maintained on each accretion
+            thereafter. Equal dictionaries have equal digests. Strings,
+            bytes, numbers, ``None``, and tuples thereof are hashed
+            independently of hash seed, so that digests of entries of these
+            types are comparable across processes, however started. Other
+            objects are hashed by builtin hash. Requires hashable values.
+        '''
+        derivations = self._provide_derivations_( )
+        if derivations.digest is None:
+            derivations.digest = _accumulate_digest( 0, self._data_.items( ) )
+        return derivations.digest
+
+    @property
+    def sealed( self ) -> bool:
+        ''' Is dictionary sealed against further accretion? '''
+        return self._sealed_
+
+    def add_index(
+        self, name: str, key: __.cabc.Callable[ [ __.V ], __.typx.Any ]
+    ) -> 'DictionaryIndex[ __.typx.Any, __.H ]':
+        ''' Adds secondary index over values.
+
+            Function derives hashable attribute from each value. Index maps
+            each attribute to keys of entries with that attribute and is
+            maintained on each accretion. Copies do not inherit indexes.
+        '''
+        derivations = self._provide_derivations_( )
+        indexes = derivations.indexes or { }
+        if name in indexes:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'add_index', f"Index {name!r} already exists." )
+        index = DictionaryIndex[ __.typx.Any, __.H ]( key )
+        index._record_postings_( index._calculate_postings_( self._data_ ) )
+        derivations.indexes = { **indexes, name: index }
+        return index
+
+    def add_observer(
+        self, observer: ObserverArgument[ __.H, __.V ]
+    ) -> None:
+        ''' Adds observer of accretions.
+
+            Observer is called with each batch of new entries after their
+            storage. Observers are retained until removed. Copies do not
+            inherit observers.
+        '''
+        derivations = self._provide_derivations_( )
+        derivations.observers = ( *( derivations.observers or ( ) ), observer )
+
+    def remove_observer(
+        self, observer: ObserverArgument[ __.H, __.V ]
+    ) -> None:
+        ''' Removes observer of accretions, if present. '''
+        derivations = self._derivations_
+        if derivations is None: return
+        observers = tuple(
+            observer_ for observer_ in derivations.observers or ( )
+            if observer_ != observer )
+        derivations.observers = observers or None
+
+    def index( self, name: str ) -> 'DictionaryIndex[ __.typx.Any, __.H ]':
+        ''' Returns secondary index by name. '''
+        derivations = self._derivations_
+        if derivations is None or derivations.indexes is None:
+            raise KeyError( name )
+        return derivations.indexes[ name ]
+
+    def add_aggregate(
+        self,
+        name: str,
+        fold: FoldArgument[ __.H, __.V ],
+        initial: __.typx.Any,
+    ) -> None:
+        ''' Adds aggregate of entries, folded on request.
+
+            Entries are folded in order of accretion. Initial value is
+            copied, so that folds which update aggregates in place, such
+            as those from :py:func:`fold_groups`, leave it unchanged.
+            Copies do not inherit aggregates.
+        '''
+        from copy import copy
+        derivations = self._provide_derivations_( )
+        aggregates = derivations.aggregates or { }
+        if name in aggregates:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'add_aggregate', f"Aggregate {name!r} already exists." )
+        derivations.aggregates = {
+            **aggregates, name: ( fold, 0, copy( initial ) ) }
+
+    def aggregate( self, name: str ) -> __.typx.Any:
+        ''' Returns aggregate by name.
+
+            Only entries accreted since previous request are folded.
+            Results must not be mutated by callers; folds which update
+            aggregates in place update earlier results too.
+        '''
+        derivations = self._derivations_
+        if derivations is None or derivations.aggregates is None:
+            raise KeyError( name )
+        aggregates = derivations.aggregates
+        fold, covered, result = aggregates[ name ]
+        if covered == len( self._data_ ): return result
+        for key, value in self._survey_accretions_( covered ):
+            result = fold( result, key, value )
+            covered += 1
+        aggregates[ name ] = ( fold, covered, result )
+        return result
+
+    def filtered(
+        self, predicate: __.cabc.Callable[ [ __.H, __.V ], bool ]
+    ) -> 'DictionaryFilteredView[ __.H, __.V ]':
+        ''' Provides lazy view of entries which satisfy predicate.
+
+            Predicate takes key and value of entry. Its verdict on each
+            entry is memoized, since entries never change. View reflects
+            later accretions; only new entries are considered.
+        '''
+        return DictionaryFilteredView( self, predicate )
+
+    def item_at( self, position: int ) -> tuple[ __.H, __.V ]:
+        ''' Returns entry at position in order of iteration.
+
+            Negative positions count from end. Position index is built on
+            first positional access and is maintained on each accretion
+            thereafter.
+        '''
+        key = self._provide_positions_( )[ position ]
+        return key, self._data_[ key ]
+
+    def items_range(
+        self, start: int = 0, stop: int | None = None
+    ) -> 'DictionaryItemsRange[ __.H, __.V ]':
+        ''' Provides read-only view of entries in range of positions.
+
+            Bounds are resolved, as for slices, against current size.
+        '''
+        size = len( self._provide_positions_( ) )
+        return DictionaryItemsRange( self, range( size )[ start : stop ] )
+
+    def mapped(
+        self, function: __.cabc.Callable[ [ __.V ], __.typx.Any ]
+    ) -> 'DictionaryMappedView[ __.H, __.typx.Any ]':
+        ''' Provides lazy view of entries with values mapped by function.
+
+            Function is applied on first access to each entry and its
+            result is memoized, since entries never change. View reflects
+            later accretions.
+        '''
+        return DictionaryMappedView( self, function )
+
+    def partition(
+        self, count: int
+    ) -> tuple[ 'DictionaryItemsRange[ __.H, __.V ]', ... ]:
+        ''' Splits entries into contiguous views of balanced sizes.
+
+            Views do not copy entries. Pickled views carry only their own
+            entries, which suits distribution to process pools.
+        '''
+        size = len( self._provide_positions_( ) )
+        return tuple(
+            DictionaryItemsRange(
+                self, range( size * i // count, size * ( i + 1 ) // count ) )
+            for i in range( max( count, 0 ) ) )
+
+    def restricted(
+        self, keys: __.cabc.Iterable[ __.H ]
+    ) -> 'DictionaryRestrictedView[ __.H, __.V ]':
+        ''' Provides lazy view of entries with keys in collection.
+
+            Entries are iterated in order of keys in collection. Costs size
+            of collection, regardless of size of dictionary.
+        '''
+        return DictionaryRestrictedView( self, keys )
+
+    def seal( self ) -> __.typx.Self:
+        ''' Seals dictionary against further accretion.
+
+            Sealed dictionaries are hashable, if their values are, and can
+            serve as cache keys or set members.
+        '''
+        self._sealed_ = True
+        return self
+
+    def update_columns(
+        self, keys: ColumnArgument, values: ColumnArgument
+    ) -> __.typx.Self:
+        ''' Adds entries from parallel columns of keys and values, as batch.
+
+            Duplicate keys are detected from size of batch, rather than by
+            check of each key. Validators which provide ``validate_columns``
+            check whole columns at once. Returns self.
+        '''
+        keys_, _ = _normalize_keys( keys )
+        values_, _ = _normalize_keys( values )
+        if len( keys_ ) != len( values_ ):
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'update_columns', 'Columns differ in length.' )
+        if not self._validate_columns_(
+            ( keys, values ), ( keys_, values_ )
+        ): # Subclass prepares entries; respect it for each entry.
+            return self.update( zip( keys_, values_ ) )
+        batch = dict( zip( keys_, values_ ) )
+        if len( batch ) != len( keys_ ): _raise_on_duplicate( keys_ )
+        _raise_on_conflict( self, batch )
+        if batch: self._store_items_( batch )
+        return self
+
     def with_data(
         self,
         *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
@@ -318,7 +1035,85 @@ class Dictionary(
         return type( self )( *iterables, **entries )
 
     def _store_item_( self, key: __.H, value: __.V ) -> None:
-        self._data_[ key ] = value
+        if self._sealed_: _raise_sealed( )
+        # Dictionaries without derivations store entries directly.
+        if self._derivations_ is None: self._data_[ key ] = value
+        else: self._accrete_( { key: value } )
+
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        if self._sealed_: _raise_sealed( )
+        self._accrete_( items )
+
+    def _accrete_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        ''' Stores entries. Maintains derivations and notifies observers.
+
+            Derivations are calculated before storage, so that failures
+            leave dictionary unchanged.
+        '''
+        derivations = self._derivations_
+        if derivations is None:
+            # Entries are already checked; bypass per-entry checks.
+            dict.update( self._data_, items )
+            return
+        digest = derivations.digest
+        if digest is not None:
+            digest = _accumulate_digest( digest, items.items( ) )
+        postings = tuple(
+            ( index, index._calculate_postings_( items ) )
+            for index in ( derivations.indexes or { } ).values( ) )
+        dict.update( self._data_, items )
+        if digest is not None: derivations.digest = digest
+        for index, postings_ in postings: index._record_postings_( postings_ )
+        positions = derivations.positions
+        if positions is not None: positions.extend( items )
+        for observer in derivations.observers or ( ): observer( items )
+
+    def _produce_many_( self, keys: __.cabc.Sequence[ __.H ] ) -> None:
+        ''' Produces absent entries in batch. No producer by default. '''
+
+    def _provide_accretions_( self ) -> list[ __.H ]:
+        ''' Provides keys in order of accretion. Builds them on first use. '''
+        derivations = self._provide_derivations_( )
+        if derivations.positions is None:
+            derivations.positions = list( self._data_ )
+        return derivations.positions
+
+    def _provide_derivations_( self ) -> '_DictionaryDerivations':
+        ''' Provides derivations. Creates them on first use. '''
+        if self._derivations_ is None:
+            self._derivations_ = _DictionaryDerivations( )
+        return self._derivations_
+
+    def _provide_positions_( self ) -> list[ __.H ]:
+        ''' Provides keys in order of iteration. '''
+        return self._provide_accretions_( )
+
+    def _survey_accretions_(
+        self, start: int
+    ) -> __.cabc.Iterator[ tuple[ __.H, __.V ] ]:
+        ''' Iterates over entries accreted from position onward.
+
+            Entries accreted during iteration are not included.
+        '''
+        data = self._data_
+        keys = self._provide_accretions_( )
+        for position in range( start, len( keys ) ):
+            key = keys[ position ]
+            yield key, data[ key ]
+
+    def _validate_columns_(
+        self,
+        columns: tuple[ ColumnArgument, ColumnArgument ],
+        sequences: tuple[
+            __.cabc.Sequence[ __.H ], __.cabc.Sequence[ __.V ] ],
+    ) -> bool:
+        ''' Validates columns before accretion. No validator by default.
+
+            Columns are as supplied. Sequences hold their elements as
+            Python objects. Returns false, without validation, if entries
+            must be prepared one at a time instead.
+        '''
+        return type( self )._pre_setitem_ is Dictionary._pre_setitem_
 
 
 class ProducerDictionary( Dictionary[ __.H, __.V ] ):
@@ -349,6 +1144,7 @@ class ProducerDictionary( Dictionary[ __.H, __.V ] ):
 
     def __getitem__( self, key: __.H ) -> __.V:
         if key not in self:
+            if self._sealed_: raise KeyError( key )
             value = self._producer_( )
             self[ key ] = value
         else: value = super( ).__getitem__( key )
@@ -373,9 +1169,19 @@ class ProducerDictionary( Dictionary[ __.H, __.V ] ):
     ) -> __.typx.Self:
         return type( self )( self._producer_, *iterables, **entries )
 
+    def _produce_many_( self, keys: __.cabc.Sequence[ __.H ] ) -> None:
+        _produce_absences( self, self._producer_, keys )
+
 
 class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
-    ''' Accretive dictionary with validation of new entries. '''
+    ''' Accretive dictionary with validation of new entries.
+
+        Validators may provide ``validate_many``, which takes sequence of
+        key-value pairs and returns verdict for each pair or raises
+        exception for invalid pairs. Batches of entries, such as from
+        updates, are then validated in single call. Entries from
+        dictionaries with same validator are not validated again.
+    '''
 
     __slots__ = ( '_validator_', )
 
@@ -391,7 +1197,28 @@ class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
         **entries: __.DictionaryNominativeArgument[ __.V ],
     ) -> None:
         self._validator_ = validator
-        super( ).__init__( *iterables, **entries )
+        super( ).__init__( )
+        if iterables or entries: self.update( *iterables, **entries )
+
+    @classmethod
+    def for_types(
+        cls,
+        key_type: __.typx.Any,
+        value_type: __.typx.Any,
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Creates dictionary which validates types of keys and values.
+
+            Type annotations, including unions, ``Literal``, and
+            ``Annotated`` with predicates, are compiled into checks once.
+            Batches of entries are checked by distinct types of keys and
+            values, where annotations allow.
+        '''
+        from .validators import TypeValidator
+        return cls(
+            TypeValidator( key_type, value_type ), *iterables, **entries )
 
     def __repr__( self ) -> str:
         return "{fqname}( {validator}, {contents} )".format(
@@ -407,8 +1234,20 @@ class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
 
     def copy( self ) -> __.typx.Self:
         ''' Provides fresh copy of dictionary. '''
-        dictionary = type( self )( self._validator_ )
-        return dictionary.update( self )
+        return type( self )( self._validator_, self )
+
+    def update(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Adds new entries as a batch, validated together. Returns self. '''
+        preparer = type( self )._pre_setitem_
+        if preparer is not ValidatorDictionary._pre_setitem_:
+            # Subclass prepares entries; respect it for each entry.
+            return super( ).update( *iterables, **entries )
+        _update_validated( self, iterables, entries )
+        return self
 
     def with_data(
         self,
@@ -417,6 +1256,17 @@ class ValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ) -> __.typx.Self:
         return type( self )( self._validator_, *iterables, **entries )
 
+    def _validate_columns_(
+        self,
+        columns: tuple[ ColumnArgument, ColumnArgument ],
+        sequences: tuple[
+            __.cabc.Sequence[ __.H ], __.cabc.Sequence[ __.V ] ],
+    ) -> bool:
+        preparer = type( self )._pre_setitem_
+        if preparer is not ValidatorDictionary._pre_setitem_: return False
+        _validate_columns( self._validator_, columns, sequences )
+        return True
+
 
 class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ''' Accretive dictionary with defaults and validation. '''
@@ -440,7 +1290,8 @@ class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ) -> None:
         self._producer_ = producer
         self._validator_ = validator
-        super( ).__init__( *iterables, **entries )
+        super( ).__init__( )
+        if iterables or entries: self.update( *iterables, **entries )
 
     def __repr__( self ) -> str:
         return "{fqname}( {producer}, {validator}, {contents} )".format(
@@ -451,6 +1302,7 @@ class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
 
     def __getitem__( self, key: __.H ) -> __.V:
         if key not in self:
+            if self._sealed_: raise KeyError( key )
             value = self._producer_( )
             if not self._validator_( key, value ):
                 from .exceptions import EntryInvalidity
@@ -467,8 +1319,7 @@ class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
 
     def copy( self ) -> __.typx.Self:
         ''' Provides fresh copy of dictionary. '''
-        dictionary = type( self )( self._producer_, self._validator_ )
-        return dictionary.update( self )
+        return type( self )( self._producer_, self._validator_, self )
 
     def setdefault( self, key: __.H, default: __.V ) -> __.V:
         ''' Returns value for key, setting it to default if missing. '''
@@ -477,6 +1328,19 @@ class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
             return default
         return self[ key ]
 
+    def update(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Adds new entries as a batch, validated together. Returns self. '''
+        preparer = type( self )._pre_setitem_
+        if preparer is not ProducerValidatorDictionary._pre_setitem_:
+            # Subclass prepares entries; respect it for each entry.
+            return super( ).update( *iterables, **entries )
+        _update_validated( self, iterables, entries )
+        return self
+
     def with_data(
         self,
         *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
@@ -484,3 +1348,975 @@ class ProducerValidatorDictionary( Dictionary[ __.H, __.V ] ):
     ) -> __.typx.Self:
         return type( self )(
             self._producer_, self._validator_, *iterables, **entries )
+
+    def _produce_many_( self, keys: __.cabc.Sequence[ __.H ] ) -> None:
+        _produce_absences( self, self._producer_, keys )
+
+    def _validate_columns_(
+        self,
+        columns: tuple[ ColumnArgument, ColumnArgument ],
+        sequences: tuple[
+            __.cabc.Sequence[ __.H ], __.cabc.Sequence[ __.V ] ],
+    ) -> bool:
+        preparer = type( self )._pre_setitem_
+        if preparer is not ProducerValidatorDictionary._pre_setitem_:
+            return False
+        _validate_columns( self._validator_, columns, sequences )
+        return True
+
+
+class SortedDictionary( Dictionary[ __.H, __.V ] ):
+    ''' Accretive dictionary with entries in order of keys.
+
+        Supports range queries over keys. Keys must be mutually comparable.
+        Accretion of keys greater than all existing keys, which is typical
+        of time series, appends in amortized constant time.
+    '''
+
+    __slots__ = ( '_keys_', )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries sort' )
+    _keys_: list[ __.H ]
+
+    def __init__(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        self._keys_ = [ ]
+        super( ).__init__( )
+        self.update( *iterables, **entries )
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._keys_ )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( self ) )
+
+    def __str__( self ) -> str:
+        data = self._data_
+        return str( { key: data[ key ] for key in self._keys_ } )
+
+    def ceiling( self, key: __.H ) -> __.H:
+        ''' Returns least key which is greater than or equal to key. '''
+        keys = self._keys_
+        position = __.bisect.bisect_left( keys, key )
+        if position == len( keys ): raise KeyError( key )
+        return keys[ position ]
+
+    def floor( self, key: __.H ) -> __.H:
+        ''' Returns greatest key which is less than or equal to key. '''
+        keys = self._keys_
+        position = __.bisect.bisect_right( keys, key )
+        if not position: raise KeyError( key )
+        return keys[ position - 1 ]
+
+    def irange(
+        self,
+        minimum: __.Absential[ __.H ] = __.absent,
+        maximum: __.Absential[ __.H ] = __.absent, *,
+        inclusive: tuple[ bool, bool ] = ( True, True ),
+    ) -> __.cabc.Iterator[ __.H ]:
+        ''' Iterates over keys between minimum and maximum, in order.
+
+            Absent bounds are unbounded. Inclusion of each bound is
+            determined by corresponding element of ``inclusive``.
+        '''
+        keys = self._keys_
+        if __.is_absent( minimum ): start = 0
+        elif inclusive[ 0 ]: start = __.bisect.bisect_left( keys, minimum )
+        else: start = __.bisect.bisect_right( keys, minimum )
+        if __.is_absent( maximum ): stop = len( keys )
+        elif inclusive[ 1 ]: stop = __.bisect.bisect_right( keys, maximum )
+        else: stop = __.bisect.bisect_left( keys, maximum )
+        return ( keys[ i ] for i in range( start, stop ) )
+
+    def items( self ) -> __.cabc.ItemsView[ __.H, __.V ]:
+        ''' Provides iterable view over dictionary items, in key order. '''
+        return __.cabc.ItemsView( self )
+
+    def keys( self ) -> __.cabc.KeysView[ __.H ]:
+        ''' Provides iterable view over dictionary keys, in order. '''
+        return __.cabc.KeysView( self )
+
+    def values( self ) -> __.cabc.ValuesView[ __.V ]:
+        ''' Provides iterable view over dictionary values, in key order. '''
+        return __.cabc.ValuesView( self )
+
+    def _provide_positions_( self ) -> list[ __.H ]:
+        # Positions are in order of keys. Accretions may shift them.
+        return self._keys_
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        keys = self._keys_
+        if not keys or keys[ -1 ] < key:
+            super( )._store_item_( key, value )
+            keys.append( key )
+            return
+        # Position is found before storage, in case key is incomparable.
+        position = __.bisect.bisect_left( keys, key )
+        super( )._store_item_( key, value )
+        keys.insert( position, key )
+
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        if not items: return
+        keys = self._keys_
+        arrivals = sorted( items )
+        if not keys or keys[ -1 ] < arrivals[ 0 ]:
+            super( )._store_items_( items )
+            keys.extend( arrivals )
+            return
+        # Merge is sorted before storage, in case keys are incomparable.
+        merger = sorted( ( *keys, *arrivals ) )
+        super( )._store_items_( items )
+        keys[ : ] = merger
+
+
+class _DictionaryDerivations:
+    ''' Derivations of dictionary, which are maintained on accretion.
+
+        Created on first use, so that dictionaries without derivations
+        neither hold nor check them.
+    '''
+
+    __slots__ = ( 'aggregates', 'digest', 'indexes', 'observers', 'positions' )
+
+    def __init__( self ) -> None:
+        self.aggregates: dict[ str, tuple[
+            FoldArgument[ __.typx.Any, __.typx.Any ], int, __.typx.Any
+        ] ] | None = None
+        self.digest: int | None = None
+        self.indexes: (
+            dict[ str, DictionaryIndex[ __.typx.Any, __.typx.Any ] ]
+            | None ) = None
+        self.observers: tuple[
+            ObserverArgument[ __.typx.Any, __.typx.Any ], ... ] | None = None
+        self.positions: list[ __.typx.Any ] | None = None
+
+
+class _TrieNode:
+    ''' Interior node of trie.
+
+        Children are interior nodes or, for leaves, values themselves.
+    '''
+
+    __slots__ = ( 'children', 'value' )
+
+    def __init__( self, value: __.typx.Any = __.absent ) -> None:
+        self.children: dict[ str, __.typx.Any ] = { }
+        self.value = value
+
+
+class TrieDictionary(
+    _DictionaryOperations[ str, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+    instances_mutables = ( '_size_', ),
+):
+    ''' Accretive dictionary of hierarchical string keys.
+
+        Keys are split into segments by separator, such as ``.`` for dotted
+        paths, and stored as trie. Segments which are shared by keys are
+        stored once. Entries under prefix are enumerated without scanning
+        other keys. Entries are iterated depth first; siblings are in order
+        of accretion.
+    '''
+
+    __slots__ = ( '_root_', '_separator_', '_size_' )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries trie' )
+    _root_: _TrieNode
+    _separator_: str
+    _size_: int
+
+    def __init__(
+        self,
+        separator: str,
+        /,
+        *iterables: __.DictionaryPositionalArgument[ str, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        self._root_ = _TrieNode( )
+        self._separator_ = separator
+        self._size_ = 0
+        super( ).__init__( )
+        self.update( *iterables, **entries )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        value = _trie_find_value( self._root_, key, self._separator_ )
+        return value is not __.absent
+
+    def __getitem__( self, key: str ) -> __.V:
+        value = _trie_find_value( self._root_, key, self._separator_ )
+        if value is __.absent: raise KeyError( key )
+        return value
+
+    def __iter__( self ) -> __.cabc.Iterator[ str ]:
+        for key, _ in _trie_enumerate( self._root_, ( ), self._separator_ ):
+            yield key
+
+    def __len__( self ) -> int:
+        return self._size_
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {separator!r}, {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            separator = self._separator_,
+            contents = str( self ) )
+
+    def __str__( self ) -> str:
+        return str( dict( self.items( ) ) )
+
+    def copy( self ) -> __.typx.Self:
+        ''' Provides fresh copy of dictionary. '''
+        return type( self )( self._separator_, self )
+
+    def items_with_prefix(
+        self, prefix: str
+    ) -> __.cabc.Iterator[ tuple[ str, __.V ] ]:
+        ''' Iterates over entries with key at or under prefix.
+
+            Prefix matches whole segments: ``a.b`` matches ``a.b`` and
+            ``a.b.c`` but not ``a.bc``.
+        '''
+        segments = tuple( prefix.split( self._separator_ ) )
+        node = _trie_find_node( self._root_, segments[ : -1 ] )
+        if node is None: return iter( ( ) )
+        child = node.children.get( segments[ -1 ], __.absent )
+        if type( child ) is _TrieNode:
+            return _trie_enumerate(
+                child, segments, self._separator_, inclusive = True )
+        if child is __.absent: return iter( ( ) )
+        return iter( ( ( prefix, child ), ) )
+
+    def subtree( self, prefix: str ) -> 'TrieDictionaryView[ __.V ]':
+        ''' Provides read-only view of entries under prefix.
+
+            Keys in view are relative to prefix. Entry with prefix itself as
+            key is not in view. View reflects later accretions.
+        '''
+        node = _trie_find_node(
+            self._root_, prefix.split( self._separator_ ) )
+        if node is None: raise KeyError( prefix )
+        return TrieDictionaryView( node, self._separator_ )
+
+    def with_data(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ str, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        return type( self )( self._separator_, *iterables, **entries )
+
+    def _pre_setitem_( self, key: str, value: __.V ) -> tuple[ str, __.V ]:
+        if not isinstance( key, str ):
+            from .exceptions import EntryInvalidity
+            raise EntryInvalidity( key, value )
+        return key, value
+
+    def _store_item_( self, key: str, value: __.V ) -> None:
+        intern = __.sys.intern
+        node = self._root_
+        *segments, segment_last = key.split( self._separator_ )
+        for segment in segments:
+            child = node.children.get( segment, __.absent )
+            if type( child ) is not _TrieNode:
+                # Leaf values become values of interior nodes.
+                child = node.children[ intern( segment ) ] = (
+                    _TrieNode( child ) )
+            node = child
+        child = node.children.get( segment_last, __.absent )
+        if type( child ) is _TrieNode: child.value = value
+        else: node.children[ intern( segment_last ) ] = value
+        self._size_ += 1
+
+
+class TrieDictionaryView(
+    __.cabc.Mapping[ str, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Read-only view of entries under prefix in trie dictionary.
+
+        Keys are relative to prefix.
+    '''
+
+    __slots__ = ( '_node_', '_separator_' )
+
+    _node_: _TrieNode
+    _separator_: str
+
+    def __init__( self, node: _TrieNode, separator: str ) -> None:
+        self._node_ = node
+        self._separator_ = separator
+        super( ).__init__( )
+
+    def __getitem__( self, key: str ) -> __.V:
+        value = _trie_find_value( self._node_, key, self._separator_ )
+        if value is __.absent: raise KeyError( key )
+        return value
+
+    def __iter__( self ) -> __.cabc.Iterator[ str ]:
+        for key, _ in _trie_enumerate( self._node_, ( ), self._separator_ ):
+            yield key
+
+    def __len__( self ) -> int:
+        return sum( 1 for _ in self )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( dict( self.items( ) ) ) )
+
+    def subtree( self, prefix: str ) -> 'TrieDictionaryView[ __.V ]':
+        ''' Provides read-only view of entries under relative prefix. '''
+        node = _trie_find_node( self._node_, prefix.split( self._separator_ ) )
+        if node is None: raise KeyError( prefix )
+        return type( self )( node, self._separator_ )
+
+
+class SegmentedDictionary(
+    _DictionaryOperations[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+    instances_mutables = ( '_modulus_', '_split_' ),
+):
+    ''' Accretive dictionary which grows without rehashing all entries.
+
+        Entries are spread, by hash of key, over segments of bounded size.
+        As dictionary grows, one segment at a time is split in two, by
+        linear hashing. No accretion therefore pauses for time proportional
+        to size of dictionary, as rehashing of single large table would.
+        Lookups cost one more hash of key than for ordinary dictionaries.
+        Entries are iterated in order of accretion.
+    '''
+
+    __slots__ = ( '_keys_', '_modulus_', '_segments_', '_split_' )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries segment' )
+    _keys_: list[ __.H ]
+    _modulus_: int
+    _segments_: list[ dict[ __.H, __.V ] ]
+    _split_: int
+
+    def __init__(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        self._keys_ = [ ]
+        self._modulus_ = 1
+        self._segments_ = [ { } ]
+        self._split_ = 0
+        super( ).__init__( )
+        self.update( *iterables, **entries )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        return key in self._locate_( key )
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        return self._locate_( key )[ key ]
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._keys_ )
+
+    def __len__( self ) -> int:
+        return len( self._keys_ )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( self ) )
+
+    def __str__( self ) -> str:
+        return str( dict( self.items( ) ) )
+
+    @property
+    def segments_count( self ) -> int:
+        ''' Number of segments over which entries are spread. '''
+        return len( self._segments_ )
+
+    def copy( self ) -> __.typx.Self:
+        ''' Provides fresh copy of dictionary. '''
+        return type( self )( self )
+
+    def reserve( self, count: int ) -> None:
+        ''' Splits segments ahead of accretions, to hold count entries.
+
+            Later accretions, up to count, split no segments.
+        '''
+        while len( self._segments_ ) * _segment_load < count:
+            self._split_segment_( )
+
+    def with_data(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        return type( self )( *iterables, **entries )
+
+    def _locate_( self, key: __.typx.Any ) -> dict[ __.H, __.V ]:
+        ''' Returns segment which holds entry for key. '''
+        hash_ = hash( key )
+        index = hash_ % self._modulus_
+        if index < self._split_: index = hash_ % ( self._modulus_ << 1 )
+        return self._segments_[ index ]
+
+    def _split_segment_( self ) -> None:
+        ''' Splits next segment in turn. Appends new segment. '''
+        segments = self._segments_
+        index = self._split_
+        modulus = self._modulus_ << 1
+        retained: dict[ __.H, __.V ] = { }
+        moved: dict[ __.H, __.V ] = { }
+        for key, value in segments[ index ].items( ):
+            if hash( key ) % modulus == index: retained[ key ] = value
+            else: moved[ key ] = value
+        segments[ index ] = retained
+        segments.append( moved )
+        index += 1
+        if index << 1 == modulus:
+            self._modulus_ = modulus
+            index = 0
+        self._split_ = index
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        self._locate_( key )[ key ] = value
+        keys = self._keys_
+        keys.append( key )
+        if len( keys ) > len( self._segments_ ) * _segment_load:
+            self._split_segment_( )
+
+
+class LightDictionary( dict[ __.H, __.V ] ):
+    ''' Accretive subclass of :py:class:`dict` with minimal overhead.
+
+        Single object without wrapped storage or class behaviors, for
+        programs which create many small dictionaries. Lookups and
+        iteration are those of :py:class:`dict`. Prevents alteration or
+        removal of entries via inherited interface. Does not support
+        sealing, digests, indexes, or positional access.
+    '''
+
+    __slots__ = ( )
+
+    def __init__(
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        # Keys of single mapping or of nominative entries are unique.
+        # Reinitialization must not overwrite entries, so it is checked.
+        if self: self.update( *iterables, **entries )
+        elif not iterables: super( ).__init__( **entries )
+        elif not entries and len( iterables ) == 1 and isinstance(
+            iterables[ 0 ], __.cabc.Mapping
+        ): super( ).__init__( iterables[ 0 ] )
+        else:
+            super( ).__init__( )
+            self.update( *iterables, **entries )
+
+    def __delitem__( self, key: __.H ) -> None:
+        from .exceptions import EntryImmutability
+        raise EntryImmutability( key )
+
+    def __ior__( # pyright: ignore
+        self, other: __.cabc.Mapping[ __.H, __.V ]
+    ) -> __.typx.Self:
+        return self.update( other )
+
+    def __or__( # pyright: ignore
+        self, other: __.cabc.Mapping[ __.H, __.V ]
+    ) -> __.typx.Self:
+        if not isinstance( other, __.cabc.Mapping ): return NotImplemented
+        return type( self )( self ).update( other )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = super( ).__repr__( ) )
+
+    def __ror__( # pyright: ignore
+        self, other: __.cabc.Mapping[ __.H, __.V ]
+    ) -> __.typx.Self:
+        if not isinstance( other, __.cabc.Mapping ): return NotImplemented
+        return type( self )( other ).update( self )
+
+    def __setitem__( self, key: __.H, value: __.V ) -> None:
+        if key in self:
+            from .exceptions import EntryImmutability
+            raise EntryImmutability( key )
+        super( ).__setitem__( key, value )
+
+    def clear( self ) -> __.typx.Never:
+        ''' Raises exception. Cannot clear immutable entries. '''
+        from .exceptions import OperationInvalidity
+        raise OperationInvalidity( 'clear', 'Entries are immutable.' )
+
+    def copy( self ) -> __.typx.Self:
+        ''' Provides fresh copy of dictionary. '''
+        return type( self )( self )
+
+    def pop( # pyright: ignore
+        self, key: __.H, default: __.Absential[ __.V ] = __.absent
+    ) -> __.typx.Never:
+        ''' Raises exception. Cannot pop immutable entry. '''
+        from .exceptions import OperationInvalidity
+        raise OperationInvalidity( 'pop', 'Entries are immutable.' )
+
+    def popitem( self ) -> __.typx.Never:
+        ''' Raises exception. Cannot pop immutable entry. '''
+        from .exceptions import OperationInvalidity
+        raise OperationInvalidity( 'popitem', 'Entries are immutable.' )
+
+    def update( # pyright: ignore
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> __.typx.Self:
+        ''' Adds new entries as a batch. Returns self. '''
+        from itertools import chain
+        updates: dict[ __.H, __.V ] = { }
+        for key, value in chain.from_iterable( map( # pyright: ignore
+            lambda element: ( # pyright: ignore
+                element.items( )
+                if isinstance( element, __.cabc.Mapping )
+                else element
+            ),
+            ( *iterables, entries )
+        ) ):
+            if key in self or key in updates:
+                from .exceptions import EntryImmutability
+                raise EntryImmutability( key )
+            updates[ key ] = value
+        super( ).update( updates )
+        return self
+
+
+class OverlayDictionary(
+    AbstractDictionary[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Accretive dictionary over layers of accretive dictionaries.
+
+        Like :py:class:`collections.ChainMap`, earlier layers take
+        precedence over later ones and new entries are accreted to first
+        layer. Resolutions of keys are flattened into single table, which
+        is updated as layers accrete, so that lookups cost same regardless
+        of number of layers. Value for key changes if layer with higher
+        precedence later accretes that key. Layers observe overlay weakly,
+        so that overlay may be collected before its layers.
+    '''
+
+    __slots__ = ( '_flattened_', '_layers_' )
+
+    _flattened_: dict[ __.H, __.V ]
+    _layers_: tuple[ Dictionary[ __.H, __.V ], ... ]
+
+    def __init__( self, *layers: Dictionary[ __.H, __.V ] ) -> None:
+        if not layers: layers = ( Dictionary( ), )
+        flattened: dict[ __.H, __.V ] = { }
+        for layer in reversed( layers ): flattened.update( layer.items( ) )
+        self._flattened_ = flattened
+        self._layers_ = layers
+        super( ).__init__( )
+        for rank, layer in enumerate( layers ):
+            layer.add_observer(
+                _produce_overlay_observer( self, layer, rank ) )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        return key in self._flattened_
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        return self._flattened_[ key ]
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._flattened_ )
+
+    def __len__( self ) -> int:
+        return len( self._flattened_ )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = ', '.join( map( repr, self._layers_ ) ) )
+
+    def __str__( self ) -> str:
+        return str( self._flattened_ )
+
+    @property
+    def layers( self ) -> tuple[ Dictionary[ __.H, __.V ], ... ]:
+        ''' Layers in order of precedence. '''
+        return self._layers_
+
+    def _observe_(
+        self, rank: int, items: __.cabc.Mapping[ __.H, __.V ]
+    ) -> None:
+        ''' Resolves keys newly accreted by layer of rank. '''
+        flattened = self._flattened_
+        superiors = self._layers_[ : rank ]
+        for key, value in items.items( ):
+            if any( key in layer for layer in superiors ): continue
+            flattened[ key ] = value
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        self._layers_[ 0 ][ key ] = value
+
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        self._layers_[ 0 ].update( items )
+
+
+def fold_count( count: int, key: __.typx.Any, value: __.typx.Any ) -> int:
+    ''' Counts entries. Initial value is usually ``0``. '''
+    return count + 1
+
+
+def fold_groups(
+    attributor: __.cabc.Callable[ [ __.typx.Any ], __.typx.Any ],
+    fold: FoldArgument[ __.typx.Any, __.typx.Any ],
+    initial: __.typx.Any,
+) -> FoldArgument[ __.typx.Any, __.typx.Any ]:
+    ''' Produces fold which folds entries separately per group.
+
+        Group of each entry is attribute of its value. Aggregate is
+        dictionary from groups to aggregates, initially empty. Initial value
+        applies to each group. Dictionary of groups is updated in place.
+    '''
+    def fold_group(
+        groups: dict[ __.typx.Any, __.typx.Any ],
+        key: __.typx.Any,
+        value: __.typx.Any,
+    ) -> dict[ __.typx.Any, __.typx.Any ]:
+        group = attributor( value )
+        groups[ group ] = fold( groups.get( group, initial ), key, value )
+        return groups
+
+    return fold_group
+
+
+def fold_maximum(
+    maximum: __.typx.Any, key: __.typx.Any, value: __.typx.Any
+) -> __.typx.Any:
+    ''' Finds greatest value. Initial value is usually ``None``. '''
+    if maximum is None or maximum < value: return value
+    return maximum
+
+
+def fold_minimum(
+    minimum: __.typx.Any, key: __.typx.Any, value: __.typx.Any
+) -> __.typx.Any:
+    ''' Finds least value. Initial value is usually ``None``. '''
+    if minimum is None or value < minimum: return value
+    return minimum
+
+
+def fold_sum(
+    total: __.typx.Any, key: __.typx.Any, value: __.typx.Any
+) -> __.typx.Any:
+    ''' Sums values. Initial value is usually ``0``. '''
+    return total + value
+
+
+def survey_accretions(
+    mapping: __.cabc.Mapping[ __.typx.Any, __.typx.Any ], start: int
+) -> __.cabc.Iterator[ tuple[ __.typx.Any, __.typx.Any ] ]:
+    ''' Iterates over entries of mapping in order of accretion.
+
+        Starts from position in that order. Raises exception for mappings
+        which do not iterate in order of accretion, such as sorted
+        dictionaries, unless they track that order.
+    '''
+    from itertools import islice
+    if isinstance( mapping, Dictionary ):
+        return mapping._survey_accretions_( start )
+    if isinstance( mapping, ( dict, SegmentedDictionary ) ):
+        return islice( mapping.items( ), start, None )
+    from .exceptions import OperationInvalidity
+    raise OperationInvalidity( 'survey_accretions', 'Order is unknown.' )
+
+
+def _accumulate_digest(
+    digest: int, items: __.cabc.Iterable[ tuple[ __.typx.Any, __.typx.Any ] ]
+) -> int:
+    return ( digest + sum( map( _hash_stably, items ) ) ) & _digest_mask
+
+
+def _encode_stably( obj: __.typx.Any, parts: list[ bytes ] ) -> None:
+    if isinstance( obj, str ):
+        data = obj.encode( 'utf-8', 'surrogatepass' )
+        parts.append( _stable_header.pack( b's', len( data ) ) )
+        parts.append( data )
+    elif isinstance( obj, bytes ):
+        parts.append( _stable_header.pack( b'b', len( obj ) ) )
+        parts.append( obj )
+    elif isinstance( obj, tuple ):
+        parts.append( _stable_header.pack( b't', len( obj ) ) ) # pyright: ignore
+        for element in obj: _encode_stably( element, parts ) # pyright: ignore
+    # Hash of None varies by process before Python 3.12.
+    elif obj is None: parts.append( _stable_header.pack( b'n', 0 ) )
+    else:
+        parts.append(
+            _stable_header.pack( b'h', hash( obj ) & _digest_mask ) )
+
+
+def _hash_stably( obj: __.typx.Any ) -> int:
+    ''' Hashes object independently of hash seed, where possible.
+
+        Equal objects hash equally, as with builtin hash. Numeric hashes do
+        not depend on hash seed and are kept, so that equal numbers of
+        different types, such as ``1`` and ``1.0``, still hash equally.
+    '''
+    parts: list[ bytes ] = [ ]
+    _encode_stably( obj, parts )
+    return int.from_bytes( __.hashlib.blake2b(
+        b''.join( parts ), digest_size = 8 ).digest( ), 'little' )
+
+
+def _normalize_keys(
+    keys: __.cabc.Iterable[ __.typx.Any ]
+) -> tuple[ __.cabc.Sequence[ __.typx.Any ], __.typx.Any ]:
+    ''' Converts keys to sequence. Returns NumPy module for NumPy arrays.
+
+        NumPy is only considered if already imported, since arrays of keys
+        cannot exist otherwise.
+    '''
+    numpy = __.sys.modules.get( 'numpy' )
+    if numpy is not None and isinstance( keys, numpy.ndarray ):
+        return keys.tolist( ), numpy
+    if isinstance( keys, ( list, tuple ) ): return keys, None
+    return tuple( keys ), None
+
+
+def _order_like(
+    mapping: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+    entries: dict[ __.typx.Any, __.typx.Any ],
+) -> dict[ __.typx.Any, __.typx.Any ]:
+    ''' Orders entries as keys of mapping.
+
+        Entries for sorted dictionaries are sorted by key. Otherwise, keys
+        of mapping are scanned until all entries are found, which costs up
+        to size of mapping.
+    '''
+    if len( entries ) <= 1: return entries
+    if isinstance( mapping, SortedDictionary ):
+        return { key: entries[ key ] for key in sorted( entries ) }
+    from itertools import islice
+    keys = islice( filter( entries.__contains__, mapping ), len( entries ) )
+    return { key: entries[ key ] for key in keys }
+
+
+def _peek_digest(
+    dictionary: Dictionary[ __.typx.Any, __.typx.Any ]
+) -> int | None:
+    ''' Returns digest of dictionary, if already computed. '''
+    derivations = dictionary._derivations_
+    return None if derivations is None else derivations.digest
+
+
+def _produce_absences(
+    dictionary: Dictionary[ __.typx.Any, __.typx.Any ],
+    producer: __.DictionaryProducer[ __.typx.Any ],
+    keys: __.cabc.Sequence[ __.typx.Any ],
+) -> None:
+    ''' Produces values for absent keys and accretes them as batch.
+
+        Sealed dictionaries accept no entries; absent keys stay absent.
+    '''
+    from itertools import filterfalse
+    if dictionary._sealed_: return
+    absences = dict.fromkeys(
+        filterfalse( dictionary._data_.__contains__, keys ) )
+    if not absences: return
+    dictionary.update( { key: producer( ) for key in absences } )
+
+
+def _produce_overlay_observer(
+    overlay: OverlayDictionary[ __.typx.Any, __.typx.Any ],
+    layer: Dictionary[ __.typx.Any, __.typx.Any ],
+    rank: int,
+) -> ObserverArgument[ __.typx.Any, __.typx.Any ]:
+    ''' Produces observer of layer, which references overlay weakly.
+
+        Observer removes itself from layer once overlay is collected.
+    '''
+    from weakref import ref
+    overlay_reference = ref( overlay )
+    layer_reference = ref( layer )
+
+    def observe( items: __.cabc.Mapping[ __.typx.Any, __.typx.Any ] ) -> None:
+        overlay_ = overlay_reference( )
+        if overlay_ is not None:
+            overlay_._observe_( rank, items )
+            return
+        layer_ = layer_reference( )
+        if layer_ is not None: layer_.remove_observer( observe )
+
+    return observe
+
+
+def _raise_on_duplicate(
+    keys: __.cabc.Iterable[ __.typx.Any ]
+) -> __.typx.NoReturn:
+    ''' Raises exception for first key which recurs in keys. '''
+    from .exceptions import EntryImmutability
+    seen: set[ __.typx.Any ] = set( )
+    for key in keys:
+        if key in seen: raise EntryImmutability( key )
+        seen.add( key )
+    raise AssertionError # pragma: no cover
+
+
+def _raise_on_conflict(
+    mapping_a: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+    mapping_b: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+) -> None:
+    ''' Raises exception for first key common to both mappings. '''
+    keys_a, keys_b = mapping_a.keys( ), mapping_b.keys( )
+    if len( keys_b ) < len( keys_a ): keys_a, keys_b = keys_b, keys_a
+    # Views of dicts intersect without intermediate sets.
+    if keys_b.isdisjoint( keys_a ): return
+    from .exceptions import EntryImmutability
+    for key in keys_a:
+        if key in keys_b: raise EntryImmutability( key )
+
+
+def _raise_sealed( ) -> __.typx.NoReturn:
+    from .exceptions import OperationInvalidity
+    raise OperationInvalidity( 'accrete', 'Dictionary is sealed.' )
+
+
+def _update_validated(
+    dictionary: Dictionary[ __.typx.Any, __.typx.Any ],
+    iterables: tuple[ __.typx.Any, ... ],
+    entries: __.cabc.Mapping[ str, __.typx.Any ],
+) -> None:
+    ''' Adds entries as batch, validating those not already validated.
+
+        Entries from dictionaries with same validator have already passed
+        validation. Mappings with new keys are added without per-entry
+        checks.
+    '''
+    from .exceptions import EntryImmutability
+    validator = getattr( dictionary, '_validator_' )
+    updates: dict[ __.typx.Any, __.typx.Any ] = { }
+    unvalidated: dict[ __.typx.Any, __.typx.Any ] = { }
+    for source in ( *iterables, entries ):
+        validated = (
+            isinstance( source, Dictionary )
+            and getattr( source, '_validator_', None ) is validator )
+        # Underlying storage copies without calls to Python methods.
+        element = (
+            source._data_ if isinstance( source, Dictionary ) else source )
+        if isinstance( element, __.cabc.Mapping ):
+            _raise_on_conflict( dictionary, element ) # pyright: ignore
+            _raise_on_conflict( updates, element ) # pyright: ignore
+            updates.update( element ) # pyright: ignore
+            if not validated: unvalidated.update( element ) # pyright: ignore
+            continue
+        for key, value in element:
+            if key in dictionary or key in updates:
+                raise EntryImmutability( key )
+            updates[ key ] = value
+            if not validated: unvalidated[ key ] = value
+    _validate_entries( validator, unvalidated )
+    if updates: dictionary._store_items_( updates )
+
+
+def _validate_columns(
+    validator: __.DictionaryValidator[ __.typx.Any, __.typx.Any ],
+    columns: tuple[ ColumnArgument, ColumnArgument ],
+    sequences: tuple[
+        __.cabc.Sequence[ __.typx.Any ], __.cabc.Sequence[ __.typx.Any ] ],
+) -> None:
+    ''' Validates columns at once, if validator supports it.
+
+        Else, validates each entry in turn. Raises exception for first
+        invalid entry.
+    '''
+    from itertools import compress
+    from operator import not_
+    keys, values = sequences
+    validate_columns = getattr( validator, 'validate_columns', None )
+    validate_many = getattr( validator, 'validate_many', None )
+    if validate_columns is None and validate_many is None:
+        verdicts = map( validator, keys, values )
+    else:
+        verdicts = (
+            validate_columns( *columns ) if validate_columns is not None
+            else validate_many( tuple( zip( keys, values ) ) ) ) # pyright: ignore
+        if not isinstance( verdicts, __.cabc.Sequence ):
+            verdicts = tuple( verdicts )
+        # Complete verdicts are scanned without pairing them with entries.
+        if all( verdicts ): return
+    for key, value in compress( zip( keys, values ), map( not_, verdicts ) ):
+        from .exceptions import EntryInvalidity
+        raise EntryInvalidity( key, value )
+
+
+def _validate_entries(
+    validator: __.DictionaryValidator[ __.typx.Any, __.typx.Any ],
+    entries: __.cabc.Mapping[ __.typx.Any, __.typx.Any ],
+) -> None:
+    ''' Validates entries in single call, if validator supports it.
+
+        Else, validates each entry in turn. Raises exception for first
+        invalid entry.
+    '''
+    if not entries: return
+    keys, values = tuple( entries ), tuple( entries.values( ) )
+    _validate_columns( validator, ( keys, values ), ( keys, values ) )
+
+
+def _trie_enumerate(
+    node: _TrieNode,
+    path: tuple[ str, ... ],
+    separator: str,
+    inclusive: bool = False,
+) -> __.cabc.Iterator[ tuple[ str, __.typx.Any ] ]:
+    ''' Iterates over entries under node, depth first.
+
+        Entry at node itself is included only if inclusive.
+    '''
+    if inclusive and node.value is not __.absent:
+        yield separator.join( path ), node.value
+    stack = [
+        ( ( *path, segment ), child )
+        for segment, child in reversed( node.children.items( ) ) ]
+    while stack:
+        path, child = stack.pop( )
+        if type( child ) is not _TrieNode:
+            yield separator.join( path ), child
+            continue
+        if child.value is not __.absent:
+            yield separator.join( path ), child.value
+        stack.extend(
+            ( ( *path, segment ), child_ )
+            for segment, child_ in reversed( child.children.items( ) ) )
+
+
+def _trie_find_node(
+    node: _TrieNode, segments: __.cabc.Iterable[ str ]
+) -> _TrieNode | None:
+    ''' Returns interior node at path of segments, if it exists. '''
+    for segment in segments:
+        node = node.children.get( segment )
+        if type( node ) is not _TrieNode: return None
+    return node
+
+
+def _trie_find_value(
+    node: _TrieNode, key: __.typx.Any, separator: str
+) -> __.typx.Any:
+    ''' Returns value at key relative to node. Absent, if none. '''
+    if not isinstance( key, str ): return __.absent
+    *segments, segment_last = key.split( separator )
+    node_ = _trie_find_node( node, segments )
+    if node_ is None: return __.absent
+    child = node_.children.get( segment_last, __.absent )
+    if type( child ) is _TrieNode: return child.value
+    return child
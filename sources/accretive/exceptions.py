@@ -66,8 +66,33 @@ class EntryInvalidity( Omnierror, ValueError ):
             f"and value, {value!r}, to dictionary." )
 
 
+class EntriesInvalidity( EntryInvalidity ):
+
+    def __init__(
+        self,
+        entries: __.cabc.Sequence[ tuple[ __.cabc.Hashable, __.typx.Any ] ],
+    ) -> None:
+        self.entries = tuple( entries )
+        self.invalidities = tuple(
+            EntryInvalidity( indicator, value )
+            for indicator, value in self.entries )
+        indicator, value = self.entries[ 0 ]
+        Omnierror.__init__(
+            self,
+            f"Could not add {len( self.entries )} invalid entries to "
+            f"dictionary. First invalid entry has key, {indicator!r}, "
+            f"and value, {value!r}." )
+
+
 class ErrorProvideFailure( Omnierror, RuntimeError ):
 
     def __init__( self, name: str, reason: str ):
         super( ).__init__(
             f"Could not provide error class {name!r}. Reason: {reason}" )
+
+
+class OperationInvalidity( Omnierror, RuntimeError, TypeError ):
+
+    def __init__( self, name: str, reason: str ):
+        super( ).__init__(
+            f"Could not perform operation {name!r}. Reason: {reason}" )
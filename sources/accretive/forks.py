@@ -0,0 +1,136 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Preparation of accretive registries for forking processes.
+
+    Preforking servers build large registries in a parent process and then
+    fork workers which only read them. The pages holding those registries
+    are shared with the workers until written. Cyclic garbage collection in
+    a worker writes to the header of every tracked object which it examines
+    and so copies, page by page, the memory which was meant to be shared.
+
+    * :py:func:`prepare_for_fork`:
+      Disables garbage collection early in the parent process, so that
+      long-lived objects are not interleaved with freed holes, and arranges
+      for collection to resume in forked children.
+
+    * :py:func:`seal_for_fork`:
+      Collects garbage once and then moves all surviving objects into the
+      permanent generation, which collections never examine. Call right
+      before forking workers.
+
+    * :py:func:`report_memory`:
+      Reports resident, proportional, shared, and private memory of a
+      process, as recorded in ``/proc/<pid>/smaps_rollup`` on Linux.
+
+    Reference counts are still written when workers touch objects; only the
+    writes from garbage collection are avoided.
+
+    >>> from accretive import Dictionary
+    >>> from accretive.forks import prepare_for_fork, seal_for_fork
+    >>> prepare_for_fork( )
+    >>> registry = Dictionary( apples = 12, bananas = 6 )
+    >>> seal_for_fork( ) > 0
+    True
+
+    Both functions change interpreter-wide collector state. Where the
+    process continues with ordinary work instead of forking, restore it:
+
+    >>> import gc
+    >>> gc.unfreeze( )
+    >>> gc.enable( )
+'''
+
+
+from . import __
+from . import classes as _classes
+
+
+ProcessIdentifierArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int | None,
+    __.ddoc.Doc( ''' Process identifier. Current process, if ``None``. ''' ),
+]
+
+
+_at_fork_hooks: set[ str ] = set( )
+_smaps_fields = {
+    'Rss': 'resident',
+    'Pss': 'proportional',
+    'Shared_Clean': 'shared',
+    'Shared_Dirty': 'shared',
+    'Private_Clean': 'private',
+    'Private_Dirty': 'private',
+}
+
+
+class MemoryReport( _classes.DataclassObject ):
+    ''' Memory usage of process, in bytes. '''
+
+    resident: int
+    proportional: int
+    shared: int
+    private: int
+
+
+def prepare_for_fork( ) -> None:
+    ''' Disables garbage collection until processes are forked.
+
+        Call early in parent process, before building registries. Garbage
+        collection is enabled again in each forked child.
+    '''
+    import gc
+    gc.disable( )
+    if 'enable gc' in _at_fork_hooks: return
+    _at_fork_hooks.add( 'enable gc' )
+    __.os.register_at_fork( after_in_child = gc.enable )
+
+
+def seal_for_fork( ) -> int:
+    ''' Freezes surviving objects out of reach of garbage collection.
+
+        Call in parent process right before forking. Returns number of
+        objects in permanent generation.
+    '''
+    import gc
+    gc.collect( )
+    gc.freeze( )
+    return gc.get_freeze_count( )
+
+
+def report_memory(
+    pid: ProcessIdentifierArgument = None
+) -> MemoryReport:
+    ''' Reports memory usage of process.
+
+        Private memory is also known as unique set size (USS).
+    '''
+    path = __.pathlib.Path(
+        '/proc', 'self' if pid is None else str( pid ), 'smaps_rollup' )
+    try: lines = path.read_text( ).splitlines( )
+    except OSError as exc:
+        from .exceptions import OperationInvalidity
+        raise OperationInvalidity(
+            'report_memory', f"Cannot read {str( path )!r}." ) from exc
+    totals = dict.fromkeys( _smaps_fields.values( ), 0 )
+    for line in lines:
+        label, _, amount = line.partition( ':' )
+        if label not in _smaps_fields: continue
+        totals[ _smaps_fields[ label ] ] += int( amount.split( )[ 0 ] ) * 1024
+    return MemoryReport( **totals )
@@ -0,0 +1,440 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Append-only journals for accretive dictionaries.
+
+    Entries in accretive dictionaries are never altered or removed. A log of
+    accretions is therefore a complete record of a dictionary and can be
+    replayed to reconstruct it.
+
+    * :py:class:`Journal`:
+      Append-only file of accretion records. A background thread writes
+      pending records as a group and synchronizes them to storage in
+      configurable batches. Can be compacted into a snapshot.
+
+    * :py:class:`JournaledDictionary`:
+      Accretive dictionary which records every accretion in a journal and
+      which restores prior accretions from the journal on initialization.
+
+    Records are pickled. Only replay journals from trusted locations.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> from accretive.journals import Journal, JournaledDictionary
+    >>> with TemporaryDirectory( ) as directory:
+    ...     location = f"{directory}/registry.journal"
+    ...     with Journal( location ) as journal:
+    ...         d = JournaledDictionary( journal, apples = 12 )
+    ...         d[ 'bananas' ] = 6
+    ...     with Journal( location ) as journal:
+    ...         dict( JournaledDictionary( journal ) )
+    {'apples': 12, 'bananas': 6}
+'''
+
+
+from . import __
+from . import classes as _classes
+from . import dictionaries as _dictionaries
+
+
+FsyncBatchArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int,
+    __.ddoc.Doc(
+        ''' Maximum number of records written before synchronization.
+
+            Zero disables synchronization by record count.
+        ''' ),
+]
+FsyncIntervalArgument: __.typx.TypeAlias = __.typx.Annotated[
+    float | None,
+    __.ddoc.Doc(
+        ''' Maximum seconds between write and synchronization of record.
+
+            ``None`` disables synchronization by elapsed time.
+        ''' ),
+]
+JournalArgument: __.typx.TypeAlias = __.typx.Annotated[
+    'Journal', __.ddoc.Doc( ''' Journal which records accretions. ''' ),
+]
+LocationArgument: __.typx.TypeAlias = __.typx.Annotated[
+    str | __.os.PathLike[ str ],
+    __.ddoc.Doc(
+        ''' Location of journal file.
+
+            Snapshot is kept alongside it, with a ``.snapshot`` suffix.
+        ''' ),
+]
+
+
+_record_header = __.struct.Struct( '<II' ) # Payload length and CRC-32.
+_snapshot_batch_size = 4096
+
+
+class Journal(
+    _classes.Object,
+    instances_mutables = (
+        '_appended_', '_compactor_', '_failure_', '_requested_',
+        '_synchronized_',
+    ),
+):
+    ''' Append-only journal of dictionary accretions.
+
+        Each record holds a batch of entries. Records are queued by
+        :py:meth:`append` and written by a background thread, which commits
+        all queued records as a group. The journal file is synchronized to
+        storage after a configurable number of records or interval of time,
+        and on :py:meth:`flush` and :py:meth:`close`.
+
+        Incomplete or corrupt records at the end of the journal, such as from
+        an interrupted write, are discarded when the journal is opened.
+        Journals which are still open at interpreter exit are closed then,
+        so that queued records are committed.
+    '''
+
+    _appended_: int
+    _compactor_: int | None
+    _failure_: OSError | None
+    _requested_: int
+    _synchronized_: int
+
+    def __init__(
+        self,
+        location: LocationArgument, /, *,
+        fsync_batch: FsyncBatchArgument = 64,
+        fsync_interval: FsyncIntervalArgument = 0.05,
+    ) -> None:
+        import atexit
+        from collections import deque
+        from functools import partial
+        from weakref import ref
+        self._location_ = __.pathlib.Path( location )
+        self._snapshot_location_ = self._location_.with_name(
+            f"{self._location_.name}.snapshot" )
+        self._fsync_batch_ = fsync_batch
+        self._fsync_interval_ = fsync_interval
+        self._appended_ = 0
+        self._compactor_ = None
+        self._failure_ = None
+        self._requested_ = 0
+        self._synchronized_ = 0
+        self._closing_ = __.threading.Event( )
+        self._condition_ = __.threading.Condition( )
+        self._queue_: deque[ bytes ] = deque( )
+        _truncate_incomplete_records( self._location_ )
+        self._stream_ = self._location_.open( 'ab' )
+        self._writer_ = __.threading.Thread(
+            target = self._write_,
+            name = f"accretive journal writer: {self._location_}",
+            daemon = True )
+        self._writer_.start( )
+        # Daemon writer would be stopped at exit with records still queued.
+        self._exit_hook_ = partial( _close_at_exit, ref( self ) )
+        atexit.register( self._exit_hook_ )
+
+    def __enter__( self ) -> __.typx.Self:
+        return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        self.close( )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {location!r} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            location = str( self._location_ ) )
+
+    @property
+    def location( self ) -> __.pathlib.Path:
+        ''' Location of journal file. '''
+        return self._location_
+
+    def append(
+        self, entries: __.cabc.Iterable[ tuple[ __.H, __.V ] ]
+    ) -> None:
+        ''' Queues batch of entries as record for group commit. '''
+        self._enqueue_( self._encode_( entries ) )
+
+    def close( self ) -> None:
+        ''' Commits queued records and stops background writer.
+
+            Raises failure of writer, if any.
+        '''
+        import atexit
+        with self._condition_:
+            # Writer also sets closing, when it fails.
+            self._closing_.set( )
+            self._condition_.notify( )
+        atexit.unregister( self._exit_hook_ )
+        self._writer_.join( )
+        self._stream_.close( )
+        if self._failure_ is not None: raise self._failure_
+
+    def compact(
+        self, entries: __.cabc.Iterable[ tuple[ __.H, __.V ] ]
+    ) -> None:
+        ''' Folds journal into snapshot of supplied entries.
+
+            Entries must include every accretion which has been appended to
+            the journal. Appends from other threads wait until compaction
+            completes, so that their records are not discarded with the
+            journal.
+        '''
+        with self._condition_:
+            self._assert_operability_( 'compact' )
+            while self._compactor_ is not None: self._condition_.wait( )
+            self._compactor_ = __.threading.get_ident( )
+            try:
+                self.flush( )
+                self._write_snapshot_( entries )
+                self._stream_.truncate( 0 )
+                __.os.fsync( self._stream_.fileno( ) )
+            finally:
+                self._compactor_ = None
+                self._condition_.notify_all( )
+
+    def flush( self ) -> None:
+        ''' Waits until all appended records are synchronized to storage. '''
+        with self._condition_:
+            self._assert_operability_( 'flush' )
+            target = self._appended_
+            self._requested_ = max( self._requested_, target )
+            self._condition_.notify( )
+            while self._synchronized_ < target:
+                if self._failure_ is not None: raise self._failure_
+                self._condition_.wait( )
+
+    def replay(
+        self
+    ) -> __.cabc.Iterator[ tuple[ __.typx.Any, __.typx.Any ] ]:
+        ''' Produces recorded entries, from snapshot and then journal.
+
+            An entry may be produced more than once, if compaction was
+            interrupted. Repeated occurrences are identical to the first.
+        '''
+        if not self._closing_.is_set( ): self.flush( )
+        for location in ( self._snapshot_location_, self._location_ ):
+            if not location.exists( ): continue
+            with location.open( 'rb' ) as stream:
+                for payload in _read_records( stream ):
+                    yield from __.pickle.loads( payload )
+
+    def _assert_operability_( self, name: str ) -> None:
+        if self._failure_ is not None: raise self._failure_
+        if self._closing_.is_set( ):
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity( name, 'Journal is closed.' )
+
+    def _encode_(
+        self, entries: __.cabc.Iterable[ tuple[ __.H, __.V ] ]
+    ) -> bytes:
+        ''' Encodes batch of entries as record. Raises if unpicklable. '''
+        payload = __.pickle.dumps(
+            tuple( entries ), protocol = __.pickle.HIGHEST_PROTOCOL )
+        return b''.join( (
+            _record_header.pack( len( payload ), __.zlib.crc32( payload ) ),
+            payload ) )
+
+    def _enqueue_( self, record: bytes ) -> None:
+        ''' Queues encoded record for group commit.
+
+            Waits while journal is compacted by another thread.
+        '''
+        with self._condition_:
+            while self._compactor_ is not None:
+                if self._compactor_ == __.threading.get_ident( ):
+                    from .exceptions import OperationInvalidity
+                    raise OperationInvalidity(
+                        'append', 'Journal is being compacted.' )
+                self._condition_.wait( )
+            self._assert_operability_( 'append' )
+            self._queue_.append( record )
+            self._appended_ += 1
+            self._condition_.notify( )
+
+    def _await_records_( self, pending: int, deadline: float ) -> bool:
+        ''' Waits for records or synchronization. Returns if closing. '''
+        from time import monotonic
+        while not self._queue_ and not self._closing_.is_set( ):
+            if pending and self._requested_ > self._synchronized_: break
+            if deadline == float( 'inf' ):
+                self._condition_.wait( )
+                continue
+            timeout = deadline - monotonic( )
+            if timeout <= 0: break
+            self._condition_.wait( timeout )
+        return self._closing_.is_set( )
+
+    def _write_( self ) -> None:
+        from time import monotonic
+        interval = self._fsync_interval_
+        pending = 0
+        deadline = float( 'inf' )
+        while True:
+            with self._condition_:
+                closing = self._await_records_( pending, deadline )
+                records = tuple( self._queue_ )
+                self._queue_.clear( )
+                requested = self._requested_ > self._synchronized_
+            try:
+                if records:
+                    self._stream_.write( b''.join( records ) )
+                    self._stream_.flush( )
+                    if not pending and interval is not None:
+                        deadline = monotonic( ) + interval
+                    pending += len( records )
+                if pending and ( closing or requested or (
+                        self._fsync_batch_ and pending >= self._fsync_batch_
+                    ) or monotonic( ) >= deadline
+                ):
+                    __.os.fsync( self._stream_.fileno( ) )
+                    with self._condition_:
+                        self._synchronized_ += pending
+                        self._condition_.notify_all( )
+                    pending = 0
+                    deadline = float( 'inf' )
+            except OSError as exc:
+                with self._condition_:
+                    self._failure_ = exc
+                    self._closing_.set( )
+                    self._condition_.notify_all( )
+                return
+            if closing and not records: return
+
+    def _write_snapshot_(
+        self, entries: __.cabc.Iterable[ tuple[ __.H, __.V ] ]
+    ) -> None:
+        ''' Writes entries to snapshot, replacing any previous one. '''
+        from itertools import islice
+        interim = self._snapshot_location_.with_name(
+            f"{self._snapshot_location_.name}.interim" )
+        iterator = iter( entries )
+        with interim.open( 'wb' ) as stream:
+            while batch := tuple( islice( iterator, _snapshot_batch_size ) ):
+                payload = __.pickle.dumps(
+                    batch, protocol = __.pickle.HIGHEST_PROTOCOL )
+                stream.write( _record_header.pack(
+                    len( payload ), __.zlib.crc32( payload ) ) )
+                stream.write( payload )
+            stream.flush( )
+            __.os.fsync( stream.fileno( ) )
+        __.os.replace( interim, self._snapshot_location_ )
+        _synchronize_directory( self._location_.parent )
+
+
+class JournaledDictionary( _dictionaries.Dictionary[ __.H, __.V ] ):
+    ''' Accretive dictionary with journal of accretions. '''
+
+    __slots__ = ( '_journal_', )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries journal' )
+    _journal_: Journal
+
+    def __init__(
+        self,
+        journal: JournalArgument,
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        self._journal_ = journal
+        super( ).__init__( )
+        restorations: dict[ __.H, __.V ] = { }
+        for key, value in journal.replay( ):
+            restorations.setdefault( key, value )
+        # Restore through bulk path without journaling again.
+        super( )._store_items_( restorations )
+        self.update( *iterables, **entries )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {journal}, {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            journal = self._journal_,
+            contents = str( self._data_ ) )
+
+    @property
+    def journal( self ) -> Journal:
+        ''' Journal which records accretions. '''
+        return self._journal_
+
+    def copy( self ) -> _dictionaries.Dictionary[ __.H, __.V ]: # pyright: ignore
+        ''' Provides fresh, unjournaled copy of dictionary. '''
+        return _dictionaries.Dictionary( self )
+
+    def snapshot( self ) -> None:
+        ''' Compacts journal into snapshot of dictionary.
+
+            Accretions from other threads wait until compaction completes.
+        '''
+        # Copy entries, since accretions may precede their journal records.
+        self._journal_.compact( tuple( self._data_.items( ) ) )
+
+    def with_data( # pyright: ignore
+        self,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> _dictionaries.Dictionary[ __.H, __.V ]:
+        ''' Creates new, unjournaled dictionary with different data. '''
+        return _dictionaries.Dictionary( *iterables, **entries )
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        # Encode first, so that unpicklable entries are never stored.
+        record = self._journal_._encode_( ( ( key, value ), ) )
+        super( )._store_item_( key, value )
+        self._journal_._enqueue_( record )
+
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        record = self._journal_._encode_( items.items( ) )
+        super( )._store_items_( items )
+        self._journal_._enqueue_( record )
+
+
+def _close_at_exit( reference: __.typx.Any ) -> None:
+    ''' Closes journal at interpreter exit, if it still exists. '''
+    journal = reference( )
+    if journal is not None: journal.close( )
+
+
+def _read_records( stream: __.typx.BinaryIO ) -> __.cabc.Iterator[ bytes ]:
+    ''' Produces payloads of complete, intact records from stream. '''
+    size = _record_header.size
+    while len( header := stream.read( size ) ) == size:
+        length, checksum = _record_header.unpack( header )
+        payload = stream.read( length )
+        if len( payload ) < length or __.zlib.crc32( payload ) != checksum:
+            return
+        yield payload
+
+
+def _synchronize_directory( location: __.pathlib.Path ) -> None:
+    ''' Synchronizes directory entries to storage, where supported. '''
+    if not hasattr( __.os, 'O_DIRECTORY' ): return # pragma: no cover
+    descriptor = __.os.open( location, __.os.O_RDONLY | __.os.O_DIRECTORY )
+    try: __.os.fsync( descriptor )
+    finally: __.os.close( descriptor )
+
+
+def _truncate_incomplete_records( location: __.pathlib.Path ) -> None:
+    ''' Discards incomplete or corrupt records at end of journal. '''
+    if not location.exists( ): return
+    with location.open( 'r+b' ) as stream:
+        extent = sum(
+            _record_header.size + len( payload )
+            for payload in _read_records( stream ) )
+        if extent < stream.seek( 0, __.os.SEEK_END ):
+            stream.truncate( extent )
@@ -46,14 +46,45 @@ from . import __
 from . import iclasses as _iclasses
 
 
-class Namespace( # noqa: PLW1641
+_sealing_attributes = frozenset( ( '_hash_', '_sealed_' ) )
+
+
+def _assign_attribute_unless_sealed( # noqa: PLR0913
+    objct: object, /, *,
+    ligation: __.AssignerLigation,
+    attributes_namer: __.AttributesNamer,
+    error_class_provider: __.ErrorClassProvider,
+    level: str,
+    name: str,
+    value: __.typx.Any,
+) -> None:
+    ''' Assigns attribute if namespace is unsealed and attribute is absent.
+    '''
+    if (    name not in _sealing_attributes
+        and __.ccutils.getattr0( objct, '_sealed_', False )
+    ):
+        target = __.ccutils.describe_object( objct )
+        raise error_class_provider( 'AttributeImmutability' )( name, target )
+    _iclasses.assign_attribute_if_absent_mutable(
+        objct,
+        ligation = ligation,
+        attributes_namer = attributes_namer,
+        error_class_provider = error_class_provider,
+        level = level, name = name, value = value )
+
+
+class Namespace(
     metaclass = _iclasses.Class,
-    instances_assigner_core = _iclasses.assign_attribute_if_absent_mutable,
+    instances_assigner_core = _assign_attribute_unless_sealed,
 ):
     # TODO: Dynadoc fragments.
-    ''' Accretive namespaces. '''
+    ''' Accretive namespaces.
+
+        Can be sealed against further accretion with
+        :py:func:`seal_namespace`. Sealed namespaces are hashable.
+    '''
 
-    __slots__ = ( '__dict__', )
+    __slots__ = ( '__dict__', '_hash_', '_sealed_' )
 
     def __init__(
         self,
@@ -81,3 +112,26 @@ class Namespace( # noqa: PLW1641
         if isinstance( other, ( Namespace, __.types.SimpleNamespace ) ):
             return self.__dict__ != other.__dict__
         return NotImplemented
+
+    def __hash__( self ) -> int:
+        hash_ = getattr( self, '_hash_', None )
+        if hash_ is not None: return hash_
+        if not is_namespace_sealed( self ):
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity( 'hash', 'Namespace is not sealed.' )
+        self._hash_ = hash( frozenset( self.__dict__.items( ) ) )
+        return self._hash_
+
+
+def is_namespace_sealed( namespace: Namespace ) -> bool:
+    ''' Is namespace sealed against further accretion? '''
+    return getattr( namespace, '_sealed_', False )
+
+
+def seal_namespace( namespace: Namespace ) -> Namespace:
+    ''' Seals namespace against further accretion.
+
+        Not a method, so that it cannot collide with namespace attributes.
+    '''
+    if not is_namespace_sealed( namespace ): namespace._sealed_ = True
+    return namespace
@@ -0,0 +1,257 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Replication of accretive dictionaries across processes.
+
+    Entries in accretive dictionaries are never altered or removed and are
+    kept in insertion order. The position of an entry in that order is
+    therefore a stable sequence number, and a replica which holds the first
+    ``n`` entries of its primary only needs entries from sequence ``n``
+    onward to catch up.
+
+    * :py:class:`Primary`:
+      Streams new accretions of a dictionary, in batches, to attached
+      replicas.
+
+    * :py:class:`Replica`:
+      Applies accretions streamed from a primary to a local dictionary,
+      through its batch update path.
+
+    Connections are :py:class:`multiprocessing.connection.Connection`
+    objects, such as from :py:func:`multiprocessing.Pipe` or from a
+    :py:class:`multiprocessing.connection.Listener` on a Unix socket. Entries
+    are pickled in transit. Only connect to trusted peers.
+
+    >>> from multiprocessing import Pipe
+    >>> from accretive import Dictionary
+    >>> from accretive.replicas import Primary, Replica
+    >>> registry = Dictionary( apples = 12 )
+    >>> primary = Primary( registry )
+    >>> primary_end, replica_end = Pipe( )
+    >>> replica = Replica( replica_end )
+    >>> primary.attach( primary_end )
+    >>> registry[ 'bananas' ] = 6
+    >>> primary.publish( )
+    >>> replica.synchronize( timeout = 1 )
+    2
+    >>> replica.dictionary
+    accretive.dictionaries.Dictionary( {'apples': 12, 'bananas': 6} )
+'''
+
+
+from . import __
+from . import classes as _classes
+from . import dictionaries as _dictionaries
+
+
+BatchSizeArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int, __.ddoc.Doc( ''' Maximum number of entries per message. ''' ),
+]
+ConnectionArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Any,
+    __.ddoc.Doc(
+        ''' Connection to peer.
+
+            Typically, :py:class:`multiprocessing.connection.Connection`.
+        ''' ),
+]
+TimeoutArgument: __.typx.TypeAlias = __.typx.Annotated[
+    float | None,
+    __.ddoc.Doc(
+        ''' Seconds to wait for first message. ``None`` waits forever. ''' ),
+]
+
+
+_message_entries = 'entries'
+_message_subscribe = 'subscribe'
+
+
+class Primary( _classes.Object ):
+    ''' Streams accretions of dictionary to replicas.
+
+        Each attached replica announces the sequence number from which it
+        needs entries. Every call to :py:meth:`publish` sends each replica
+        all entries which it has not yet received, in batches. Replicas with
+        broken connections are detached.
+
+        Replicas which are not ready to receive, because they have not
+        drained earlier messages, are skipped and catch up on a later
+        publication. Sends happen outside of the lock on attached replicas
+        and each replica is served by one publisher at a time, so that a
+        slow replica only stalls the thread which is sending to it.
+    '''
+
+    def __init__(
+        self,
+        dictionary: _dictionaries.AbstractDictionary[ __.H, __.V ], /, *,
+        batch_size: BatchSizeArgument = 4096,
+    ) -> None:
+        # Reject mappings which do not keep order of accretion.
+        _dictionaries.survey_accretions( dictionary, len( dictionary ) )
+        self._dictionary_ = dictionary
+        self._batch_size_ = batch_size
+        self._mutex_ = __.threading.Lock( )
+        self._sending_: set[ __.typx.Any ] = set( )
+        self._sequences_: dict[ __.typx.Any, int ] = { }
+
+    @property
+    def dictionary( self ) -> _dictionaries.AbstractDictionary[ __.H, __.V ]:
+        ''' Dictionary which is replicated. '''
+        return self._dictionary_
+
+    @property
+    def replicas_count( self ) -> int:
+        ''' Number of attached replicas. '''
+        return len( self._sequences_ )
+
+    def attach( self, connection: ConnectionArgument ) -> None:
+        ''' Attaches replica and sends entries which it lacks. '''
+        kind, sequence = connection.recv( )
+        if kind != _message_subscribe or not isinstance( sequence, int ):
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'attach', f"Unexpected message from replica: {kind!r}" )
+        with self._mutex_: self._sequences_[ connection ] = sequence
+        self.publish( )
+
+    def detach( self, connection: ConnectionArgument ) -> None:
+        ''' Detaches replica. Does not close connection. '''
+        with self._mutex_: self._sequences_.pop( connection, None )
+
+    def publish( self ) -> None:
+        ''' Sends new entries to every attached replica which is ready.
+
+            A batch which does not fit into the buffer of a connection still
+            blocks until the replica receives enough of it.
+        '''
+        with self._mutex_:
+            size = len( self._dictionary_ )
+            claims = tuple(
+                ( connection, sequence )
+                for connection, sequence in self._sequences_.items( )
+                if sequence < size and connection not in self._sending_ )
+            self._sending_.update( connection for connection, _ in claims )
+        for connection, sequence in claims:
+            reach: int | None = sequence
+            try:
+                if _is_writable( connection ):
+                    self._send_( connection, sequence, size )
+                    reach = size
+            except ( EOFError, OSError ): reach = None
+            finally:
+                with self._mutex_:
+                    self._sending_.discard( connection )
+                    if connection in self._sequences_:
+                        if reach is None: del self._sequences_[ connection ]
+                        else: self._sequences_[ connection ] = reach
+
+    def _send_( self, connection: __.typx.Any, start: int, stop: int ) -> None:
+        from itertools import islice
+        # Sequence numbers are positions in order of accretion, which is
+        # not order of iteration for all dictionaries.
+        items = islice(
+            _dictionaries.survey_accretions( self._dictionary_, start ),
+            stop - start )
+        while batch := tuple( islice( items, self._batch_size_ ) ):
+            connection.send( ( _message_entries, start, batch ) )
+            start += len( batch )
+
+
+class Replica( _classes.Object, instances_mutables = ( '_connection_', ) ):
+    ''' Applies accretions streamed from primary to local dictionary.
+
+        The dictionary must only receive entries from the primary, so that
+        its size is the sequence number of the next entry it needs.
+    '''
+
+    def __init__(
+        self,
+        connection: ConnectionArgument, /,
+        dictionary: __.Absential[
+            _dictionaries.AbstractDictionary[ __.H, __.V ] ] = __.absent,
+    ) -> None:
+        if __.is_absent( dictionary ):
+            dictionary = _dictionaries.Dictionary( )
+        self._dictionary_ = dictionary
+        self._connection_ = connection
+        connection.send( ( _message_subscribe, len( dictionary ) ) )
+
+    @property
+    def connection( self ) -> __.typx.Any:
+        ''' Current connection to primary. '''
+        return self._connection_
+
+    @property
+    def dictionary( self ) -> _dictionaries.AbstractDictionary[ __.H, __.V ]:
+        ''' Local dictionary which receives accretions. '''
+        return self._dictionary_
+
+    @property
+    def sequence( self ) -> int:
+        ''' Sequence number of next needed entry. '''
+        return len( self._dictionary_ )
+
+    def reconnect( self, connection: ConnectionArgument ) -> None:
+        ''' Resumes replication, from current sequence, on new connection.
+        '''
+        self._connection_ = connection
+        connection.send( ( _message_subscribe, self.sequence ) )
+
+    def synchronize( self, timeout: TimeoutArgument = 0 ) -> int:
+        ''' Applies available accretions. Returns number of new entries.
+
+            Waits for first message up to timeout. Applies all other
+            messages which have already arrived.
+        '''
+        connection = self.connection
+        count = 0
+        wait = timeout
+        while connection.poll( wait ):
+            kind, sequence, batch = connection.recv( )
+            if kind != _message_entries: continue
+            count += self._apply_( sequence, batch )
+            wait = 0
+        return count
+
+    def _apply_(
+        self, sequence: int, batch: tuple[ tuple[ __.H, __.V ], ... ]
+    ) -> int:
+        expectation = len( self._dictionary_ )
+        if sequence > expectation:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'synchronize',
+                f"Expected entries from sequence {expectation}; "
+                f"received entries from sequence {sequence}." )
+        # Entries before expected sequence were already received.
+        batch = batch[ expectation - sequence : ]
+        self._dictionary_.update( batch )
+        return len( batch )
+
+
+def _is_writable( connection: __.typx.Any ) -> bool:
+    from select import select
+    # Connections without pollable descriptors, such as Windows pipes, are
+    # presumed writable and may block.
+    try: descriptor = connection.fileno( )
+    except ( AttributeError, OSError ): return True
+    try: _, writables, _ = select( ( ), ( descriptor, ), ( ), 0 )
+    except ( OSError, ValueError ): return True
+    return bool( writables )
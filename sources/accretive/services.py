@@ -0,0 +1,313 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Read-only query service for accretive dictionaries.
+
+    Entries in accretive dictionaries are never altered or removed. A value
+    which a client has retrieved from a served dictionary is therefore valid
+    forever and can be cached without invalidation. Only the absence of an
+    entry can become stale.
+
+    * :py:class:`Server`:
+      Serves lookups on a dictionary over a local TCP or Unix socket.
+
+    * :py:class:`RemoteDictionary`:
+      Read-only mapping over a served dictionary. Caches retrieved entries
+      forever and caches absences for a configurable interval.
+
+    Connections are made with :py:mod:`multiprocessing.connection`, which
+    supports authentication keys. Requests and responses are pickled. Only
+    connect to trusted peers.
+
+    >>> from accretive import Dictionary
+    >>> from accretive.services import RemoteDictionary, Server
+    >>> registry = Dictionary( apples = 12, bananas = 6 )
+    >>> with Server( registry, ( 'localhost', 0 ) ) as server:
+    ...     with RemoteDictionary.connect( server.address ) as remote:
+    ...         remote[ 'apples' ], remote.get_many( ( 'bananas', 'kiwis' ) )
+    (12, [6, None])
+'''
+
+
+from . import __
+from . import classes as _classes
+from . import dictionaries as _dictionaries
+
+
+AddressArgument: __.typx.TypeAlias = __.typx.Annotated[
+    str | tuple[ str, int ],
+    __.ddoc.Doc(
+        ''' Address of server.
+
+            Host and port for TCP socket. Path for Unix socket.
+        ''' ),
+]
+AuthkeyArgument: __.typx.TypeAlias = __.typx.Annotated[
+    bytes | None,
+    __.ddoc.Doc( ''' Key for authentication of connections. ''' ),
+]
+MissesTtlArgument: __.typx.TypeAlias = __.typx.Annotated[
+    float,
+    __.ddoc.Doc( ''' Seconds for which absences of entries are cached. ''' ),
+]
+
+
+_request_entries = 'entries'
+_request_get_many = 'get_many'
+_request_length = 'length'
+_response_error = 'error'
+_response_success = 'success'
+
+
+class Server( _classes.Object ):
+    ''' Serves lookups on dictionary over socket.
+
+        Supports batched retrieval of entries by key, retrieval of entries
+        from a sequence number onward, and retrieval of dictionary size.
+        Each connection is served by its own thread.
+    '''
+
+    def __init__(
+        self,
+        dictionary: __.cabc.Mapping[ __.H, __.V ],
+        address: AddressArgument, /, *,
+        authkey: AuthkeyArgument = None,
+    ) -> None:
+        from multiprocessing.connection import Listener
+        self._dictionary_ = dictionary
+        self._authkey_ = authkey
+        self._closing_ = __.threading.Event( )
+        self._listener_ = Listener( address, authkey = authkey )
+        self._acceptor_ = __.threading.Thread(
+            target = self._accept_,
+            name = f"accretive server: {self._listener_.address}",
+            daemon = True )
+
+    def __enter__( self ) -> __.typx.Self:
+        self.start( )
+        return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        self.close( )
+
+    @property
+    def address( self ) -> AddressArgument:
+        ''' Address on which server listens. '''
+        return self._listener_.address
+
+    def close( self ) -> None:
+        ''' Stops accepting connections. '''
+        from multiprocessing.connection import Client
+        if self._closing_.is_set( ): return
+        self._closing_.set( )
+        if self._acceptor_.is_alive( ):
+            # Wake acceptor, which is blocked on accept.
+            Client( self.address, authkey = self._authkey_ ).close( )
+            self._acceptor_.join( )
+        self._listener_.close( )
+
+    def start( self ) -> None:
+        ''' Starts accepting connections in background thread. '''
+        self._acceptor_.start( )
+
+    def _accept_( self ) -> None:
+        from multiprocessing import AuthenticationError
+        while True:
+            # Failed handshakes, such as with wrong keys, drop only clients.
+            try: connection = self._listener_.accept( )
+            except ( AuthenticationError, EOFError, OSError ):
+                if self._closing_.is_set( ): return
+                continue
+            if self._closing_.is_set( ):
+                connection.close( )
+                return
+            __.threading.Thread(
+                target = self._serve_, args = ( connection, ),
+                daemon = True ).start( )
+
+    def _dispatch_(
+        self, kind: __.typx.Any, arguments: list[ __.typx.Any ]
+    ) -> tuple[ str, __.typx.Any ]:
+        from itertools import islice
+        dictionary = self._dictionary_
+        if kind == _request_get_many:
+            keys, = arguments
+            return _response_success, {
+                key: dictionary[ key ] for key in keys if key in dictionary }
+        if kind == _request_entries:
+            sequence, = arguments
+            if sequence < 0: return _response_error, kind
+            size = len( dictionary )
+            # Sequence numbers are positions in order of accretion.
+            entries = _dictionaries.survey_accretions( dictionary, sequence )
+            return _response_success, tuple(
+                islice( entries, max( size - sequence, 0 ) ) )
+        if kind == _request_length:
+            return _response_success, len( dictionary )
+        return _response_error, kind
+
+    def _respond_(
+        self, request: tuple[ __.typx.Any, ... ]
+    ) -> tuple[ str, __.typx.Any ]:
+        try: kind, *arguments = request
+        except ( TypeError, ValueError ): return _response_error, 'request'
+        # Failures of requests must not end service of connection.
+        try: return self._dispatch_( kind, arguments )
+        except Exception: return _response_error, kind
+
+    def _serve_( self, connection: __.typx.Any ) -> None:
+        with connection:
+            while not self._closing_.is_set( ):
+                try: request = connection.recv( )
+                except ( EOFError, OSError ): return
+                except Exception: request = None # Unpicklable request.
+                response = self._respond_( request ) # pyright: ignore
+                try: connection.send( response )
+                except ( EOFError, OSError ): return
+                except Exception: # Unpicklable response.
+                    connection.send( ( _response_error, 'response' ) )
+
+
+class RemoteDictionary(
+    __.cabc.Mapping[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Read-only mapping over served dictionary, with client-side cache.
+
+        Retrieved entries are cached forever, since they can never change.
+        Absences are cached for a limited time, since entries may be added.
+    '''
+
+    __slots__ = (
+        '_connection_', '_hits_', '_keys_', '_misses_', '_misses_ttl_',
+        '_mutex_',
+    )
+
+    _hits_: dict[ __.H, __.V ]
+    _keys_: list[ __.H ]
+    _misses_: dict[ __.H, float ]
+
+    def __init__(
+        self,
+        connection: __.typx.Any, /, *,
+        misses_ttl: MissesTtlArgument = 1.0,
+    ) -> None:
+        self._connection_ = connection
+        self._hits_ = { }
+        self._keys_ = [ ]
+        self._misses_ = { }
+        self._misses_ttl_ = misses_ttl
+        self._mutex_ = __.threading.Lock( )
+        super( ).__init__( )
+
+    @classmethod
+    def connect(
+        cls,
+        address: AddressArgument, /, *,
+        authkey: AuthkeyArgument = None,
+        misses_ttl: MissesTtlArgument = 1.0,
+    ) -> __.typx.Self:
+        ''' Connects to server at address. '''
+        from multiprocessing.connection import Client
+        return cls(
+            Client( address, authkey = authkey ), misses_ttl = misses_ttl )
+
+    def __enter__( self ) -> __.typx.Self:
+        return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        self.close( )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        if key in self._hits_: return True
+        return key in self._fetch_( ( key, ) )
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        try: return self._hits_[ key ]
+        except KeyError: pass
+        return self._fetch_( ( key, ) )[ key ]
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        self.synchronize( )
+        return iter( self._keys_ )
+
+    def __len__( self ) -> int:
+        return self._request_( _request_length )
+
+    def close( self ) -> None:
+        ''' Closes connection to server. '''
+        self._connection_.close( )
+
+    def entries_since(
+        self, sequence: int
+    ) -> tuple[ tuple[ __.H, __.V ], ... ]:
+        ''' Retrieves entries from sequence number onward. '''
+        entries = self._request_( _request_entries, sequence )
+        self._hits_.update( entries )
+        return entries
+
+    def get_many(
+        self, keys: __.cabc.Iterable[ __.H ], default: __.typx.Any = None
+    ) -> list[ __.typx.Any ]:
+        ''' Retrieves values for keys in one batch. Default for absences. '''
+        keys = tuple( keys )
+        hits = self._hits_
+        absences = tuple( key for key in keys if key not in hits )
+        if absences: self._fetch_( absences )
+        return [ hits.get( key, default ) for key in keys ]
+
+    def synchronize( self ) -> int:
+        ''' Retrieves entries added since last synchronization.
+
+            Returns number of retrieved entries.
+        '''
+        entries = self.entries_since( len( self._keys_ ) )
+        self._keys_.extend( key for key, _ in entries )
+        return len( entries )
+
+    def _fetch_(
+        self, keys: __.cabc.Sequence[ __.H ]
+    ) -> __.cabc.Mapping[ __.H, __.V ]:
+        ''' Retrieves entries not known to be absent. Caches results. '''
+        from time import monotonic
+        now = monotonic( )
+        misses = self._misses_
+        keys = tuple(
+            key for key in keys if misses.get( key, 0.0 ) <= now )
+        if not keys: return { }
+        entries = self._request_( _request_get_many, keys )
+        self._hits_.update( entries )
+        expiration = now + self._misses_ttl_
+        for key in keys:
+            if key in entries: misses.pop( key, None )
+            else: misses[ key ] = expiration
+        return entries
+
+    def _request_( self, *request: __.typx.Any ) -> __.typx.Any:
+        with self._mutex_:
+            self._connection_.send( request )
+            status, response = self._connection_.recv( )
+        if status != _response_success:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                response, 'Request rejected by server.' )
+        return response
+
@@ -0,0 +1,408 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Accretive dictionaries in shared memory and shareable buffers.
+
+    Entries in accretive dictionaries are never altered or removed. A single
+    writer can therefore append entries to shared memory while any number of
+    readers, in other processes, look them up without locks.
+
+    * :py:class:`BufferDictionary`:
+      Read-only dictionary over a buffer, such as :py:class:`bytes` or a
+      memory map. Entries are deserialized on lookup; the buffer itself is
+      never copied.
+
+    * :py:class:`SharedDictionary`:
+      Accretive dictionary in a :py:mod:`multiprocessing.shared_memory`
+      block. The process which creates the dictionary is its writer;
+      processes which attach to it by name are readers.
+
+    * :py:func:`export_dictionary`:
+      Serializes a mapping into :py:class:`bytes` for a buffer dictionary.
+      Immutable bytes can be handed to other interpreters or written to
+      files and mapped by other processes.
+
+    Keys and values are serialized into an append-only arena and located
+    through an open-addressing index. Each entry is written to the arena
+    and indexed before the count of published entries is advanced. Readers
+    determine size and iteration extent from that count, so they never
+    observe a partially written entry.
+
+    Keys are compared by their serialized forms. Use keys of a single
+    primitive type, such as strings or integers, or tuples thereof. Keys and
+    values are pickled. Only read buffers from trusted sources.
+
+    >>> from accretive.shared import SharedDictionary
+    >>> writer = SharedDictionary( 65536, apples = 12 )
+    >>> reader = SharedDictionary.attach( writer.name )
+    >>> writer[ 'bananas' ] = 6
+    >>> dict( reader )
+    {'apples': 12, 'bananas': 6}
+    >>> reader.close( ); writer.close( ); writer.unlink( )
+
+    >>> from accretive.shared import BufferDictionary, export_dictionary
+    >>> exported = export_dictionary( { 'apples': 12, 'bananas': 6 } )
+    >>> BufferDictionary( exported )[ 'bananas' ]
+    6
+'''
+
+
+from . import __
+from . import classes as _classes
+from . import dictionaries as _dictionaries
+
+
+BufferArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Any,
+    __.ddoc.Doc(
+        ''' Buffer holding serialized dictionary.
+
+            Any object which supports the buffer protocol, such as
+            :py:class:`bytes`, :py:class:`mmap.mmap`, or
+            :py:class:`memoryview`.
+        ''' ),
+]
+CapacityArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int,
+    __.ddoc.Doc(
+        ''' Size, in bytes, of arena for serialized entries.
+
+            Index is sized in proportion. Shared memory blocks cannot grow,
+            so capacity must accommodate all future accretions.
+        ''' ),
+]
+
+
+_exportable_types = ( bool, bytes, float, int, str, type( None ) )
+_header = __.struct.Struct( '<8sQQQQ' )
+_header_magic = b'ACCRSHD1'
+_published_offset = 24 # Offset of published count and extent in header.
+_published = __.struct.Struct( '<QQ' )
+_record = __.struct.Struct( '<II' )
+_slot = __.struct.Struct( '<QQ' )
+_slot_load_maximum = 0.75
+_record_size_nominal = 32
+
+
+class BufferDictionary(
+    _dictionaries.AbstractDictionary[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+):
+    ''' Read-only dictionary over serialized buffer. '''
+
+    __slots__ = ( '_arena_', '_buffer_', '_index_', '_writable_' )
+
+    _dynadoc_fragments_ = ( 'dictionary entries buffer', )
+
+    def __init__( self, buffer: BufferArgument, / ) -> None:
+        view = memoryview( buffer )
+        if not _is_dictionary_layout( view ):
+            view.release( )
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'initialize', 'Buffer holds no dictionary.' )
+        self._initialize_( view, writable = False )
+        super( ).__init__( )
+
+    def __enter__( self ) -> __.typx.Self:
+        return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        self.close( )
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        encoded = _encode( key )
+        offset = self._locate_( encoded, _fingerprint( encoded ) )
+        if offset is None: raise KeyError( key )
+        buffer = self._buffer_
+        start = self._arena_ + offset
+        size, vsize = _record.unpack_from( buffer, start )
+        start += _record.size + size
+        return __.pickle.loads( buffer[ start : start + vsize ] )
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        buffer = self._buffer_
+        _, extent = _published.unpack_from( buffer, _published_offset )
+        position = self._arena_
+        end = position + extent
+        while position < end:
+            size, vsize = _record.unpack_from( buffer, position )
+            position += _record.size
+            yield __.pickle.loads( buffer[ position : position + size ] )
+            position += size + vsize
+
+    def __len__( self ) -> int:
+        return _published.unpack_from( self._buffer_, _published_offset )[ 0 ]
+
+    def __reduce__( self ) -> tuple[ __.typx.Any, ... ]:
+        return type( self ), ( self._buffer_.tobytes( ), )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            contents = str( dict( self.items( ) ) ) )
+
+    @property
+    def writable( self ) -> bool:
+        ''' Can entries be accreted? '''
+        return self._writable_
+
+    def close( self ) -> None:
+        ''' Releases buffer. '''
+        self._buffer_.release( )
+
+    def _initialize_( self, buffer: memoryview, writable: bool ) -> None:
+        _, slots_count, _, _, _ = _header.unpack_from( buffer, 0 )
+        self._buffer_ = buffer
+        self._index_ = ( _header.size, slots_count )
+        self._arena_ = _header.size + slots_count * _slot.size
+        self._writable_ = writable
+
+    def _locate_( self, encoded: bytes, fingerprint: int ) -> int | None:
+        ''' Returns arena offset of record for key, if present. '''
+        buffer = self._buffer_
+        arena = self._arena_
+        start, slots_count = self._index_
+        mask = slots_count - 1
+        slot = fingerprint & mask
+        while True:
+            fingerprint_, offset = _slot.unpack_from(
+                buffer, start + slot * _slot.size )
+            if not offset: return None
+            offset -= 1
+            if fingerprint_ == fingerprint:
+                size = _record.unpack_from( buffer, arena + offset )[ 0 ]
+                position = arena + offset + _record.size
+                if buffer[ position : position + size ] == encoded:
+                    return offset
+            slot = ( slot + 1 ) & mask
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        self._store_items_( { key: value } )
+
+    def _store_items_( self, items: __.cabc.Mapping[ __.H, __.V ] ) -> None:
+        if not self._writable_:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'store', 'Dictionary is read-only in this process.' )
+        records = _encode_records( items )
+        buffer = self._buffer_
+        count, extent = _published.unpack_from( buffer, _published_offset )
+        size = sum( map( _calculate_record_size, records ) )
+        if (    extent + size > buffer.nbytes - self._arena_
+            or  count + len( records ) > self._index_[ 1 ] * _slot_load_maximum
+        ):
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'store', 'Shared dictionary capacity is exhausted.' )
+        _write_records( buffer, records )
+
+
+class SharedDictionary( BufferDictionary[ __.H, __.V ] ):
+    ''' Accretive dictionary in shared memory.
+
+        Single writer; multiple lock-free readers.
+    '''
+
+    __slots__ = ( '_memory_', '_name_' )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries share' )
+
+    def __init__(
+        self,
+        capacity: CapacityArgument,
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+        slots_count = _calculate_slots_count(
+            capacity // _record_size_nominal )
+        arena = _header.size + slots_count * _slot.size
+        memory = SharedMemory( create = True, size = arena + capacity )
+        _header.pack_into(
+            memory.buf, 0, _header_magic, slots_count, capacity, 0, 0 )
+        self._memory_ = memory
+        self._name_ = memory.name
+        self._initialize_( memory.buf, writable = True )
+        super( BufferDictionary, self ).__init__( )
+        self.update( *iterables, **entries )
+
+    @classmethod
+    def attach( cls, name: str ) -> __.typx.Self:
+        ''' Attaches to dictionary in shared memory as reader. '''
+        memory, buffer = _attach_memory( name )
+        if not _is_dictionary_layout( buffer ):
+            buffer.release( )
+            memory.close( )
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'attach', f"Shared memory {name!r} holds no dictionary." )
+        self = cls.__new__( cls )
+        self._memory_ = memory
+        self._name_ = name
+        self._initialize_( buffer, writable = False )
+        return self
+
+    def __reduce__( self ) -> tuple[ __.typx.Any, ... ]:
+        # Processes which receive the dictionary attach to it as readers.
+        return type( self ).attach, ( self.name, )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {name!r}, {contents} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            name = self.name,
+            contents = str( dict( self.items( ) ) ) )
+
+    @property
+    def name( self ) -> str:
+        ''' Name of shared memory block. '''
+        return self._name_
+
+    def close( self ) -> None:
+        ''' Detaches from shared memory block. '''
+        super( ).close( )
+        self._memory_.close( )
+
+    def unlink( self ) -> None:
+        ''' Requests destruction of shared memory block. Writer only. '''
+        if not self._writable_:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'unlink', 'Readers of shared dictionary do not own it.' )
+        self._memory_.unlink( )
+
+
+def export_dictionary( mapping: __.cabc.Mapping[ __.H, __.V ] ) -> bytes:
+    ''' Serializes mapping into bytes for buffer dictionary.
+
+        Keys and values are restricted to strings, bytes, integers, floats,
+        booleans, ``None``, and tuples thereof, so that any interpreter can
+        deserialize them without imports.
+    '''
+    for key, value in mapping.items( ):
+        if _is_exportable( key ) and _is_exportable( value ): continue
+        from .exceptions import EntryInvalidity
+        raise EntryInvalidity( key, value )
+    records = _encode_records( mapping )
+    slots_count = _calculate_slots_count( len( records ) )
+    capacity = sum( map( _calculate_record_size, records ) )
+    buffer = bytearray(
+        _header.size + slots_count * _slot.size + capacity )
+    _header.pack_into(
+        buffer, 0, _header_magic, slots_count, capacity, 0, 0 )
+    with memoryview( buffer ) as view: _write_records( view, records )
+    return bytes( buffer )
+
+
+def _attach_memory( name: str ) -> tuple[ __.typx.Any, memoryview ]:
+    ''' Attaches to shared memory block, read-only, as non-owner. '''
+    if __.os.name != 'posix': # pragma: no cover
+        # Shared memory blocks are not tracked for destruction on Windows.
+        from multiprocessing.shared_memory import SharedMemory
+        memory = SharedMemory( name = name )
+        return memory, memory.buf
+    # Bypass resource tracker, which would destroy block on reader exit.
+    import _posixshmem # pyright: ignore
+    import mmap
+    descriptor = _posixshmem.shm_open(
+        f"/{name.lstrip( '/' )}", __.os.O_RDONLY )
+    try:
+        size = __.os.fstat( descriptor ).st_size
+        mapping = mmap.mmap( descriptor, size, prot = mmap.PROT_READ )
+    finally: __.os.close( descriptor )
+    return mapping, memoryview( mapping )
+
+
+def _calculate_record_size( record: tuple[ bytes, bytes ] ) -> int:
+    return _record.size + len( record[ 0 ] ) + len( record[ 1 ] )
+
+
+def _calculate_slots_count( entries_maximum: int ) -> int:
+    slots_count = 8
+    while slots_count * _slot_load_maximum < entries_maximum:
+        slots_count <<= 1
+    return slots_count
+
+
+def _encode( key: __.typx.Any ) -> bytes:
+    ''' Serializes key canonically, so that equal keys encode equally. '''
+    from io import BytesIO
+    stream = BytesIO( )
+    pickler = __.pickle.Pickler(
+        stream, protocol = __.pickle.HIGHEST_PROTOCOL )
+    # Memoization would make encoding depend on identities within tuples.
+    pickler.fast = True
+    pickler.dump( key )
+    return stream.getvalue( )
+
+
+def _encode_records(
+    items: __.cabc.Mapping[ __.typx.Any, __.typx.Any ]
+) -> tuple[ tuple[ bytes, bytes ], ... ]:
+    return tuple(
+        ( _encode( key ),
+          __.pickle.dumps( value, protocol = __.pickle.HIGHEST_PROTOCOL ) )
+        for key, value in items.items( ) )
+
+
+def _fingerprint( encoded: bytes ) -> int:
+    from hashlib import blake2b
+    return int.from_bytes(
+        blake2b( encoded, digest_size = 8 ).digest( ), 'little' )
+
+
+def _is_dictionary_layout( buffer: memoryview ) -> bool:
+    if buffer.nbytes < _header.size: return False
+    return _header.unpack_from( buffer, 0 )[ 0 ] == _header_magic
+
+
+def _is_exportable( obj: __.typx.Any ) -> bool:
+    if type( obj ) is tuple: return all( map( _is_exportable, obj ) )
+    return type( obj ) in _exportable_types
+
+
+def _write_records(
+    buffer: memoryview, records: __.cabc.Sequence[ tuple[ bytes, bytes ] ]
+) -> None:
+    ''' Writes and indexes records. Then publishes them. '''
+    _, slots_count, _, count, extent = _header.unpack_from( buffer, 0 )
+    start = _header.size
+    arena = start + slots_count * _slot.size
+    mask = slots_count - 1
+    for encoded, value in records:
+        position = arena + extent
+        _record.pack_into( buffer, position, len( encoded ), len( value ) )
+        position += _record.size
+        buffer[ position : position + len( encoded ) ] = encoded
+        position += len( encoded )
+        buffer[ position : position + len( value ) ] = value
+        fingerprint = _fingerprint( encoded )
+        slot = fingerprint & mask
+        while _slot.unpack_from( buffer, start + slot * _slot.size )[ 1 ]:
+            slot = ( slot + 1 ) & mask
+        _slot.pack_into(
+            buffer, start + slot * _slot.size, fingerprint, extent + 1 )
+        extent += _record.size + len( encoded ) + len( value )
+    # Publish only after all records are written and indexed.
+    _published.pack_into(
+        buffer, _published_offset, count + len( records ), extent )
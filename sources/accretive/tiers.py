@@ -0,0 +1,357 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Tiered accretive dictionaries, which spill cold entries to disk.
+
+    Entries in accretive dictionaries are never altered or removed. Once an
+    entry has been written to disk, that record stays valid forever. The
+    entry can be promoted back to memory on access and demoted again later
+    without another write.
+
+    * :py:class:`Tiering`:
+      Policy and cold storage for tiered dictionaries. Sets the number of
+      entries held in memory and the policy for eviction. Appends
+      compressed, cold entries to a local file.
+
+    * :py:class:`TieredDictionary`:
+      Accretive dictionary which keeps hot entries in memory, demotes cold
+      entries to disk, and promotes them again transparently on access.
+
+    * :py:class:`TieringStatistics`:
+      Hits, misses, demotions, and spills of a tiered dictionary.
+
+    Keys of all entries, and locations of cold entries, remain in memory.
+    Only values are spilled. Values are pickled; keep cold storage on
+    trusted, local file systems. Mutable values are written again on each
+    demotion, so that changes to them while in memory are kept.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> from accretive.tiers import TieredDictionary, Tiering
+    >>> with TemporaryDirectory( ) as directory:
+    ...     with Tiering( f"{directory}/cold", capacity = 2 ) as tiering:
+    ...         d = TieredDictionary( tiering, a = 1, b = 2, c = 3 )
+    ...         d.statistics.cold_entries, d[ 'a' ], d.statistics.misses
+    (1, 1, 1)
+'''
+
+
+from . import __
+from . import classes as _classes
+from . import dictionaries as _dictionaries
+
+
+CapacityArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int, __.ddoc.Doc( ''' Maximum number of entries held in memory. ''' ),
+]
+CompressionArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int,
+    __.ddoc.Doc(
+        ''' Level of zlib compression for cold entries, from 0 to 9. ''' ),
+]
+EvictionArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Literal[ 'frequency', 'recency' ],
+    __.ddoc.Doc(
+        ''' Policy for demotion of entries from memory.
+
+            ``recency`` demotes least recently used entries. ``frequency``
+            demotes least frequently used entries, in batches.
+        ''' ),
+]
+LocationArgument: __.typx.TypeAlias = __.typx.Annotated[
+    str | __.os.PathLike[ str ],
+    __.ddoc.Doc(
+        ''' Location of file for cold entries.
+
+            File is truncated on opening and removed on closing.
+        ''' ),
+]
+TieringArgument: __.typx.TypeAlias = __.typx.Annotated[
+    'Tiering', __.ddoc.Doc( ''' Policy and cold storage for entries. ''' ),
+]
+
+
+class Tiering( _classes.Object, instances_mutables = ( '_extent_', ) ):
+    ''' Policy and cold storage for tiered dictionaries.
+
+        Cold entries are compressed and appended to a file, which only
+        lives as long as the tiering. Several dictionaries may share one
+        tiering; each dictionary holds its own number of entries in memory.
+    '''
+
+    _extent_: int
+
+    def __init__(
+        self,
+        location: LocationArgument, /, *,
+        capacity: CapacityArgument = 65536,
+        compression: CompressionArgument = 6,
+        eviction: EvictionArgument = 'recency',
+    ) -> None:
+        self._location_ = __.pathlib.Path( location )
+        self._capacity_ = capacity
+        self._compression_ = compression
+        self._eviction_ = eviction
+        self._extent_ = 0
+        self._mutex_ = __.threading.Lock( )
+        self._stream_ = self._location_.open( 'w+b' )
+
+    def __enter__( self ) -> __.typx.Self:
+        return self
+
+    def __exit__( self, *exception_info: __.typx.Any ) -> None:
+        self.close( )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {location!r} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            location = str( self._location_ ) )
+
+    @property
+    def capacity( self ) -> int:
+        ''' Maximum number of entries held in memory per dictionary. '''
+        return self._capacity_
+
+    @property
+    def eviction( self ) -> str:
+        ''' Policy for demotion of entries from memory. '''
+        return self._eviction_
+
+    @property
+    def location( self ) -> __.pathlib.Path:
+        ''' Location of file for cold entries. '''
+        return self._location_
+
+    def close( self ) -> None:
+        ''' Closes and removes file for cold entries. '''
+        with self._mutex_:
+            if self._stream_.closed: return
+            self._stream_.close( )
+        self._location_.unlink( missing_ok = True )
+
+    def _read_( self, offset: int, size: int ) -> __.typx.Any:
+        ''' Reads and decodes value at location. '''
+        with self._mutex_:
+            self._assert_operability_( 'read' )
+            self._stream_.seek( offset )
+            payload = self._stream_.read( size )
+        return __.pickle.loads( __.zlib.decompress( payload ) )
+
+    def _write_( self, pickle: bytes ) -> tuple[ int, int ]:
+        ''' Compresses and appends pickled value. Returns its location. '''
+        payload = __.zlib.compress( pickle, self._compression_ )
+        with self._mutex_:
+            self._assert_operability_( 'write' )
+            offset = self._extent_
+            self._stream_.seek( offset )
+            self._stream_.write( payload )
+            self._extent_ = offset + len( payload )
+        return offset, len( payload )
+
+    def _assert_operability_( self, name: str ) -> None:
+        if self._stream_.closed:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity( name, 'Tiering is closed.' )
+
+
+class TieringStatistics( _classes.DataclassObject ):
+    ''' Activity of tiered dictionary. '''
+
+    hits: int
+    misses: int
+    demotions: int
+    spills: int
+    spilled_bytes: int
+    hot_entries: int
+    cold_entries: int
+
+    @property
+    def hit_ratio( self ) -> float:
+        ''' Fraction of lookups served from memory. '''
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TieredDictionary(
+    _dictionaries.AbstractDictionary[ __.H, __.V ],
+    metaclass = _classes.AbstractBaseClass,
+    class_mutables = _classes.abc_class_mutables,
+    instances_mutables = (
+        '_demotions_', '_hits_', '_misses_', '_spilled_bytes_', '_spills_' ),
+):
+    ''' Accretive dictionary which spills cold entries to disk.
+
+        Entries are never removed, only relocated. Lookups of cold entries
+        read them from disk and promote them to memory. Values of promoted
+        entries are equal to, but not identical with, their originals.
+        Immutable values are written to disk once; others on each demotion.
+        Entries are iterated in order of accretion. Iteration over values
+        promotes cold entries.
+    '''
+
+    __slots__ = (
+        '_accesses_', '_demotions_', '_hits_', '_hot_', '_keys_',
+        '_locations_', '_misses_', '_pickles_', '_spilled_bytes_',
+        '_spills_', '_tiering_',
+    )
+
+    _dynadoc_fragments_ = (
+        'dictionary entries accrete', 'dictionary entries tier' )
+    _accesses_: dict[ __.H, int ]
+    _demotions_: int
+    _hits_: int
+    _hot_: dict[ __.H, __.V ]
+    _keys_: dict[ __.H, None ]
+    _locations_: dict[ __.H, tuple[ int, int ] ]
+    _misses_: int
+    _pickles_: dict[ __.H, bytes ]
+    _spilled_bytes_: int
+    _spills_: int
+    _tiering_: Tiering
+
+    def __init__(
+        self,
+        tiering: TieringArgument,
+        /,
+        *iterables: __.DictionaryPositionalArgument[ __.H, __.V ],
+        **entries: __.DictionaryNominativeArgument[ __.V ],
+    ) -> None:
+        from collections import OrderedDict
+        self._accesses_ = { }
+        self._demotions_ = 0
+        self._hits_ = 0
+        self._hot_ = (
+            OrderedDict( ) if tiering.eviction == 'recency' else { } )
+        self._keys_ = { }
+        self._locations_ = { }
+        self._misses_ = 0
+        self._pickles_ = { }
+        self._spilled_bytes_ = 0
+        self._spills_ = 0
+        self._tiering_ = tiering
+        super( ).__init__( )
+        self.update( *iterables, **entries )
+
+    def __contains__( self, key: __.typx.Any ) -> bool:
+        return key in self._keys_
+
+    def __getitem__( self, key: __.H ) -> __.V:
+        hot = self._hot_
+        try: value = hot[ key ]
+        except KeyError: return self._promote_( key )
+        self._hits_ += 1
+        self._touch_( key )
+        return value
+
+    def __iter__( self ) -> __.cabc.Iterator[ __.H ]:
+        return iter( self._keys_ )
+
+    def __len__( self ) -> int:
+        return len( self._keys_ )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {tiering} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            tiering = self._tiering_ )
+
+    @property
+    def statistics( self ) -> TieringStatistics:
+        ''' Snapshot of activity of dictionary. '''
+        hot_entries = len( self._hot_ )
+        return TieringStatistics(
+            hits = self._hits_,
+            misses = self._misses_,
+            demotions = self._demotions_,
+            spills = self._spills_,
+            spilled_bytes = self._spilled_bytes_,
+            hot_entries = hot_entries,
+            cold_entries = len( self._keys_ ) - hot_entries )
+
+    @property
+    def tiering( self ) -> Tiering:
+        ''' Policy and cold storage for entries. '''
+        return self._tiering_
+
+    def _admit_( self, key: __.H, value: __.V ) -> None:
+        ''' Holds entry in memory. Demotes other entries as necessary. '''
+        hot = self._hot_
+        hot[ key ] = value
+        self._touch_( key )
+        capacity = self._tiering_.capacity
+        if len( hot ) <= capacity: return
+        # Entries leave memory only after they are written to disk.
+        if type( hot ) is not dict: # Least recently used go first.
+            while len( hot ) > capacity:
+                self._demote_( *next( iter( hot.items( ) ) ) )
+                hot.popitem( last = False ) # pyright: ignore
+            return
+        from heapq import nsmallest
+        # Demote batch, so that selection is amortized over evictions.
+        count = len( hot ) - capacity + max( capacity >> 3, 1 )
+        for victim in nsmallest( count, hot, key = self._accesses_.get ):
+            self._demote_( victim, hot[ victim ] )
+            del hot[ victim ]
+
+    def _demote_( self, key: __.H, value: __.V ) -> None:
+        ''' Writes entry to disk, unless unchanged value is already there. '''
+        self._demotions_ += 1
+        pickle = self._pickles_.pop( key, None )
+        if pickle is None:
+            if key in self._locations_ and _is_immutable( value ): return
+            pickle = __.pickle.dumps(
+                value, protocol = __.pickle.HIGHEST_PROTOCOL )
+        offset, size = self._tiering_._write_( pickle )
+        self._locations_[ key ] = ( offset, size )
+        self._spills_ += 1
+        self._spilled_bytes_ += size
+
+    def _promote_( self, key: __.H ) -> __.V:
+        ''' Reads entry from disk into memory. '''
+        location = self._locations_.get( key )
+        if location is None: raise KeyError( key )
+        value = self._tiering_._read_( *location )
+        self._misses_ += 1
+        self._admit_( key, value )
+        return value
+
+    def _store_item_( self, key: __.H, value: __.V ) -> None:
+        # Reject values which could not be demoted, before they are held.
+        pickle = __.pickle.dumps(
+            value, protocol = __.pickle.HIGHEST_PROTOCOL )
+        # Pickles of mutable values would be stale by their first demotion.
+        if _is_immutable( value ): self._pickles_[ key ] = pickle
+        self._keys_[ key ] = None
+        self._admit_( key, value )
+
+    def _touch_( self, key: __.H ) -> None:
+        hot = self._hot_
+        if type( hot ) is dict:
+            accesses = self._accesses_
+            accesses[ key ] = accesses.get( key, 0 ) + 1
+        else: hot.move_to_end( key ) # pyright: ignore
+
+
+_immutable_types = frozenset( (
+    bool, bytes, complex, float, int, str, type( None ) ) )
+
+
+def _is_immutable( value: __.typx.Any ) -> bool:
+    if type( value ) is tuple: return all( map( _is_immutable, value ) )
+    return type( value ) in _immutable_types
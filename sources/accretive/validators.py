@@ -0,0 +1,326 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Validators of entries for validator dictionaries.
+
+    Validator dictionaries accept any callable which takes key and value
+    and returns verdict. Validators may also provide ``validate_many``,
+    which takes sequence of key-value pairs and returns verdict for each
+    pair, so that batches of entries are validated in single call.
+
+    * :py:class:`ParallelValidator`:
+      Wraps validator of single entries. Validates large batches in chunks
+      across thread or process pool and reports every invalid entry.
+
+    * :py:class:`TypeValidator`:
+      Validates types of keys and values against type annotations, such as
+      classes, unions, ``Literal``, and ``Annotated`` with predicates.
+      Provided by :py:meth:`accretive.dictionaries.ValidatorDictionary.for_types`.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from accretive import ValidatorDictionary
+    >>> from accretive.validators import ParallelValidator
+    >>> def validate( key, value ): return isinstance( value, int )
+    >>> with ThreadPoolExecutor( 2 ) as executor:
+    ...     validator = ParallelValidator( validate, executor, chunk_size = 2 )
+    ...     d = ValidatorDictionary( validator, a = 1, b = 2, c = 3 )
+    ...     d.update( d = 'four', e = 5, f = 'six' )
+    Traceback (most recent call last):
+        ...
+    accretive.exceptions.EntriesInvalidity: Could not add 2 invalid entries to dictionary. First invalid entry has key, 'd', and value, 'four'.
+''' # noqa: E501
+
+
+from . import __
+from . import classes as _classes
+
+
+ChunkSizeArgument: __.typx.TypeAlias = __.typx.Annotated[
+    int,
+    __.ddoc.Doc(
+        ''' Number of entries validated by each task.
+
+            Batches no larger than this are validated in calling thread.
+        ''' ),
+]
+ExecutorArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Any,
+    __.ddoc.Doc(
+        ''' Executor for tasks, such as thread or process pool.
+
+            Must provide ``map``, as :py:class:`concurrent.futures.Executor`
+            does. For process pools, validator must be picklable.
+        ''' ),
+]
+TypeArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Any,
+    __.ddoc.Doc(
+        ''' Type annotation, against which objects are checked.
+
+            Classes, ``None``, ``Any``, unions, ``Literal``, and
+            ``Annotated`` are supported. Callable metadata of ``Annotated``
+            are predicates, which objects must satisfy. Generic aliases,
+            such as ``list[ int ]``, are checked against their origins
+            only.
+        ''' ),
+]
+
+
+class ParallelValidator( _classes.Object ):
+    ''' Validator which validates batches of entries across executor.
+
+        Single entries are validated in calling thread. Batches are split
+        into chunks, which are validated concurrently. Every invalid entry
+        in batch is reported, rather than only the first one.
+    '''
+
+    def __init__(
+        self,
+        validator: __.DictionaryValidator[ __.H, __.V ],
+        executor: ExecutorArgument,
+        /, *,
+        chunk_size: ChunkSizeArgument = 4096,
+    ) -> None:
+        if chunk_size < 1:
+            from .exceptions import OperationInvalidity
+            raise OperationInvalidity(
+                'ParallelValidator', 'Chunk size must be positive.' )
+        self._validator_ = validator
+        self._executor_ = executor
+        self._chunk_size_ = chunk_size
+
+    def __call__( self, key: __.H, value: __.V ) -> bool:
+        return self._validator_( key, value )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {validator}, {executor} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            validator = self._validator_,
+            executor = self._executor_ )
+
+    @property
+    def validator( self ) -> __.DictionaryValidator[ __.H, __.V ]:
+        ''' Validator of single entries. '''
+        return self._validator_
+
+    def validate_many(
+        self, pairs: __.cabc.Sequence[ tuple[ __.H, __.V ] ]
+    ) -> list[ bool ]:
+        ''' Validates key-value pairs, in chunks across executor.
+
+            Raises exception, which collects every invalid entry, if any
+            entry is invalid. Returns verdicts otherwise.
+        '''
+        from itertools import chain, repeat
+        size = self._chunk_size_
+        validator = self._validator_
+        if len( pairs ) <= size: verdicts = _validate_chunk( validator, pairs )
+        else:
+            chunks = tuple(
+                pairs[ start : start + size ]
+                for start in range( 0, len( pairs ), size ) )
+            verdicts = list( chain.from_iterable( self._executor_.map(
+                _validate_chunk, repeat( validator ), chunks ) ) )
+        if all( verdicts ): return verdicts
+        from .exceptions import EntriesInvalidity
+        raise EntriesInvalidity( tuple(
+            pair for pair, verdict in zip( pairs, verdicts ) if not verdict ) )
+
+
+class TypeValidator( _classes.Object ):
+    ''' Validator of types of keys and values.
+
+        Type annotations are compiled once into checks. Classes and unions
+        of classes become single ``isinstance`` checks. In batches, these
+        are checked once per distinct type of keys or values, rather than
+        once per entry.
+    '''
+
+    def __init__(
+        self, key_type: TypeArgument, value_type: TypeArgument
+    ) -> None:
+        self._key_type_ = key_type
+        self._value_type_ = value_type
+        self._key_check_ = _compile_check( key_type )
+        self._value_check_ = _compile_check( value_type )
+        self._key_predicate_ = self._key_check_[ 1 ]
+        self._value_predicate_ = self._value_check_[ 1 ]
+
+    def __call__( self, key: __.typx.Any, value: __.typx.Any ) -> bool:
+        return self._key_predicate_( key ) and self._value_predicate_( value )
+
+    def __repr__( self ) -> str:
+        return "{fqname}( {key_type!r}, {value_type!r} )".format(
+            fqname = __.ccutils.qualify_class_name( type( self ) ),
+            key_type = self._key_type_,
+            value_type = self._value_type_ )
+
+    @property
+    def key_type( self ) -> __.typx.Any:
+        ''' Type annotation for keys. '''
+        return self._key_type_
+
+    @property
+    def value_type( self ) -> __.typx.Any:
+        ''' Type annotation for values. '''
+        return self._value_type_
+
+    def validate_columns(
+        self,
+        keys: __.cabc.Sequence[ __.typx.Any ],
+        values: __.cabc.Sequence[ __.typx.Any ],
+    ) -> list[ bool ]:
+        ''' Validates types of keys and values in columns, as batch.
+
+            Elements of NumPy arrays are checked as Python objects.
+        '''
+        from operator import and_
+        key_verdicts = _check_many( self._key_check_, _normalize( keys ) )
+        value_verdicts = _check_many(
+            self._value_check_, _normalize( values ) )
+        if key_verdicts is None:
+            if value_verdicts is None: return [ True ] * len( keys )
+            return value_verdicts
+        if value_verdicts is None: return key_verdicts
+        return list( map( and_, key_verdicts, value_verdicts ) )
+
+    def validate_many(
+        self, pairs: __.cabc.Sequence[ tuple[ __.typx.Any, __.typx.Any ] ]
+    ) -> list[ bool ]:
+        ''' Validates types of keys and values of pairs, as batch. '''
+        from operator import itemgetter
+        return self.validate_columns(
+            tuple( map( itemgetter( 0 ), pairs ) ),
+            tuple( map( itemgetter( 1 ), pairs ) ) )
+
+
+_Check: __.typx.TypeAlias = tuple[
+    tuple[ type, ... ] | None, __.cabc.Callable[ [ __.typx.Any ], bool ] ]
+
+
+def _accept( obj: __.typx.Any ) -> bool:
+    return True
+
+
+def _check_many(
+    check: _Check, objects: __.cabc.Sequence[ __.typx.Any ]
+) -> list[ bool ] | None:
+    ''' Checks objects. Returns nothing, if all pass by their types. '''
+    classes, predicate = check
+    if classes is not None and all(
+        issubclass( class_, classes ) for class_ in set( map( type, objects ) )
+    ): return None
+    return list( map( predicate, objects ) )
+
+
+def _compile_check( annotation: __.typx.Any ) -> _Check:
+    ''' Compiles type annotation into classes and predicate.
+
+        Classes are present only if annotation is satisfied by instances
+        of them alone, so that objects can be checked by type.
+    '''
+    import typing
+    if annotation is __.typx.Any or annotation is object:
+        return ( object, ), _accept
+    if annotation is None: annotation = type( None )
+    origin = __.typx.get_origin( annotation )
+    arguments = __.typx.get_args( annotation )
+    if origin is __.typx.Annotated:
+        return _compile_annotated_check( arguments )
+    if origin in ( typing.Literal, __.typx.Literal ):
+        return None, _produce_literal_check( arguments )
+    if origin in ( typing.Union, __.types.UnionType ):
+        return _compile_union_check( arguments )
+    if isinstance( origin, type ): annotation = origin
+    if isinstance( annotation, type ):
+        return ( annotation, ), _produce_instance_check( ( annotation, ) )
+    from .exceptions import OperationInvalidity
+    raise OperationInvalidity(
+        'TypeValidator', f"Unsupported type annotation: {annotation!r}." )
+
+
+def _compile_annotated_check(
+    arguments: tuple[ __.typx.Any, ... ]
+) -> _Check:
+    classes, predicate = _compile_check( arguments[ 0 ] )
+    predicates = tuple( filter( callable, arguments[ 1 : ] ) )
+    if not predicates: return classes, predicate
+    return None, _produce_predicates_check( ( predicate, *predicates ) )
+
+
+def _compile_union_check( arguments: tuple[ __.typx.Any, ... ] ) -> _Check:
+    checks = tuple( map( _compile_check, arguments ) )
+    if all( classes is not None for classes, _ in checks ):
+        classes_ = tuple(
+            class_ for classes, _ in checks
+            for class_ in classes ) # pyright: ignore
+        return classes_, _produce_instance_check( classes_ )
+    return None, _produce_union_check(
+        tuple( predicate for _, predicate in checks ) )
+
+
+def _normalize(
+    column: __.cabc.Sequence[ __.typx.Any ]
+) -> __.cabc.Sequence[ __.typx.Any ]:
+    ''' Converts NumPy arrays to lists of Python objects. '''
+    numpy = __.sys.modules.get( 'numpy' )
+    if numpy is not None and isinstance( column, numpy.ndarray ):
+        return column.tolist( )
+    return column
+
+
+def _produce_instance_check(
+    classes: tuple[ type, ... ]
+) -> __.cabc.Callable[ [ __.typx.Any ], bool ]:
+    class_ = classes[ 0 ] if len( classes ) == 1 else classes
+    return lambda obj: isinstance( obj, class_ )
+
+
+def _produce_literal_check(
+    literals: __.cabc.Iterable[ __.typx.Any ]
+) -> __.cabc.Callable[ [ __.typx.Any ], bool ]:
+    # Types distinguish literals which compare equal, such as 1 and True.
+    members = frozenset( ( type( literal ), literal ) for literal in literals )
+
+    def check( obj: __.typx.Any ) -> bool:
+        try: return ( type( obj ), obj ) in members
+        except TypeError: return False # Unhashable objects are not literals.
+
+    return check
+
+
+def _produce_predicates_check(
+    predicates: tuple[ __.cabc.Callable[ [ __.typx.Any ], bool ], ... ]
+) -> __.cabc.Callable[ [ __.typx.Any ], bool ]:
+    return lambda obj: all( predicate( obj ) for predicate in predicates )
+
+
+def _produce_union_check(
+    predicates: tuple[ __.cabc.Callable[ [ __.typx.Any ], bool ], ... ]
+) -> __.cabc.Callable[ [ __.typx.Any ], bool ]:
+    return lambda obj: any( predicate( obj ) for predicate in predicates )
+
+
+def _validate_chunk(
+    validator: __.DictionaryValidator[ __.typx.Any, __.typx.Any ],
+    pairs: __.cabc.Sequence[ tuple[ __.typx.Any, __.typx.Any ] ],
+) -> list[ bool ]:
+    ''' Validates chunk of key-value pairs. Runs in worker of executor. '''
+    return [ bool( validator( key, value ) ) for key, value in pairs ]
@@ -167,3 +167,19 @@ def test_105_invalid_inputs( ):
 
     with pytest.raises( TypeError ):
         dictionary.update( [ 1, 2, 3 ] )  # Invalid iterable structure
+
+
+def test_106_reinitialization( ):
+    ''' Validates reinitialization of AccretiveDictionary.
+
+        Ensures reinitialization cannot overwrite existing entries.
+    '''
+    module = cache_import_module( MODULE_QNAME )
+    exceptions = cache_import_module( EXCEPTIONS_QNAME )
+    factory = getattr( module, 'AccretiveDictionary' )
+    dictionary = factory( key1 = 1 )
+    with pytest.raises( exceptions.EntryImmutability ):
+        dictionary.__init__( key1 = 2 )
+    with pytest.raises( exceptions.EntryImmutability ):
+        dictionary.__init__( { 'key1': 2 } )
+    assert dictionary == { 'key1': 1 }
@@ -29,9 +29,11 @@ from .__ import PACKAGE_NAME, cache_import_module
 CLASS_NAMES = (
     'Omniexception', 'Omnierror',
     'AttributeImmutability',
+    'EntriesInvalidity',
     'EntryImmutability',
     'EntryInvalidity',
     'ErrorProvideFailure',
+    'OperationInvalidity',
 )
 MODULE_QNAME = f"{PACKAGE_NAME}.exceptions"
 
@@ -62,3 +64,27 @@ def test_200_error_provide_failure():
     assert 'TestError' in message
     assert 'Testing' in message
     assert 'Could not provide error class' in message
+
+
+def test_210_operation_invalidity( ):
+    ''' OperationInvalidity formats message correctly. '''
+    module = cache_import_module( MODULE_QNAME )
+    exc = module.OperationInvalidity( 'append', 'Journal is closed.' )
+    message = str( exc )
+    assert 'append' in message
+    assert 'Journal is closed.' in message
+
+
+def test_220_entries_invalidity( ):
+    ''' EntriesInvalidity collects invalidity of each entry. '''
+    module = cache_import_module( MODULE_QNAME )
+    exc = module.EntriesInvalidity( ( ( 'a', 'one' ), ( 'b', 'two' ) ) )
+    assert isinstance( exc, module.EntryInvalidity )
+    assert ( ( 'a', 'one' ), ( 'b', 'two' ) ) == exc.entries
+    assert 2 == len( exc.invalidities )
+    assert all(
+        isinstance( invalidity, module.EntryInvalidity )
+        for invalidity in exc.invalidities )
+    message = str( exc )
+    assert 'Could not add 2 invalid entries' in message
+    assert "'a'" in message
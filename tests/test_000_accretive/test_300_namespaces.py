@@ -117,6 +117,29 @@ def test_105_dictionary_equality( module_qname, class_name ):
     assert ns2 != ns1
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_110_sealing( module_qname, class_name ):
+    ''' Sealed namespace rejects accretion and is hashable. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    ns1 = factory( foo = 1, bar = 2 )
+    assert not module.is_namespace_sealed( ns1 )
+    with pytest.raises( TypeError ):
+        hash( ns1 )
+    assert ns1 is module.seal_namespace( ns1 )
+    assert ns1 is module.seal_namespace( ns1 )
+    assert module.is_namespace_sealed( ns1 )
+    with pytest.raises( exceptions.AttributeImmutability ):
+        ns1.baz = 3
+    ns2 = module.seal_namespace( factory( foo = 1, bar = 2 ) )
+    assert hash( ns1 ) == hash( ns2 )
+    assert len( { ns1, ns2 } ) == 1
+    assert { 'foo': 1, 'bar': 2 } == ns1.__dict__
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
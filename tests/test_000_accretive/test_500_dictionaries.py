@@ -21,6 +21,8 @@
 ''' Assert correct function of dictionaries. '''
 
 
+import pickle
+
 from itertools import product
 from types import MappingProxyType as DictionaryProxy
 
@@ -246,6 +248,65 @@ def test_161_or_rejects_invalid_operands( module_qname, class_name ):
     assert NotImplemented == dct.__ror__( [ ] )
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_162_ior_accretes_in_place( module_qname, class_name ):
+    ''' In-place dictionary union accretes entries into same dictionary. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    factory = getattr( module, class_name )
+    posargs, nomargs = select_arguments( class_name )
+    dct = factory( *posargs, **nomargs )
+    identity = id( dct )
+    if class_name in PRODUCER_VALIDATOR_NAMES:
+        dct[ 'a' ] = [ 1 ]
+        dct |= { 'b': [ 2 ] }
+        with pytest.raises( exceptions.EntryImmutability ):
+            dct |= { 'c': [ 3 ], 'a': [ 4 ] }
+        assert { 'a': [ 1 ], 'b': [ 2 ] } == dct
+    else:
+        dct[ 'a' ] = 1
+        dct |= { 'b': 2 }
+        with pytest.raises( exceptions.EntryImmutability ):
+            dct |= { 'c': 3, 'a': 4 }
+        assert { 'a': 1, 'b': 2 } == dct
+    assert identity == id( dct )
+    assert NotImplemented == dct.__ior__( [ ] )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_165_merge_all( module_qname, class_name ):
+    ''' Dictionary merges many mappings with detection of conflicts. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    factory = getattr( module, class_name )
+    posargs, _ = select_arguments( class_name )
+    w = (
+        ( lambda n: [ n ] ) if class_name in PRODUCER_VALIDATOR_NAMES
+        else ( lambda n: n ) )
+    mappings = [ { 'a': w( 1 ) }, { 'b': w( 2 ), 'c': w( 3 ) }, { } ]
+    dct = factory.merge_all( iter( mappings ), *posargs )
+    assert isinstance( dct, factory )
+    assert { 'a': w( 1 ), 'b': w( 2 ), 'c': w( 3 ) } == dct
+    assert [ 'a', 'b', 'c' ] == list( dct )
+    mappings.append( { 'd': w( 4 ), 'a': w( 1 ) } )
+    with pytest.raises( exceptions.EntryImmutability ):
+        factory.merge_all( mappings, *posargs )
+    dct = factory.merge_all(
+        mappings, *posargs, allow_equal_duplicates = True )
+    assert [ 'a', 'b', 'c', 'd' ] == list( dct )
+    mappings.append( { 'b': w( 0 ) } )
+    with pytest.raises( exceptions.EntryImmutability ):
+        factory.merge_all(
+            mappings, *posargs, allow_equal_duplicates = True )
+    assert { } == factory.merge_all( ( ), *posargs )
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -283,6 +344,21 @@ def test_170_and_intersects_mappings( module_qname, class_name ):
     else: assert d6 == { 'a': 1, 'c': 3 }
 
 
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_173_and_keeps_order_of_dictionary( module_qname ):
+    ''' Dictionary intersection follows order of dictionary. '''
+    module = cache_import_module( module_qname )
+    dct = module.Dictionary( a = 1, b = 2, c = 3, d = 4 )
+    assert [ 'a', 'c' ] == list( dct & { 'c': 3, 'a': 1 } )
+    assert [ 'a', 'c' ] == list(
+        dct & { 'c': 3, 'a': 1, 'x': 0, 'y': 0, 'z': 0 } )
+    assert [ 'a', 'c' ] == list( { 'c': 3, 'a': 1 } & dct )
+    assert [ 'a', 'd' ] == list( dct & { 'd', 'a', 'x' } )
+    assert [ ] == list( dct & { 'c': 0 } )
+    ordered = module.SortedDictionary( d = 4, c = 3, b = 2, a = 1 )
+    assert [ 'a', 'c' ] == list( ordered & { 'c': 3, 'a': 1 } )
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -302,7 +378,10 @@ def test_171_and_filters_by_keys( module_qname, class_name ):
     if class_name in PRODUCER_VALIDATOR_NAMES:
         assert d2 == { 'a': [ 1 ], 'b': [ 2 ] }
     else: assert d2 == { 'a': 1, 'b': 2 }
-    d3 = d1 & factory( *posargs, x = [ 0 ], a = [ 9 ], b = [ 8 ] ).keys( )
+    x, a, b = (
+        ( [ 0 ], [ 9 ], [ 8 ] ) if class_name in PRODUCER_VALIDATOR_NAMES
+        else ( 0, 9, 8 ) )
+    d3 = d1 & factory( *posargs, x = x, a = a, b = b ).keys( )
     assert isinstance( d3, factory )
     if class_name in PRODUCER_VALIDATOR_NAMES:
         assert d3 == { 'a': [ 1 ], 'b': [ 2 ] }
@@ -556,6 +635,28 @@ def test_216_update_with_pre_setitem_modification( module_qname, class_name ):
     assert dictionary[ 'test_key' ] == 11
 
 
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_217_update_columns_with_pre_setitem_modification(
+    module_qname, class_name
+):
+    ''' Columnar update respects _pre_setitem_ of subclasses. '''
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    posargs, nomargs = select_arguments( class_name )
+
+    class ModifiedDictionary( factory ):
+        def _pre_setitem_( self, key, value ):
+            return str( key ) if isinstance( key, int ) else key, value + 1
+
+    dictionary = ModifiedDictionary( *posargs, **nomargs )
+    dictionary.update_columns( ( 'test_key', 7 ), ( 10, 20 ) )
+    assert dictionary[ 'test_key' ] == 11
+    assert dictionary[ '7' ] == 21
+
+
 @pytest.mark.parametrize(
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
@@ -727,13 +828,643 @@ def test_260_subclasses_abc_dictionary( module_qname, class_name ):
     'module_qname, class_name',
     product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
 )
-def test_900_docstring_sanity( module_qname, class_name ):
-    ''' Class has valid docstring. '''
+def test_270_sealing( module_qname, class_name ):
+    ''' Sealed dictionary rejects accretion and is hashable. '''
     module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
     factory = getattr( module, class_name )
-    assert hasattr( factory, '__doc__' )
-    assert isinstance( factory.__doc__, str )
-    assert factory.__doc__
+    posargs, nomargs = select_arguments( class_name )
+    simple_posargs, simple_nomargs = select_simple_arguments( class_name )
+    dct = factory( *posargs, *simple_posargs, **nomargs, **simple_nomargs )
+    assert not dct.sealed
+    with pytest.raises( TypeError ):
+        hash( dct )
+    assert dct is dct.seal( )
+    assert dct is dct.seal( )
+    assert dct.sealed
+    value = dct[ 'foo' ]
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct[ 'baz' ] = value
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct.update( baz = value )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct.setdefault( 'baz', value )
+    assert 'baz' not in dct
+    if class_name in PRODUCER_NAMES:
+        with pytest.raises( KeyError ):
+            dct[ 'baz' ]
+        assert [ value, 0 ] == dct.get_many( ( 'foo', 'baz' ), default = 0 )
+        assert 'baz' not in dct
+    if class_name in PRODUCER_VALIDATOR_NAMES: return # Values are lists.
+    other = factory( *posargs, dct ).seal( )
+    assert hash( dct ) == hash( other )
+    assert len( { dct, other } ) == 1
+    assert not dct.copy( ).sealed
 
 
-# TODO: Dictionary description.
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_280_digest( module_qname, class_name ):
+    ''' Digest is maintained on accretion and shortcuts comparison. '''
+    if class_name in PRODUCER_VALIDATOR_NAMES: return # Values are lists.
+    module = cache_import_module( module_qname )
+    factory = getattr( module, class_name )
+    posargs, _ = select_arguments( class_name )
+    dct1 = factory( *posargs, a = 1, b = 2 )
+    dct2 = factory( *posargs, b = 2 )
+    digest = dct1.digest
+    assert digest == dct1.digest
+    assert digest != dct2.digest
+    dct2[ 'a' ] = 1
+    assert digest == dct2.digest
+    assert dct1 == dct2
+    dct1.update( c = 3, d = 4 )
+    dct2.update( d = 4 )
+    assert dct1 != dct2
+    dct2[ 'c' ] = 3
+    assert dct1.digest == dct2.digest
+    assert dct1 == dct2
+    assert dct1.digest == factory( *posargs, dict( dct1 ) ).digest
+    dct3 = factory( *posargs, dict( dct1 ) )
+    dct3[ 'e' ] = 5
+    dct4 = factory( *posargs, dict( dct1 ), e = 6 )
+    assert dct3.digest != dct4.digest
+    assert dct3 != dct4
+    assert not ( dct3 == dct4 ) # noqa: SIM201
+    if class_name in VALIDATOR_NAMES: return
+    with pytest.raises( TypeError ):
+        dct1[ 'unhashable' ] = [ ]
+    assert 'unhashable' not in dct1
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_281_digest_independent_of_hash_seed( module_qname ):
+    ''' Digests of primitive entries agree across hash seeds. '''
+    import os
+    import subprocess
+    import sys
+    module = cache_import_module( module_qname )
+    entries = dict(
+        apples = 12, bananas = ( b'6', 6.5, None ), cherries = 'red' )
+    script = (
+        f"import {module_qname} as module; "
+        f"print( module.Dictionary( {entries!r} ).digest )" )
+    digests = {
+        subprocess.run( # noqa: S603
+            ( sys.executable, '-c', script ),
+            capture_output = True, check = True, text = True,
+            env = { **os.environ, 'PYTHONHASHSEED': seed },
+        ).stdout.strip( )
+        for seed in ( '1', '2' ) }
+    assert { str( module.Dictionary( entries ).digest ) } == digests
+    assert module.Dictionary( a = 1 ).digest == (
+        module.Dictionary( a = 1.0 ).digest )
+
+
+@pytest.mark.parametrize(
+    'module_qname, class_name',
+    product( THESE_MODULE_QNAMES, THESE_CLASSES_NAMES )
+)
+def test_290_indexes( module_qname, class_name ):
+    ''' Secondary indexes are maintained on accretion. '''
+    if class_name in PRODUCER_VALIDATOR_NAMES: return # Values are lists.
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    factory = getattr( module, class_name )
+    posargs, _ = select_arguments( class_name )
+    dct = factory( *posargs, a = 1, b = 2 )
+    index = dct.add_index( 'parity', key = lambda v: v % 2 )
+    assert index is dct.index( 'parity' )
+    assert ( 'a', ) == index[ 1 ]
+    assert index[ 1 ] is index[ 1 ]
+    dct[ 'c' ] = 3
+    dct.update( d = 4, e = 5 )
+    assert ( 'a', 'c', 'e' ) == dct.index( 'parity' )[ 1 ]
+    assert ( 'b', 'd' ) == dct.index( 'parity' )[ 0 ]
+    assert { 0, 1 } == set( index )
+    assert 2 == len( index )
+    with pytest.raises( KeyError ):
+        index[ 2 ]
+    with pytest.raises( KeyError ):
+        dct.index( 'absent' )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct.add_index( 'parity', key = lambda v: v % 2 )
+    if class_name in PRODUCER_NAMES:
+        produced = factory( *posargs )
+        produced.add_index( 'type', key = type )
+        produced[ 'g' ]
+        assert ( 'g', ) == produced.index( 'type' )[ list ]
+    dct.add_index( 'magnitude', key = lambda v: [ v ] if v > 5 else v )
+    with pytest.raises( TypeError ):
+        dct[ 'f' ] = 6
+    assert 'f' not in dct
+    assert ( 'a', 'c', 'e' ) == index[ 1 ]
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_300_sorted_dictionary_order( module_qname ):
+    ''' Sorted dictionary keeps entries in order of keys. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.SortedDictionary( { 5: 'e', 1: 'a' }, ( ( 3, 'c' ), ) )
+    dct[ 7 ] = 'g'
+    dct[ 2 ] = 'b'
+    dct.update( { 9: 'i', 8: 'h' } )
+    dct.update( { 4: 'd', 6: 'f' } )
+    assert [ 1, 2, 3, 4, 5, 6, 7, 8, 9 ] == list( dct )
+    assert list( 'abcdefghi' ) == list( dct.values( ) )
+    assert ( 1, 'a' ) == next( iter( dct.items( ) ) )
+    assert 9 == len( dct )
+    assert 'e' == dct[ 5 ]
+    assert "{1: 'a', 2: 'b'" in repr( dct )
+    assert dct == dct.copy( )
+    assert [ 1, 2, 3 ] == list( dct.copy( ) )[ : 3 ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 5 ] = 'x'
+    with pytest.raises( TypeError ):
+        dct[ 'z' ] = 'incomparable'
+    with pytest.raises( TypeError ):
+        dct.update( { 0: 'x', 'z': 'incomparable' } )
+    assert 9 == len( dct )
+    assert 9 == len( list( dct ) )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_310_sorted_dictionary_ranges( module_qname ):
+    ''' Sorted dictionary answers range queries. '''
+    module = cache_import_module( module_qname )
+    dct = module.SortedDictionary( ( i, i * i ) for i in range( 0, 20, 2 ) )
+    assert 4 == dct.floor( 5 )
+    assert 4 == dct.floor( 4 )
+    assert 6 == dct.ceiling( 5 )
+    assert 6 == dct.ceiling( 6 )
+    with pytest.raises( KeyError ):
+        dct.floor( -1 )
+    with pytest.raises( KeyError ):
+        dct.ceiling( 19 )
+    assert [ 4, 6, 8 ] == list( dct.irange( 4, 8 ) )
+    assert [ 6 ] == list( dct.irange( 4, 8, inclusive = ( False, False ) ) )
+    assert [ 0, 2 ] == list( dct.irange( maximum = 3 ) )
+    assert [ 16, 18 ] == list( dct.irange( 15 ) )
+    assert [ ] == list( dct.irange( 9, 3 ) )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_320_sorted_dictionary_features( module_qname ):
+    ''' Sorted dictionary supports sealing, digests, and indexes. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.SortedDictionary( b = 2, a = 1 )
+    digest = dct.digest
+    dct.add_index( 'parity', key = lambda v: v % 2 )
+    dct[ 'c' ] = 3
+    assert ( 'a', 'c' ) == dct.index( 'parity' )[ 1 ]
+    assert digest != dct.digest
+    assert dct.digest == module.Dictionary( a = 1, b = 2, c = 3 ).digest
+    dct.seal( )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct[ 'd' ] = 4
+    assert [ 'a', 'b', 'c' ] == list( dct )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_330_trie_dictionary( module_qname ):
+    ''' Trie dictionary accretes and retrieves hierarchical keys. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.TrieDictionary(
+        '.', { 'service.http.port': 80 }, db = 'postgres' )
+    dct[ 'service.http' ] = 'enabled'
+    dct.update( { 'service.https.port': 443, 'service.http.timeout': 5 } )
+    assert 5 == len( dct )
+    assert 80 == dct[ 'service.http.port' ]
+    assert 'enabled' == dct[ 'service.http' ]
+    assert 'service' not in dct
+    assert 42 not in dct
+    with pytest.raises( KeyError ):
+        dct[ 'service' ]
+    with pytest.raises( KeyError ):
+        dct[ 'service.http.port.number' ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'service.http.port' ] = 8080
+    with pytest.raises( exceptions.EntryInvalidity ):
+        dct[ 42 ] = 'answer'
+    assert [
+        'service.http', 'service.http.port', 'service.http.timeout',
+        'service.https.port', 'db',
+    ] == list( dct )
+    assert dct == dct.copy( )
+    assert "'.', {'service.http': 'enabled'" in repr( dct )
+    merger = dct | { 'cache.ttl': 60 }
+    assert isinstance( merger, module.TrieDictionary )
+    assert 60 == merger[ 'cache.ttl' ]
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_340_trie_dictionary_prefixes( module_qname ):
+    ''' Trie dictionary enumerates prefixes and provides subtrees. '''
+    module = cache_import_module( module_qname )
+    dct = module.TrieDictionary(
+        '/', { 'a': 1, 'a/b': 2, 'a/b/c': 3, 'a/bc': 4, 'd': 5 } )
+    assert [ ( 'a/b', 2 ), ( 'a/b/c', 3 ) ] == list(
+        dct.items_with_prefix( 'a/b' ) )
+    assert [ ( 'a/b/c', 3 ) ] == list( dct.items_with_prefix( 'a/b/c' ) )
+    assert [ ] == list( dct.items_with_prefix( 'x/y' ) )
+    assert [ ] == list( dct.items_with_prefix( 'a/x' ) )
+    view = dct.subtree( 'a' )
+    assert { 'b': 2, 'b/c': 3, 'bc': 4 } == view
+    assert 3 == len( view )
+    assert 3 == view.subtree( 'b' )[ 'c' ]
+    dct[ 'a/e' ] = 6
+    assert 6 == view[ 'e' ]
+    assert "{'b': 2" in repr( view )
+    with pytest.raises( KeyError ):
+        view[ 'x' ]
+    with pytest.raises( KeyError ):
+        dct.subtree( 'x' )
+    with pytest.raises( KeyError ):
+        view.subtree( 'x' )
+    with pytest.raises( TypeError ):
+        view[ 'f' ] = 7 # pyright: ignore
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_350_positional_access( module_qname ):
+    ''' Dictionary provides entries and ranges by position. '''
+    module = cache_import_module( module_qname )
+    dct = module.Dictionary( a = 1, b = 2, c = 3 )
+    assert ( 'a', 1 ) == dct.item_at( 0 )
+    assert ( 'c', 3 ) == dct.item_at( -1 )
+    with pytest.raises( IndexError ):
+        dct.item_at( 3 )
+    dct[ 'd' ] = 4
+    dct.update( e = 5 )
+    assert ( 'e', 5 ) == dct.item_at( 4 )
+    view = dct.items_range( 1, -1 )
+    assert [ ( 'b', 2 ), ( 'c', 3 ), ( 'd', 4 ) ] == list( view )
+    assert 3 == len( view )
+    assert ( 'd', 4 ) == view[ -1 ]
+    assert [ ( 'c', 3 ) ] == list( view[ 1 : 2 ] )
+    assert range( 1, 4 ) == view.range
+    assert "( 1, 4, [('b', 2)" in repr( view )
+    dct[ 'f' ] = 6
+    assert 3 == len( view )
+    assert 2 == len( dct.items_range( 4 ) )
+    producer = module.ProducerDictionary( list )
+    producer[ 'x' ].append( 1 )
+    assert ( 'x', [ 1 ] ) == producer.item_at( 0 )
+    producer[ 'y' ].append( 2 )
+    assert ( 'y', [ 2 ] ) == producer.item_at( 1 )
+    ordered = module.SortedDictionary( c = 3, a = 1 )
+    assert ( 'a', 1 ) == ordered.item_at( 0 )
+    ordered[ 'b' ] = 2
+    assert [ ( 'b', 2 ), ( 'c', 3 ) ] == list( ordered.items_range( 1 ) )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_360_partition( module_qname ):
+    ''' Dictionary partitions entries into balanced views. '''
+    module = cache_import_module( module_qname )
+    dct = module.Dictionary( ( i, i * i ) for i in range( 10 ) )
+    parts = dct.partition( 3 )
+    assert [ 3, 3, 4 ] == [ len( part ) for part in parts ]
+    assert list( dct.items( ) ) == [
+        item for part in parts for item in part ]
+    part = pickle.loads( pickle.dumps( parts[ 2 ] ) ) # noqa: S301
+    assert ( ( 6, 36 ), ( 7, 49 ), ( 8, 64 ), ( 9, 81 ) ) == part
+    assert 4 == len( dct.partition( 4 ) )
+    assert [ 0, 0, 1 ] == [
+        len( part ) for part in module.Dictionary( a = 1 ).partition( 3 ) ]
+    assert ( ) == dct.partition( 0 )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_370_segmented_dictionary( module_qname ):
+    ''' Segmented dictionary splits segments as it grows. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.SegmentedDictionary( { 'a': 1 }, b = 2 )
+    assert 1 == dct.segments_count
+    dct.update( ( i, i * i ) for i in range( 5000 ) )
+    assert 5002 == len( dct )
+    assert dct.segments_count > 1
+    assert all( dct[ i ] == i * i for i in range( 5000 ) )
+    assert 2 == dct[ 'b' ]
+    assert 5000 not in dct
+    with pytest.raises( KeyError ):
+        dct[ 5000 ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'a' ] = 3
+    assert [ 'a', 'b', 0, 1 ] == list( dct )[ : 4 ]
+    assert dct == dct.copy( )
+    assert "{'a': 1, 'b': 2, 0: 0" in repr( dct )
+    merger = module.SegmentedDictionary( a = 1 ) | { 'c': 3 }
+    assert isinstance( merger, module.SegmentedDictionary )
+    assert { 'a': 1, 'c': 3 } == merger
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_380_segmented_dictionary_reserve( module_qname ):
+    ''' Segmented dictionary splits segments ahead of accretions. '''
+    module = cache_import_module( module_qname )
+    dct = module.SegmentedDictionary( )
+    dct.reserve( 10_000 )
+    count = dct.segments_count
+    dct.update( ( i, i ) for i in range( 10_000 ) )
+    assert count == dct.segments_count
+    assert all( dct[ i ] == i for i in range( 10_000 ) )
+    dct.reserve( 100 )
+    assert count == dct.segments_count
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_390_light_dictionary( module_qname ):
+    ''' Light dictionary is accretive subclass of dict. '''
+    module = cache_import_module( module_qname )
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.LightDictionary( { 'a': 1 }, b = 2 )
+    assert isinstance( dct, dict )
+    assert { 'a': 1, 'b': 2 } == dct
+    assert { 'c': 3 } == module.LightDictionary( { 'c': 3 } )
+    assert { 'c': 3 } == module.LightDictionary( c = 3 )
+    assert { 'c': 3 } == module.LightDictionary( [ ( 'c', 3 ) ] )
+    with pytest.raises( exceptions.EntryImmutability ):
+        module.LightDictionary( [ ( 'c', 3 ), ( 'c', 4 ) ] )
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct.__init__( a = 0 )
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct.__init__( { 'a': 0 } )
+    assert 1 == dct[ 'a' ]
+    dct[ 'c' ] = 3
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct[ 'a' ] = 0
+    with pytest.raises( exceptions.EntryImmutability ):
+        del dct[ 'a' ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct.update( d = 4, a = 0 )
+    assert 'd' not in dct
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct |= { 'a': 0 }
+    dct |= { 'd': 4 }
+    assert 1 == dct.setdefault( 'a', 0 )
+    assert 5 == dct.setdefault( 'e', 5 )
+    for name in ( 'clear', 'popitem' ):
+        with pytest.raises( exceptions.OperationInvalidity ):
+            getattr( dct, name )( )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct.pop( 'a' )
+    merger = dct | { 'f': 6 }
+    assert isinstance( merger, module.LightDictionary )
+    assert 6 == merger[ 'f' ]
+    assert isinstance( { 'g': 7 } | dct, module.LightDictionary )
+    with pytest.raises( exceptions.EntryImmutability ):
+        dct | { 'a': 0 } # pyright: ignore
+    assert dct == dct.copy( )
+    assert isinstance( dct.copy( ), module.LightDictionary )
+    assert dct == pickle.loads( pickle.dumps( dct ) ) # noqa: S301
+    assert repr( dct ).endswith( "LightDictionary( {'a': 1, 'b': 2, "
+        "'c': 3, 'd': 4, 'e': 5} )" )
+    with pytest.raises( AttributeError ):
+        dct.attribute = 42 # pyright: ignore
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_400_filtered_views( module_qname ):
+    ''' Filtered views judge each entry once and follow accretions. '''
+    module = cache_import_module( module_qname )
+    judged = [ ]
+
+    def is_even( key, value ):
+        judged.append( key )
+        return value % 2 == 0
+
+    dct = module.Dictionary( a = 1, b = 2, c = 3, d = 4 )
+    view = dct.filtered( is_even )
+    assert [ ] == judged
+    assert 2 == view[ 'b' ]
+    assert 'a' not in view
+    assert 'z' not in view
+    with pytest.raises( KeyError ):
+        view[ 'c' ]
+    with pytest.raises( KeyError ):
+        view[ 'z' ]
+    assert [ 'b', 'a', 'c' ] == judged
+    assert [ 'b', 'd' ] == list( view )
+    assert [ 'b', 'a', 'c', 'd' ] == judged
+    dct.update( e = 5, f = 6 )
+    assert 3 == len( view )
+    assert [ 'b', 'a', 'c', 'd', 'e', 'f' ] == judged
+    assert { 'b': 2, 'd': 4, 'f': 6 } == view
+    assert "( {'b': 2, 'd': 4, 'f': 6} )" in repr( view )
+    with pytest.raises( TypeError ):
+        view[ 'g' ] = 8 # pyright: ignore
+    restriction = dct.restricted( [ 'f', 'a', 'x', 'a' ] )
+    assert [ 'f', 'a' ] == list( restriction )
+    assert 2 == len( restriction )
+    assert 'x' not in restriction
+    assert 'b' not in restriction
+    with pytest.raises( KeyError ):
+        restriction[ 'b' ]
+    dct[ 'x' ] = 0
+    assert [ 'f', 'a', 'x' ] == list( restriction )
+    assert { 'a': 1, 'f': 6, 'x': 0 } == restriction
+    assert "( {'f': 6, 'a': 1, 'x': 0} )" in repr( restriction )
+    ordered = module.SortedDictionary( b = 2, a = 1 )
+    view = ordered.restricted( 'ba' )
+    ordered[ 'aa' ] = 0
+    assert [ 'b', 'a' ] == list( view )
+    producer = module.ProducerDictionary( list, a = [ ] )
+    view = producer.restricted( 'ab' )
+    assert [ 'a' ] == list( view )
+    assert 'b' not in producer
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_410_mapped_views( module_qname ):
+    ''' Mapped views compute each value once and follow accretions. '''
+    module = cache_import_module( module_qname )
+    mapped = [ ]
+
+    def square( value ):
+        mapped.append( value )
+        return value * value
+
+    dct = module.Dictionary( a = 1, b = 2 )
+    view = dct.mapped( square )
+    assert [ ] == mapped
+    assert 4 == view[ 'b' ]
+    assert 4 == view[ 'b' ]
+    assert [ 2 ] == mapped
+    dct[ 'c' ] = 3
+    assert { 'a': 1, 'b': 4, 'c': 9 } == view
+    assert [ 2, 1, 3 ] == mapped
+    assert 3 == len( view )
+    assert 'c' in view
+    assert 'z' not in view
+    with pytest.raises( KeyError ):
+        view[ 'z' ]
+    assert "( {'a': 1, 'b': 4, 'c': 9} )" in repr( view )
+    producer = module.ProducerDictionary( list )
+    view = producer.mapped( len )
+    with pytest.raises( KeyError ):
+        view[ 'x' ]
+    assert 0 == len( producer )
+
+
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_420_aggregates( module_qname ):
+    ''' Aggregates fold only entries accreted since last aggregation. '''
+    module = cache_import_module( module_qname )
+    folded = [ ]
+
+    def fold_keys( keys, key, value ):
+        folded.append( key )
+        return ( *keys, key )
+
+    exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+    dct = module.Dictionary( a = 3, b = 1 )
+    dct.add_aggregate( 'keys', fold_keys, ( ) )
+    assert ( 'a', 'b' ) == dct.aggregate( 'keys' )
+    assert ( 'a', 'b' ) == dct.aggregate( 'keys' )
+    dct.update( c = 4, d = 1 )
+    assert ( 'a', 'b', 'c', 'd' ) == dct.aggregate( 'keys' )
+    assert [ 'a', 'b', 'c', 'd' ] == folded
+    dct.add_aggregate( 'count', module.fold_count, 0 )
+    dct.add_aggregate( 'sum', module.fold_sum, 0 )
+    dct.add_aggregate( 'minimum', module.fold_minimum, None )
+    dct.add_aggregate( 'maximum', module.fold_maximum, None )
+    assert 4 == dct.aggregate( 'count' )
+    assert 9 == dct.aggregate( 'sum' )
+    assert 1 == dct.aggregate( 'minimum' )
+    assert 4 == dct.aggregate( 'maximum' )
+    groups = { }
+    dct.add_aggregate( 'parity', module.fold_groups(
+        lambda value: value % 2, module.fold_count, 0 ), groups )
+    assert { 1: 3, 0: 1 } == dct.aggregate( 'parity' )
+    dct[ 'e' ] = 0
+    assert { 1: 3, 0: 2 } == dct.aggregate( 'parity' )
+    assert { } == groups
+    assert 0 == dct.aggregate( 'minimum' )
+    assert 4 == dct.aggregate( 'maximum' )
+    assert 5 == dct.aggregate( 'count' )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct.add_aggregate( 'sum', module.fold_sum, 0 )
+    with pytest.raises( KeyError ):
+        dct.aggregate( 'absent' )
+    with pytest.raises( KeyError ):
+        module.Dictionary( ).aggregate( 'sum' )
+    empty = module.Dictionary( )
+    empty.add_aggregate( 'sum', module.fold_sum, 0 )
+    assert 0 == empty.aggregate( 'sum' )
+    ordered = module.SortedDictionary( b = 2, a = 1 )
+    ordered.add_aggregate( 'keys', fold_keys, ( ) )
+    assert ( 'b', 'a' ) == ordered.aggregate( 'keys' )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_970_aggregate_refresh( module_qname ):
+    ''' Refresh of aggregate costs time proportional to new entries. '''
+    from time import perf_counter
+    module = cache_import_module( module_qname )
+    dct = module.Dictionary( ( i, i ) for i in range( 1_000_000 ) )
+    dct.add_aggregate( 'sum', module.fold_sum, 0 )
+    start = perf_counter( )
+    dct.aggregate( 'sum' )
+    first = perf_counter( ) - start
+    dct.update( ( i, i ) for i in range( 1_000_000, 1_001_000 ) )
+    start = perf_counter( )
+    total = dct.aggregate( 'sum' )
+    refresh = perf_counter( ) - start
+    start = perf_counter( )
+    assert total == sum( dct.values( ) )
+    rescan = perf_counter( ) - start
+    print(
+        f"\nfirst aggregation {first * 1e3:,.1f} ms; "
+        f"refresh after 1,000 accretions {refresh * 1e3:,.2f} ms; "
+        f"rescan {rescan * 1e3:,.1f} ms" )
+    assert refresh < rescan
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_980_overlay_lookups( module_qname ):
+    ''' Overlay lookups cost same regardless of number of layers. '''
+    from collections import ChainMap
+    from timeit import timeit
+    module = cache_import_module( module_qname )
+    layers = [
+        module.Dictionary( ( f"key{j}.{i}", i ) for i in range( 1_000 ) )
+        for j in range( 8 ) ]
+    key = 'key7.500'
+    overlay = module.OverlayDictionary( *layers )
+    chain = ChainMap( *layers )
+    count = 100_000
+    overlay_time = timeit( lambda: overlay[ key ], number = count )
+    chain_time = timeit( lambda: chain[ key ], number = count )
+    print(
+        f"\n8 layers, key in last: overlay {count / overlay_time:,.0f}/s; "
+        f"ChainMap {count / chain_time:,.0f}/s" )
+    assert overlay_time < chain_time
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_990_batch_lookups_throughput( module_qname ):
+    ''' Batch lookups outpace per-key lookups through dictionary. '''
+    from timeit import timeit
+    module = cache_import_module( module_qname )
+    dct = module.Dictionary( ( f"key{i}", i ) for i in range( 100_000 ) )
+    keys = [ f"key{i}" for i in range( 0, 200_000, 2 ) ]
+    count = 20
+    batch_time = timeit( lambda: dct.get_many( keys ), number = count )
+    loop_time = timeit(
+        lambda: [ dct.get( key ) for key in keys ], number = count )
+    print(
+        f"\n100k keys, half absent: get_many {batch_time / count * 1e3:.2f} "
+        f"ms; comprehension {loop_time / count * 1e3:.2f} ms" )
+    assert batch_time < loop_time
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_995_columns_ingest_throughput( module_qname ):
+    ''' Columnar ingest outpaces construction from zipped pairs. '''
+    from timeit import timeit
+    module = cache_import_module( module_qname )
+    keys = [ f"key{i}" for i in range( 1_000_000 ) ]
+    values = list( range( 1_000_000 ) )
+    count = 3
+    columns_time = timeit(
+        lambda: module.Dictionary.from_columns( keys, values ),
+        number = count )
+    zipped_time = timeit(
+        lambda: module.Dictionary( zip( keys, values ) ), number = count )
+    print(
+        f"\n1M entries: from_columns {columns_time / count * 1e3:.0f} ms; "
+        f"zipped pairs {zipped_time / count * 1e3:.0f} ms" )
+    assert columns_time < zipped_time
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'module_qname', THESE_MODULE_QNAMES )
+def test_996_validated_copy( module_qname ):
+    ''' Copies with same validator skip validation. '''
+    from timeit import timeit
+    module = cache_import_module( module_qname )
+
+    def validator( key, value ): return isinstance( value, int )
+
+    entries = { f"key{i}": i for i in range( 100_000 ) }
+    dct = module.ValidatorDictionary( validator, entries )
+    count = 10
+    copy_time = timeit( dct.copy, number = count )
+    validated_time = timeit(
+        lambda: module.ValidatorDictionary( validator, entries ),
+        number = count )
+    print(
+        f"\n100k entries: copy {copy_time / count * 1e3:.2f} ms; "
+        f"validated construction {validated_time / count * 1e3:.2f} ms" )
+    assert copy_time * 2 < validated_time
@@ -0,0 +1,220 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of journals. '''
+
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.journals"
+
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+def test_100_journal_replay( tmp_path ):
+    ''' Journal replays appended entries in order. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        journal.append( ( ( 'a', 1 ), ( 'b', 2 ) ) )
+        journal.append( ( ( 'c', 3 ), ) )
+        journal.flush( )
+        assert [ ( 'a', 1 ), ( 'b', 2 ), ( 'c', 3 ) ] == list(
+            journal.replay( ) )
+    with module.Journal( location ) as journal:
+        assert [ 'a', 'b', 'c' ] == [ key for key, _ in journal.replay( ) ]
+
+
+def test_110_journal_batched_synchronization( tmp_path ):
+    ''' Journal commits records without time-based synchronization. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal(
+        location, fsync_batch = 0, fsync_interval = None
+    ) as journal:
+        for i in range( 100 ): journal.append( ( ( i, i * i ), ) )
+        journal.flush( )
+        assert 100 == len( list( journal.replay( ) ) )
+
+
+def test_120_journal_discards_torn_records( tmp_path ):
+    ''' Journal discards incomplete trailing record on open. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        journal.append( ( ( 'a', 1 ), ) )
+    extent = location.stat( ).st_size
+    with location.open( 'ab' ) as stream: stream.write( b'\x40\x00\x00' )
+    with module.Journal( location ) as journal:
+        assert extent == location.stat( ).st_size
+        journal.append( ( ( 'b', 2 ), ) )
+        assert [ ( 'a', 1 ), ( 'b', 2 ) ] == list( journal.replay( ) )
+
+
+def test_130_journal_rejects_operations_after_close( tmp_path ):
+    ''' Closed journal rejects appends. '''
+    journal = module.Journal( tmp_path / 'registry.journal' )
+    journal.close( )
+    journal.close( )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        journal.append( ( ( 'a', 1 ), ) )
+
+
+def test_140_journal_compaction( tmp_path ):
+    ''' Journal compacts into snapshot which replay includes. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        journal.append( ( ( 'a', 1 ), ( 'b', 2 ) ) )
+        journal.compact( ( ( 'a', 1 ), ( 'b', 2 ) ) )
+        assert 0 == location.stat( ).st_size
+        journal.append( ( ( 'c', 3 ), ) )
+        assert [ ( 'a', 1 ), ( 'b', 2 ), ( 'c', 3 ) ] == list(
+            journal.replay( ) )
+    assert ( tmp_path / 'registry.journal.snapshot' ).exists( )
+
+
+def test_141_journal_compaction_holds_appends( tmp_path ):
+    ''' Appends during compaction wait and survive it. '''
+    import threading
+    import time
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        journal.append( ( ( 'a', 1 ), ) )
+        appender = threading.Thread(
+            target = journal.append, args = ( ( ( 'z', 26 ), ), ) )
+
+        def produce_entries( ):
+            yield 'a', 1
+            appender.start( )
+            time.sleep( 0.05 )
+            assert appender.is_alive( )
+            with pytest.raises( exceptions.OperationInvalidity ):
+                journal.append( ( ( 'y', 25 ), ) )
+            yield 'b', 2
+
+        journal.compact( produce_entries( ) )
+        appender.join( )
+        assert [ ( 'a', 1 ), ( 'b', 2 ), ( 'z', 26 ) ] == list(
+            journal.replay( ) )
+
+
+def test_150_journal_close_raises_failure( tmp_path, monkeypatch ):
+    ''' Closing failed journal closes file and raises failure. '''
+    import os
+
+    def fail( descriptor ): raise OSError( 'storage failure' )
+
+    journal = module.Journal( tmp_path / 'registry.journal' )
+    monkeypatch.setattr( os, 'fsync', fail )
+    journal.append( ( ( 'a', 1 ), ) )
+    with pytest.raises( OSError, match = 'storage failure' ):
+        journal.flush( )
+    with pytest.raises( OSError, match = 'storage failure' ):
+        journal.close( )
+    assert journal._stream_.closed
+
+
+def test_160_journal_committed_at_exit( tmp_path ):
+    ''' Journal left open is committed at interpreter exit. '''
+    import subprocess
+    import sys
+    location = tmp_path / 'registry.journal'
+    script = (
+        f"import {MODULE_QNAME} as module; "
+        f"journal = module.Journal( {str( location )!r}, "
+        "fsync_batch = 0, fsync_interval = None ); "
+        "journal.append( ( ( 'a', 1 ), ) )" )
+    subprocess.run( ( sys.executable, '-c', script ), check = True ) # noqa: S603
+    with module.Journal( location ) as journal:
+        assert [ ( 'a', 1 ) ] == list( journal.replay( ) )
+
+
+def test_200_dictionary_restoration( tmp_path ):
+    ''' Journaled dictionary restores accretions from journal. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal, ( ( 'a', 1 ), ), b = 2 )
+        dct[ 'c' ] = 3
+        dct.update( d = 4, e = 5 )
+        dct.setdefault( 'f', 6 )
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal )
+        assert dict( a = 1, b = 2, c = 3, d = 4, e = 5, f = 6 ) == dct
+        assert [ 'a', 'b', 'c', 'd', 'e', 'f' ] == list( dct )
+        with pytest.raises( exceptions.EntryImmutability ):
+            dct[ 'a' ] = 42
+
+
+def test_210_dictionary_snapshot( tmp_path ):
+    ''' Journaled dictionary folds journal into snapshot. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal, a = 1, b = 2 )
+        dct.snapshot( )
+        dct[ 'c' ] = 3
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal )
+        assert dict( a = 1, b = 2, c = 3 ) == dct
+
+
+def test_211_dictionary_interrupted_snapshot( tmp_path ):
+    ''' Journaled dictionary tolerates entries in snapshot and journal. '''
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        journal.append( ( ( 'a', 1 ), ( 'b', 2 ) ) )
+    snapshot = tmp_path / 'registry.journal.snapshot'
+    snapshot.write_bytes( location.read_bytes( ) )
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal )
+        assert dict( a = 1, b = 2 ) == dct
+
+
+def test_212_dictionary_rejects_unpicklable_entries( tmp_path ):
+    ''' Unpicklable entries are neither stored nor journaled. '''
+    import pickle
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal, a = 1 )
+        with pytest.raises( ( pickle.PicklingError, AttributeError ) ):
+            dct[ 'f' ] = lambda: 0
+        assert 'f' not in dct
+        with pytest.raises( ( pickle.PicklingError, AttributeError ) ):
+            dct.update( g = 2, h = lambda: 0 )
+        assert 'g' not in dct
+        dct[ 'f' ] = 3
+    with module.Journal( location ) as journal:
+        assert dict( a = 1, f = 3 ) == module.JournaledDictionary( journal )
+
+
+def test_220_dictionary_derivatives_unjournaled( tmp_path ):
+    ''' Copies and derivatives of journaled dictionary are not journaled. '''
+    dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+    location = tmp_path / 'registry.journal'
+    with module.Journal( location ) as journal:
+        dct = module.JournaledDictionary( journal, a = 1 )
+        copy = dct.copy( )
+        union = dct | { 'b': 2 }
+        assert type( copy ) is dictionaries.Dictionary
+        assert type( union ) is dictionaries.Dictionary
+        copy[ 'c' ] = 3
+        assert [ ( 'a', 1 ) ] == list( journal.replay( ) )
+        assert str( journal ) in repr( dct )
+        assert location == dct.journal.location
@@ -0,0 +1,192 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of replicas. '''
+
+
+import multiprocessing
+import os
+
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.replicas"
+
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+def test_100_replication_through_pipe( ):
+    ''' Replica receives existing and new entries in batches. '''
+    primary_end, replica_end = multiprocessing.Pipe( )
+    registry = dictionaries.Dictionary( a = 1, b = 2 )
+    primary = module.Primary( registry, batch_size = 2 )
+    replica = module.Replica( replica_end )
+    primary.attach( primary_end )
+    assert 1 == primary.replicas_count
+    assert 2 == replica.synchronize( timeout = 5 )
+    registry.update( c = 3, d = 4, e = 5 )
+    assert 0 == replica.synchronize( )
+    primary.publish( )
+    assert 3 == replica.synchronize( timeout = 5 )
+    assert registry == replica.dictionary
+    assert list( registry ) == list( replica.dictionary )
+    assert 5 == replica.sequence
+
+
+def test_110_replica_catches_up_on_reconnection( ):
+    ''' Reconnected replica receives only entries which it lacks. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    primary = module.Primary( registry )
+    primary_end, replica_end = multiprocessing.Pipe( )
+    replica = module.Replica( replica_end )
+    primary.attach( primary_end )
+    replica.synchronize( timeout = 5 )
+    primary.detach( primary_end )
+    primary_end.close( )
+    registry.update( b = 2, c = 3 )
+    primary_end, replica_end = multiprocessing.Pipe( )
+    replica.reconnect( replica_end )
+    primary.attach( primary_end )
+    assert 2 == replica.synchronize( timeout = 5 )
+    assert dict( a = 1, b = 2, c = 3 ) == replica.dictionary
+
+
+def test_120_replica_with_validation( ):
+    ''' Replica applies entries through update of its dictionary. '''
+    registry = dictionaries.Dictionary( a = 1, b = 'two' )
+    primary = module.Primary( registry )
+    primary_end, replica_end = multiprocessing.Pipe( )
+    replica = module.Replica(
+        replica_end, dictionaries.ValidatorDictionary(
+            lambda k, v: isinstance( v, int ) ) )
+    primary.attach( primary_end )
+    with pytest.raises( exceptions.EntryInvalidity ):
+        replica.synchronize( timeout = 5 )
+    assert 0 == len( replica.dictionary )
+
+
+def test_130_replica_rejects_sequence_gap( ):
+    ''' Replica rejects entries past its sequence. '''
+    primary_end, replica_end = multiprocessing.Pipe( )
+    replica = module.Replica( replica_end )
+    primary_end.recv( )
+    primary_end.send( ( 'entries', 3, ( ( 'd', 4 ), ) ) )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        replica.synchronize( timeout = 5 )
+
+
+def test_140_primary_detaches_broken_replica( ):
+    ''' Primary detaches replicas with broken connections. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    primary = module.Primary( registry )
+    primary_end, replica_end = multiprocessing.Pipe( )
+    module.Replica( replica_end )
+    primary.attach( primary_end )
+    replica_end.close( )
+    registry[ 'b' ] = 2
+    primary.publish( )
+    assert 0 == primary.replicas_count
+    primary_end, replica_end = multiprocessing.Pipe( )
+    replica_end.send( ( 'bogus', None ) )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        primary.attach( primary_end )
+
+
+def test_145_primary_skips_congested_replica( ):
+    ''' Primary skips replicas which are not ready to receive. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    primary = module.Primary( registry )
+    slow_end, slow_replica_end = multiprocessing.Pipe( )
+    module.Replica( slow_replica_end )
+    primary.attach( slow_end )
+    fast_end, fast_replica_end = multiprocessing.Pipe( )
+    fast_replica = module.Replica( fast_replica_end )
+    primary.attach( fast_end )
+    assert 1 == fast_replica.synchronize( timeout = 5 )
+    # Fill buffer of slow connection, as if its replica stopped reading.
+    os.set_blocking( slow_end.fileno( ), False )
+    try:
+        while True: os.write( slow_end.fileno( ), bytes( 65536 ) )
+    except BlockingIOError: pass
+    os.set_blocking( slow_end.fileno( ), True )
+    registry[ 'b' ] = 2
+    primary.publish( )
+    assert 1 == fast_replica.synchronize( timeout = 5 )
+    assert registry == fast_replica.dictionary
+    assert 2 == primary.replicas_count
+    assert 1 == primary._sequences_[ slow_end ]
+
+
+def test_150_replication_of_sorted_dictionary( ):
+    ''' Replicas of sorted dictionaries receive entries in accretion order. '''
+    primary_end, replica_end = multiprocessing.Pipe( )
+    registry = dictionaries.SortedDictionary( b = 2 )
+    primary = module.Primary( registry )
+    replica = module.Replica( replica_end )
+    primary.attach( primary_end )
+    assert 1 == replica.synchronize( timeout = 5 )
+    registry[ 'a' ] = 1
+    registry[ 'c' ] = 3
+    primary.publish( )
+    assert 2 == replica.synchronize( timeout = 5 )
+    assert registry == replica.dictionary
+
+
+def test_160_primary_rejects_unordered_dictionary( ):
+    ''' Primary rejects dictionaries without order of accretion. '''
+    with pytest.raises( exceptions.OperationInvalidity ):
+        module.Primary( dictionaries.TrieDictionary( '.', a = 1 ) )
+
+
+def test_200_replication_to_child_process( tmp_path ):
+    ''' Replica in child process receives entries over Unix socket. '''
+    context = multiprocessing.get_context( 'spawn' )
+    address = str( tmp_path / 'primary.socket' )
+    registry = dictionaries.Dictionary( ( i, i * i ) for i in range( 100 ) )
+    primary = module.Primary( registry, batch_size = 16 )
+    results_receiver, results_sender = context.Pipe( duplex = False )
+    with Listener( address, family = 'AF_UNIX' ) as listener:
+        process = context.Process(
+            target = _replicate_in_child,
+            args = ( address, results_sender, 150 ) )
+        process.start( )
+        with listener.accept( ) as connection:
+            primary.attach( connection )
+            registry.update( ( i, i * i ) for i in range( 100, 150 ) )
+            primary.publish( )
+            assert results_receiver.poll( 60 )
+            assert registry == results_receiver.recv( )
+        process.join( 60 )
+    assert 0 == process.exitcode
+
+
+def _replicate_in_child( address, results, expectation ):
+    ''' Replicates in child process until expected size is reached. '''
+    with Client( address, family = 'AF_UNIX' ) as connection:
+        replica = module.Replica( connection )
+        while len( replica.dictionary ) < expectation:
+            replica.synchronize( timeout = 5 )
+        results.send( dict( replica.dictionary ) )
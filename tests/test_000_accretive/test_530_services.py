@@ -0,0 +1,174 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of query services. '''
+
+
+import time
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.services"
+
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+def test_100_lookups( ):
+    ''' Remote dictionary retrieves entries singly and in batches. '''
+    registry = dictionaries.Dictionary( a = 1, b = 2, c = 3 )
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect( server.address ) as remote,
+    ):
+        assert 1 == remote[ 'a' ]
+        assert 'b' in remote
+        assert 'z' not in remote
+        with pytest.raises( KeyError ):
+            remote[ 'z' ]
+        assert [ 3, 2, -1 ] == remote.get_many( ( 'c', 'b', 'z' ), -1 )
+        assert 3 == len( remote )
+        assert 2 == remote.get( 'b' )
+
+
+def test_110_absences_cached_temporarily( ):
+    ''' Remote dictionary caches absences only until expiration. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect(
+            server.address, misses_ttl = 0.05 ) as remote,
+    ):
+        assert 'b' not in remote
+        registry[ 'b' ] = 2
+        assert 'b' not in remote
+        time.sleep( 0.1 )
+        assert 2 == remote[ 'b' ]
+
+
+def test_120_entries_since_sequence( tmp_path ):
+    ''' Remote dictionary retrieves entries added since sequence number. '''
+    registry = dictionaries.Dictionary( a = 1, b = 2 )
+    address = str( tmp_path / 'registry.socket' )
+    with (
+        module.Server( registry, address, authkey = b'secret' ),
+        module.RemoteDictionary.connect(
+            address, authkey = b'secret' ) as remote,
+    ):
+        assert [ 'a', 'b' ] == list( remote )
+        registry.update( c = 3, d = 4 )
+        assert ( ( 'c', 3 ), ( 'd', 4 ) ) == remote.entries_since( 2 )
+        assert 2 == remote.synchronize( )
+        assert 0 == remote.synchronize( )
+        assert registry == dict( remote.items( ) )
+
+
+def test_121_entries_of_sorted_dictionary( ):
+    ''' Entries since sequence follow accretion order of sorted dictionary. '''
+    registry = dictionaries.SortedDictionary( b = 2 )
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect( server.address ) as remote,
+    ):
+        assert [ 'b' ] == list( remote )
+        registry.update( a = 1, c = 3 )
+        assert ( ( 'a', 1 ), ( 'c', 3 ) ) == remote.entries_since( 1 )
+        assert 2 == remote.synchronize( )
+        assert registry == dict( remote.items( ) )
+
+
+def test_125_server_survives_wrong_authkey( ):
+    ''' Server keeps accepting clients after failed authentication. '''
+    from multiprocessing import AuthenticationError
+    registry = dictionaries.Dictionary( a = 1 )
+    with module.Server(
+        registry, ( 'localhost', 0 ), authkey = b'secret'
+    ) as server:
+        with pytest.raises( AuthenticationError ):
+            module.RemoteDictionary.connect(
+                server.address, authkey = b'wrong' )
+        with module.RemoteDictionary.connect(
+            server.address, authkey = b'secret'
+        ) as remote: assert 1 == remote[ 'a' ]
+
+
+def test_130_server_rejects_unknown_request( ):
+    ''' Server reports unknown requests as errors. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect( server.address ) as remote,
+    ):
+        with pytest.raises( exceptions.OperationInvalidity ):
+            remote._request_( 'bogus' )
+        assert 1 == remote[ 'a' ]
+
+
+def test_131_server_survives_failed_requests( ):
+    ''' Server reports failed and malformed requests as errors. '''
+    registry = dictionaries.Dictionary( a = 1 )
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect( server.address ) as remote,
+    ):
+        with pytest.raises( exceptions.OperationInvalidity ):
+            remote._request_( 'get_many', ( [ 'unhashable' ], ) )
+        with pytest.raises( exceptions.OperationInvalidity ):
+            remote._request_( )
+        with pytest.raises( exceptions.OperationInvalidity ):
+            remote._request_( 'entries', 0, 1 )
+        with pytest.raises( exceptions.OperationInvalidity ):
+            remote.entries_since( -1 )
+        assert ( ) == remote.entries_since( 5 )
+        assert 1 == remote[ 'a' ]
+    server.close( )
+
+
+@pytest.mark.slow
+def test_900_hot_lookups_throughput( ):
+    ''' Cached remote lookups of hot keys approach local speed. '''
+    registry = dictionaries.Dictionary(
+        ( f"key{i}", i ) for i in range( 10_000 ) )
+    keys = tuple( f"key{i}" for i in range( 0, 10_000, 10 ) )
+    rounds = 200
+    with (
+        module.Server( registry, ( 'localhost', 0 ) ) as server,
+        module.RemoteDictionary.connect( server.address ) as remote,
+    ):
+        start = time.perf_counter( )
+        remote.get_many( keys )
+        cold = time.perf_counter( ) - start
+        start = time.perf_counter( )
+        for _ in range( rounds ):
+            for key in keys: remote[ key ]
+        remote_rate = rounds * len( keys ) / ( time.perf_counter( ) - start )
+    start = time.perf_counter( )
+    for _ in range( rounds ):
+        for key in keys: registry[ key ]
+    local_rate = rounds * len( keys ) / ( time.perf_counter( ) - start )
+    print(
+        f"\ncold batch: {cold * 1e3:.2f} ms for {len( keys )} keys; "
+        f"hot lookups: remote {remote_rate:,.0f}/s, "
+        f"local {local_rate:,.0f}/s" )
+    assert remote_rate > local_rate / 2
@@ -0,0 +1,205 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+
+''' Assert correct function of shared memory dictionaries. '''
+
+
+import mmap
+import multiprocessing
+import pickle
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.shared"
+
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+@pytest.fixture
+def writer( ):
+    ''' Provides writable shared dictionary. Destroys it afterwards. '''
+    dictionary = module.SharedDictionary( 1 << 16, { 'a': 1 }, b = 2 )
+    yield dictionary
+    dictionary.close( )
+    dictionary.unlink( )
+
+
+def test_100_lookups( writer ):
+    ''' Writer accretes and looks up entries. '''
+    assert writer.writable
+    writer[ 'c' ] = [ 3 ]
+    writer.update( ( ( ( 'd', 4 ), 'tuple key' ), ), e = None )
+    assert 1 == writer[ 'a' ]
+    assert [ 3 ] == writer[ 'c' ]
+    assert 'tuple key' == writer[ ( 'd', 4 ) ]
+    assert writer[ 'e' ] is None
+    assert 'z' not in writer
+    with pytest.raises( KeyError ):
+        writer[ 'z' ]
+    assert [ 'a', 'b', 'c', ( 'd', 4 ), 'e' ] == list( writer )
+    assert 5 == len( writer )
+    assert writer.name in repr( writer )
+
+
+def test_110_entries_immutable( writer ):
+    ''' Existing entries cannot be altered or removed. '''
+    with pytest.raises( exceptions.EntryImmutability ):
+        writer[ 'a' ] = 2
+    with pytest.raises( exceptions.EntryImmutability ):
+        writer.update( c = 3, a = 4 )
+    assert 'c' not in writer
+    with pytest.raises( exceptions.EntryImmutability ):
+        del writer[ 'a' ]
+
+
+def test_111_equal_tuple_keys( writer ):
+    ''' Distinct but equal tuple keys are same key. '''
+    name = ''.join( ( 'na', 'me' ) )
+    writer[ ( name, name ) ] = 1
+    assert 1 == writer[ ( 'name', ''.join( ( 'na', 'me' ) ) ) ]
+    with pytest.raises( exceptions.EntryImmutability ):
+        writer[ ( 'name', 'name' ) ] = 2
+
+
+def test_120_reader_sees_accretions( writer ):
+    ''' Attached reader sees new entries. Reader cannot accrete. '''
+    with module.SharedDictionary.attach( writer.name ) as reader:
+        assert not reader.writable
+        assert dict( a = 1, b = 2 ) == dict( reader )
+        writer.update( ( f"k{i}", i ) for i in range( 100 ) )
+        assert 102 == len( reader )
+        assert 99 == reader[ 'k99' ]
+        with pytest.raises( exceptions.OperationInvalidity ):
+            reader[ 'z' ] = 0
+        with pytest.raises( exceptions.OperationInvalidity ):
+            reader.unlink( )
+        assert 'z' not in writer
+
+
+def test_130_capacity_exhaustion( ):
+    ''' Accretions past capacity are rejected whole. '''
+    with module.SharedDictionary( 256 ) as dictionary:
+        try:
+            with pytest.raises( exceptions.OperationInvalidity ):
+                dictionary.update( ( i, 'x' * 16 ) for i in range( 100 ) )
+            assert 0 == len( dictionary )
+            dictionary[ 0 ] = 'x'
+            assert 1 == len( dictionary )
+        finally: dictionary.unlink( )
+
+
+def test_140_attach_rejects_foreign_memory( ):
+    ''' Shared memory without dictionary cannot be attached. '''
+    from multiprocessing.shared_memory import SharedMemory
+    memory = SharedMemory( create = True, size = 64 )
+    try:
+        with pytest.raises( exceptions.OperationInvalidity ):
+            module.SharedDictionary.attach( memory.name )
+    finally:
+        memory.close( )
+        memory.unlink( )
+
+
+def test_150_pickles_as_reader( writer ):
+    ''' Pickled dictionary is restored as attached reader. '''
+    reader = pickle.loads( pickle.dumps( writer ) ) # noqa: S301
+    try:
+        assert not reader.writable
+        assert writer == reader
+    finally: reader.close( )
+
+
+def test_200_readers_in_child_processes( writer ):
+    ''' Readers in child processes look up entries from writer. '''
+    writer.update( ( i, i * i ) for i in range( 1000 ) )
+    context = multiprocessing.get_context( 'spawn' )
+    with context.Pool( 2 ) as pool:
+        sums = pool.starmap(
+            _sum_squares, ( ( writer, range( 0, 500 ) ),
+                            ( writer, range( 500, 1000 ) ) ) )
+    assert sum( i * i for i in range( 1000 ) ) == sum( sums )
+    with module.SharedDictionary.attach( writer.name ) as reader:
+        assert 1002 == len( reader )
+
+
+def _sum_squares( dictionary, keys ):
+    ''' Sums values for keys in child process. '''
+    try: return sum( dictionary[ key ] for key in keys )
+    finally: dictionary.close( )
+
+
+def test_300_export_to_buffer( ):
+    ''' Exported dictionary is read from buffer. '''
+    registry = dictionaries.Dictionary(
+        { ( 'x', 1 ): ( 1.5, None ), b'raw': True }, name = 'registry' )
+    exported = module.export_dictionary( registry )
+    assert isinstance( exported, bytes )
+    with module.BufferDictionary( exported ) as buffered:
+        assert not buffered.writable
+        assert registry == buffered
+        assert list( registry ) == list( buffered )
+        assert ( 1.5, None ) == buffered[ ( 'x', 1 ) ]
+        assert 'z' not in buffered
+        with pytest.raises( exceptions.OperationInvalidity ):
+            buffered[ 'z' ] = 1
+        assert repr( dict( registry ) ) in repr( buffered )
+    assert module.BufferDictionary( module.export_dictionary( { } ) ) == { }
+
+
+def test_301_export_equal_tuple_keys( ):
+    ''' Buffer dictionary finds distinct but equal tuple keys. '''
+    name = ''.join( ( 'na', 'me' ) )
+    exported = module.export_dictionary( { ( name, name ): 1 } )
+    with module.BufferDictionary( exported ) as buffered:
+        assert 1 == buffered[ ( 'name', 'name' ) ]
+        assert ( name, ''.join( ( 'na', 'me' ) ) ) in buffered
+
+
+def test_310_export_rejects_foreign_types( ):
+    ''' Only primitive keys and values are exported. '''
+    with pytest.raises( exceptions.EntryInvalidity ):
+        module.export_dictionary( { 'a': [ 1 ] } )
+    with pytest.raises( exceptions.EntryInvalidity ):
+        module.export_dictionary( { ( 'a', object( ) ): 1 } )
+
+
+def test_320_buffer_from_memory_map( tmp_path ):
+    ''' Buffer dictionary reads memory-mapped file without copying. '''
+    path = tmp_path / 'registry.bin'
+    entries = { f"k{i}": i for i in range( 1000 ) }
+    path.write_bytes( module.export_dictionary( entries ) )
+    with path.open( 'rb' ) as file:
+        mapping = mmap.mmap( file.fileno( ), 0, access = mmap.ACCESS_READ )
+    buffered = module.BufferDictionary( mapping )
+    assert 999 == buffered[ 'k999' ]
+    assert entries == buffered
+    restored = pickle.loads( pickle.dumps( buffered ) ) # noqa: S301
+    assert entries == restored
+    buffered.close( )
+    mapping.close( )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        module.BufferDictionary( b'not a dictionary' )
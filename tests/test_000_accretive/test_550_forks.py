@@ -0,0 +1,127 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+
+''' Assert correct function of fork preparation. '''
+
+
+import gc
+import os
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.forks"
+
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+fork_unavailable = not hasattr( os, 'fork' )
+proc_unavailable = not os.path.exists( '/proc/self/smaps_rollup' )
+
+
+@pytest.fixture
+def gc_restoration( ):
+    ''' Restores garbage collection after test. '''
+    yield
+    gc.unfreeze( )
+    gc.enable( )
+
+
+def test_100_prepare_and_seal( gc_restoration ):
+    ''' Collection is disabled and surviving objects are frozen. '''
+    module.prepare_for_fork( )
+    module.prepare_for_fork( )
+    assert not gc.isenabled( )
+    registry = dictionaries.Dictionary( ( i, ( i, ) ) for i in range( 100 ) )
+    frozen = module.seal_for_fork( )
+    assert frozen == gc.get_freeze_count( )
+    assert frozen >= len( registry )
+
+
+@pytest.mark.skipif( fork_unavailable, reason = 'Requires fork.' )
+def test_110_collection_resumes_in_child( gc_restoration ):
+    ''' Forked child resumes garbage collection. Parent does not. '''
+    module.prepare_for_fork( )
+    module.seal_for_fork( )
+    receiver, sender = os.pipe( )
+    pid = os.fork( )
+    if 0 == pid: # pragma: no cover
+        os.write( sender, b'1' if gc.isenabled( ) else b'0' )
+        os._exit( 0 )
+    os.close( sender )
+    assert b'1' == os.read( receiver, 1 )
+    os.close( receiver )
+    os.waitpid( pid, 0 )
+    assert not gc.isenabled( )
+
+
+@pytest.mark.skipif( proc_unavailable, reason = 'Requires smaps_rollup.' )
+def test_200_report_memory( ):
+    ''' Memory of current process is reported. '''
+    report = module.report_memory( )
+    assert report.resident > 0
+    assert report.private > 0
+    assert report.resident >= report.private
+    assert module.report_memory( os.getpid( ) ).resident > 0
+    with pytest.raises( exceptions.OperationInvalidity ):
+        module.report_memory( -1 )
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    fork_unavailable or proc_unavailable,
+    reason = 'Requires fork and smaps_rollup.' )
+def test_900_child_private_memory( gc_restoration ):
+    ''' Children of sealed parent copy less of registry. '''
+    baseline = _measure_child( seal = False )
+    sealed = _measure_child( seal = True )
+    print(
+        f"\nchild private memory: baseline {baseline / 2**20:.1f} MiB, "
+        f"sealed {sealed / 2**20:.1f} MiB" )
+    assert sealed < baseline
+
+
+def _measure_child( seal, requests = 10_000 ):
+    ''' Returns private memory of child after serving requests. '''
+    if seal: module.prepare_for_fork( )
+    registry = dictionaries.Dictionary(
+        ( f"key{i}", ( i, [ i ] ) ) for i in range( 300_000 ) )
+    if seal: module.seal_for_fork( )
+    receiver, sender = os.pipe( )
+    pid = os.fork( )
+    if 0 == pid: # pragma: no cover
+        for i in range( requests ):
+            registry[ f"key{i % 300_000}" ]
+        gc.collect( )
+        private = module.report_memory( ).private
+        os.write( sender, private.to_bytes( 8, 'little' ) )
+        os._exit( 0 )
+    os.close( sender )
+    private = int.from_bytes( os.read( receiver, 8 ), 'little' )
+    os.close( receiver )
+    os.waitpid( pid, 0 )
+    gc.unfreeze( )
+    gc.enable( )
+    return private
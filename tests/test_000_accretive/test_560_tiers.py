@@ -0,0 +1,134 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+
+''' Assert correct function of tiered dictionaries. '''
+
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.tiers"
+
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+def test_100_demotion_and_promotion( tmp_path ):
+    ''' Least recently used entries are demoted and promoted on access. '''
+    location = tmp_path / 'cold'
+    with module.Tiering( location, capacity = 2 ) as tiering:
+        dct = module.TieredDictionary( tiering, a = [ 1 ], b = [ 2 ] )
+        dct[ 'c' ] = [ 3 ]
+        statistics = dct.statistics
+        assert ( 2, 1 ) == ( statistics.hot_entries, statistics.cold_entries )
+        assert 1 == statistics.spills
+        assert [ 1 ] == dct[ 'a' ]
+        assert [ 3 ] == dct[ 'c' ]
+        assert [ 'a', 'b', 'c' ] == list( dct )
+        assert 3 == len( dct )
+        assert 'b' in dct
+        assert 'z' not in dct
+        with pytest.raises( KeyError ):
+            dct[ 'z' ]
+        with pytest.raises( exceptions.EntryImmutability ):
+            dct[ 'b' ] = [ 0 ]
+        with pytest.raises( exceptions.EntryImmutability ):
+            del dct[ 'a' ]
+        assert { 'a': [ 1 ], 'b': [ 2 ], 'c': [ 3 ] } == dict( dct.items( ) )
+        statistics = dct.statistics
+        # Mutable values are written on each demotion.
+        assert 4 == statistics.spills == statistics.demotions
+        assert statistics.spilled_bytes > 0
+        assert 0 < statistics.hit_ratio < 1
+        assert location.exists( )
+        assert "TieredDictionary( accretive.tiers.Tiering( " in repr( dct )
+    assert not location.exists( )
+    tiering.close( )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        dct[ 'a' ]
+
+
+def test_110_frequency_eviction( tmp_path ):
+    ''' Least frequently used entries are demoted in batches. '''
+    with module.Tiering(
+        tmp_path / 'cold', capacity = 16, eviction = 'frequency',
+        compression = 1,
+    ) as tiering:
+        assert 'frequency' == tiering.eviction
+        dct = module.TieredDictionary( tiering )
+        dct[ 'popular' ] = 0
+        for _ in range( 10 ): dct[ 'popular' ]
+        dct.update( ( i, i ) for i in range( 100 ) )
+        assert 'popular' in dct._hot_
+        assert all( dct[ i ] == i for i in range( 100 ) )
+        statistics = dct.statistics
+        assert statistics.hot_entries <= 16
+        assert 101 == statistics.hot_entries + statistics.cold_entries
+        assert 0 == module.TieringStatistics(
+            hits = 0, misses = 0, demotions = 0, spills = 0,
+            spilled_bytes = 0, hot_entries = 0, cold_entries = 0,
+        ).hit_ratio
+
+
+def test_111_unpicklable_values_rejected( tmp_path ):
+    ''' Values which cannot be demoted are rejected, not lost. '''
+    import pickle
+    with module.Tiering( tmp_path / 'cold', capacity = 1 ) as tiering:
+        dct = module.TieredDictionary( tiering, a = 1 )
+        with pytest.raises( ( pickle.PicklingError, AttributeError ) ):
+            dct[ 'b' ] = lambda: 2
+        assert 'b' not in dct
+        dct[ 'c' ] = 3
+        assert { 'a': 1, 'c': 3 } == dict( dct.items( ) )
+
+
+def test_112_mutations_survive_demotion( tmp_path ):
+    ''' Changes to mutable values in memory are kept on demotion. '''
+    with module.Tiering( tmp_path / 'cold', capacity = 1 ) as tiering:
+        dct = module.TieredDictionary( tiering, a = [ ], b = ( 1, 'b' ) )
+        dct[ 'a' ].append( 1 )
+        dct[ 'b' ]
+        assert [ 1 ] == dct[ 'a' ]
+        dct[ 'a' ].append( 2 )
+        assert ( 1, 'b' ) == dct[ 'b' ]
+        assert [ 1, 2 ] == dct[ 'a' ]
+        statistics = dct.statistics
+        assert 4 == statistics.spills
+        assert statistics.demotions > statistics.spills
+
+
+def test_120_bounded_memory( tmp_path ):
+    ''' Memory holds at most capacity entries as dictionary grows. '''
+    with module.Tiering( tmp_path / 'cold', capacity = 100 ) as tiering:
+        dct = module.TieredDictionary(
+            tiering, ( ( i, str( i ) * 10 ) for i in range( 10_000 ) ) )
+        statistics = dct.statistics
+        assert 100 == statistics.hot_entries
+        assert 9_900 == statistics.cold_entries
+        assert '4242424242424242424242424242424242424242' == dct[ 4242 ]
+        assert 9_901 == dct.statistics.spills
+        # Entry on disk is demoted again without another spill.
+        dct.update( ( i, str( i ) ) for i in range( 10_000, 10_100 ) )
+        statistics = dct.statistics
+        assert 10_000 == statistics.spills
+        assert 10_001 == statistics.demotions
@@ -0,0 +1,191 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert correct function of validators. '''
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Annotated, Any, Literal, TypeVar, Union
+
+import pytest
+
+from .__ import PACKAGE_NAME, cache_import_module
+
+
+MODULE_QNAME = f"{PACKAGE_NAME}.validators"
+
+dictionaries = cache_import_module( f"{PACKAGE_NAME}.dictionaries" )
+exceptions = cache_import_module( f"{PACKAGE_NAME}.exceptions" )
+module = cache_import_module( MODULE_QNAME )
+
+
+def validate_integer( key, value ):
+    ''' Accepts integer values. Picklable, for process pools. '''
+    return isinstance( value, int )
+
+
+def validate_laboriously( key, value ):
+    ''' Accepts integer values, after CPU-bound work. '''
+    sum( range( 20_000 ) )
+    return isinstance( value, int )
+
+
+def test_100_parallel_validation( ):
+    ''' Parallel validator validates batches in chunks across threads. '''
+    with ThreadPoolExecutor( 4 ) as executor:
+        validator = module.ParallelValidator(
+            validate_integer, executor, chunk_size = 10 )
+        dct = dictionaries.ValidatorDictionary(
+            validator, ( ( f"key{i}", i ) for i in range( 95 ) ) )
+        assert 95 == len( dct )
+        dct[ 'single' ] = 1
+        with pytest.raises( exceptions.EntryInvalidity ):
+            dct[ 'invalid' ] = 'one'
+        assert validate_integer is validator.validator
+        assert 'ParallelValidator( ' in repr( validator )
+
+
+def test_110_invalidities_collected( ):
+    ''' Every invalid entry is reported and no entry is accreted. '''
+    with ThreadPoolExecutor( 4 ) as executor:
+        validator = module.ParallelValidator(
+            validate_integer, executor, chunk_size = 10 )
+        dct = dictionaries.ProducerValidatorDictionary( lambda: 0, validator )
+        entries = { f"key{i}": i for i in range( 50 ) }
+        entries.update( bad3 = '3', bad47 = '47' )
+        with pytest.raises( exceptions.EntriesInvalidity ) as exc_info:
+            dct.update( entries )
+        assert (
+            ( ( 'bad3', '3' ), ( 'bad47', '47' ) )
+            == exc_info.value.entries )
+        assert 0 == len( dct )
+        with pytest.raises( exceptions.EntryInvalidity ):
+            dct.update_columns( [ 'a', 'b' ], [ 1, 'two' ] )
+        assert 0 == len( dct )
+
+
+def test_120_process_pool( ):
+    ''' Parallel validator distributes chunks to processes. '''
+    with ProcessPoolExecutor( 2 ) as executor:
+        validator = module.ParallelValidator(
+            validate_integer, executor, chunk_size = 25 )
+        dct = dictionaries.ValidatorDictionary( validator )
+        dct.update( ( f"key{i}", i ) for i in range( 100 ) )
+        assert 100 == len( dct )
+
+
+def test_130_chunk_size_validation( ):
+    ''' Chunk size must be positive. '''
+    with pytest.raises( exceptions.OperationInvalidity ):
+        module.ParallelValidator( validate_integer, None, chunk_size = 0 )
+
+
+def test_140_type_validator( ):
+    ''' Type validator checks classes, unions, literals, and predicates. '''
+    validator = module.TypeValidator( str, int | None )
+    assert validator( 'a', 1 )
+    assert validator( 'a', None )
+    assert not validator( 'a', 'one' )
+    assert not validator( 1, 1 )
+    assert [ True, False ] == validator.validate_many(
+        ( ( 'a', 1 ), ( 'b', 2.0 ) ) )
+    assert [ True, True ] == validator.validate_many(
+        ( ( 'a', 1 ), ( 'b', None ) ) )
+    assert [ ] == validator.validate_many( ( ) )
+    assert str is validator.key_type
+    assert 'TypeValidator( ' in repr( validator )
+    validator = module.TypeValidator(
+        Literal[ 'a', 'b' ], Annotated[ int, 'positive', lambda n: n > 0 ] )
+    assert validator( 'a', 1 )
+    assert not validator( 'c', 1 )
+    assert not validator( 'a', 0 )
+    assert not validator( [ ], 1 )
+    assert [ True, False ] == validator.validate_many(
+        ( ( 'b', 2 ), ( 'b', -2 ) ) )
+    validator = module.TypeValidator(
+        Any, Union[ Literal[ 1 ], Annotated[ str, 'name' ] ] )
+    assert validator( object( ), 1 )
+    assert not validator( object( ), True )
+    assert validator( object( ), 'name' )
+    validator = module.TypeValidator( object, list[ int ] )
+    assert validator( 1, [ 'a' ] )
+    assert not validator( 1, ( 1, ) )
+    with pytest.raises( exceptions.OperationInvalidity ):
+        module.TypeValidator( TypeVar( 'T' ), int )
+
+
+def test_150_typed_dictionaries( ):
+    ''' Typed dictionaries report type errors as invalid entries. '''
+    dct = dictionaries.ValidatorDictionary.for_types( str, int, a = 1 )
+    assert isinstance( dct, dictionaries.ValidatorDictionary )
+    dct[ 'b' ] = 2
+    dct.update( c = 3, d = True )
+    with pytest.raises( exceptions.EntryInvalidity ):
+        dct[ 5 ] = 5
+    with pytest.raises( exceptions.EntryInvalidity ):
+        dct.update( e = 5, f = 'six' )
+    assert 'e' not in dct
+    with pytest.raises( exceptions.EntryInvalidity ):
+        dictionaries.ValidatorDictionary.for_types( str, str, a = 1 )
+    assert dct == dct.copy( )
+
+@pytest.mark.slow
+def test_900_parallel_speedup( ):
+    ''' Validation-bound ingest speeds up with number of processes. '''
+    from os import cpu_count
+    from time import perf_counter
+    workers = min( cpu_count( ) or 1, 4 )
+    if workers < 2: pytest.skip( 'Needs at least two processors.' )
+    entries = { f"key{i}": i for i in range( 4_000 ) }
+    start = perf_counter( )
+    dictionaries.ValidatorDictionary( validate_laboriously, entries )
+    serial_time = perf_counter( ) - start
+    with ProcessPoolExecutor( workers ) as executor:
+        validator = module.ParallelValidator(
+            validate_laboriously, executor, chunk_size = 250 )
+        # Warm pool, so that startup of workers is not measured.
+        dictionaries.ValidatorDictionary( validator, entries )
+        start = perf_counter( )
+        dictionaries.ValidatorDictionary( validator, entries )
+        parallel_time = perf_counter( ) - start
+    print(
+        f"\n4k laborious entries: serial {serial_time * 1e3:.0f} ms; "
+        f"{workers} processes {parallel_time * 1e3:.0f} ms" )
+    assert parallel_time < serial_time * 0.8
+
+
+@pytest.mark.slow
+def test_910_typed_ingest_throughput( ):
+    ''' Type validators check batches faster than per-entry lambdas. '''
+    from timeit import timeit
+    entries = { f"key{i}": i for i in range( 100_000 ) }
+    factory = dictionaries.ValidatorDictionary
+    count = 10
+    typed_time = timeit(
+        lambda: factory.for_types( str, int, entries ), number = count )
+    lambda_time = timeit(
+        lambda: factory(
+            lambda k, v: isinstance( k, str ) and isinstance( v, int ),
+            entries ),
+        number = count )
+    print(
+        f"\n100k entries: for_types {typed_time / count * 1e3:.2f} ms; "
+        f"lambda {lambda_time / count * 1e3:.2f} ms" )
+    assert typed_time < lambda_time